@@ -6,6 +6,11 @@ class SusuGroupModel {
   final List<String> memberIds;
   final List<String> memberNames;
   final List<GroupInviteModel> invites;
+  final int memberCount;
+  final int pendingInviteCount;
+  final int seatsRemaining;
+  final bool? isMember;
+  final bool hasMemberDetails;
   final int targetMemberCount;
   final double contributionAmount;
   final int cycleNumber;
@@ -29,6 +34,11 @@ class SusuGroupModel {
     required this.memberIds,
     required this.memberNames,
     required this.invites,
+    int? memberCount,
+    int? pendingInviteCount,
+    int? seatsRemaining,
+    this.isMember,
+    this.hasMemberDetails = true,
     required this.targetMemberCount,
     required this.contributionAmount,
     required this.cycleNumber,
@@ -45,7 +55,19 @@ class SusuGroupModel {
     this.requiresApproval = false,
     required this.createdAt,
     required this.updatedAt,
-  });
+  })  : memberCount = memberCount ?? memberNames.length,
+        pendingInviteCount = pendingInviteCount ??
+            invites
+                .where((invite) => invite.status == GroupInviteStatus.pending)
+                .length,
+        seatsRemaining = seatsRemaining ??
+            (targetMemberCount - (memberCount ?? memberNames.length))
+                .clamp(0, targetMemberCount);
+
+  /// Whether [userId] belongs to the group, using the server's flag when the
+  /// compact list did not include member ids.
+  bool includesMember(String? userId) =>
+      isMember ?? (userId != null && memberIds.contains(userId));
 
   Map<String, dynamic> toJson() => {
     'id': id,
@@ -53,6 +75,11 @@ class SusuGroupModel {
     'memberIds': memberIds,
     'memberNames': memberNames,
     'invites': invites.map((invite) => invite.toJson()).toList(),
+    'memberCount': memberCount,
+    'pendingInviteCount': pendingInviteCount,
+    'seatsRemaining': seatsRemaining,
+    'isMember': isMember,
+    'hasMemberDetails': hasMemberDetails,
     'targetMemberCount': targetMemberCount,
     'contributionAmount': contributionAmount,
     'cycleNumber': cycleNumber,
@@ -85,8 +112,15 @@ class SusuGroupModel {
           .whereType<Map>()
           .map((item) => GroupInviteModel.fromJson(item.cast<String, dynamic>()))
           .toList(),
-      targetMemberCount:
-          json['targetMemberCount'] as int? ?? memberNamesRaw.length,
+      memberCount: json['memberCount'] as int?,
+      pendingInviteCount: json['pendingInviteCount'] as int?,
+      seatsRemaining: json['seatsRemaining'] as int?,
+      isMember: json['isMember'] as bool?,
+      // The compact list leaves out member ids and names unless expanded.
+      hasMemberDetails: json['hasMemberDetails'] as bool? ??
+          json.containsKey('memberNames'),
+      targetMemberCount: json['targetMemberCount'] as int? ??
+          (json['memberCount'] as int? ?? memberNamesRaw.length),
       contributionAmount: _parseDouble(json['contributionAmount']),
       cycleNumber: json['cycleNumber'] as int? ?? 0,
       totalCycles: json['totalCycles'] as int? ?? 0,
@@ -110,6 +144,20 @@ class SusuGroupModel {
   factory SusuGroupModel.fromApi(Map<String, dynamic> json) =>
       SusuGroupModel.fromJson(json);
 
+  /// Builds a model from a `/api/groups/discover/` entry, which carries only
+  /// what is needed to pick a public group to join.
+  factory SusuGroupModel.fromDiscovery(Map<String, dynamic> json) {
+    final now = DateTime.now().toIso8601String();
+    return SusuGroupModel.fromJson({
+      'payoutOrder': '',
+      'createdAt': now,
+      'updatedAt': now,
+      ...json,
+      'isPublic': true,
+      'hasMemberDetails': false,
+    });
+  }
+
   static double _parseDouble(dynamic value) {
     if (value is num) {
       return value.toDouble();
@@ -126,6 +174,11 @@ class SusuGroupModel {
     List<String>? memberIds,
     List<String>? memberNames,
     List<GroupInviteModel>? invites,
+    int? memberCount,
+    int? pendingInviteCount,
+    int? seatsRemaining,
+    bool? isMember,
+    bool? hasMemberDetails,
     int? targetMemberCount,
     double? contributionAmount,
     int? cycleNumber,
@@ -148,6 +201,15 @@ class SusuGroupModel {
     memberIds: memberIds ?? this.memberIds,
     memberNames: memberNames ?? this.memberNames,
     invites: invites ?? this.invites,
+    memberCount: memberCount ?? (memberNames != null ? null : this.memberCount),
+    pendingInviteCount:
+        pendingInviteCount ?? (invites != null ? null : this.pendingInviteCount),
+    seatsRemaining: seatsRemaining ??
+        (memberNames != null || targetMemberCount != null
+            ? null
+            : this.seatsRemaining),
+    isMember: isMember ?? this.isMember,
+    hasMemberDetails: hasMemberDetails ?? this.hasMemberDetails,
     targetMemberCount: targetMemberCount ?? this.targetMemberCount,
     contributionAmount: contributionAmount ?? this.contributionAmount,
     cycleNumber: cycleNumber ?? this.cycleNumber,
@@ -69,14 +69,14 @@ class _GroupJoinWizardScreenState extends State<GroupJoinWizardScreen> {
 
   Future<void> _loadGroups() async {
     final user = await _userService.getCurrentUser();
-    final groups = await _groupService.getGroups();
+    final groups = await _groupService.discoverGroups();
 
     final filtered = groups
         .where(
           (group) =>
               group.isPublic &&
-              (user == null || !group.memberIds.contains(user.id)) &&
-              group.memberNames.length < group.targetMemberCount,
+              !group.includesMember(user?.id) &&
+              group.seatsRemaining > 0,
         )
         .toList()
       ..sort(
@@ -144,7 +144,7 @@ class _GroupJoinWizardScreenState extends State<GroupJoinWizardScreen> {
       );
 
       final now = DateTime.now();
-      final seatNumber = updatedGroup.memberNames.length;
+      final seatNumber = updatedGroup.memberCount;
       final reminderCopy = _remindersEnabled ? 'Smart reminders on.' : 'Reminders off.';
       final autoSaveCopy = _autoSave ? 'Auto-contributions enabled.' : 'Auto-contributions off.';
 
@@ -176,10 +176,7 @@ class _GroupJoinWizardScreenState extends State<GroupJoinWizardScreen> {
     }
   }
 
-  int _availableSeats(SusuGroupModel group) {
-    final seats = group.targetMemberCount - group.memberNames.length;
-    return seats < 0 ? 0 : seats;
-  }
+  int _availableSeats(SusuGroupModel group) => group.seatsRemaining;
 
   String _formatCurrency(num value) => 'GH₵ ${_currencyFormatter.format(value)}';
 
@@ -371,7 +368,7 @@ class _GroupJoinWizardScreenState extends State<GroupJoinWizardScreen> {
     }
 
     final theme = Theme.of(context);
-    final seatPosition = group.memberNames.length + 1;
+    final seatPosition = group.memberCount + 1;
 
     return Column(
       crossAxisAlignment: CrossAxisAlignment.start,
@@ -458,7 +455,7 @@ class _GroupJoinWizardScreenState extends State<GroupJoinWizardScreen> {
     }
 
     final theme = Theme.of(context);
-    final seatPosition = group.memberNames.length + 1;
+    final seatPosition = group.memberCount + 1;
     final intro = _introductionController.text.trim();
 
     return Column(
@@ -1,6 +1,5 @@
 import 'package:flutter/material.dart';
 import 'package:intl/intl.dart';
-import 'package:sankofasave/models/group_invite_model.dart';
 import 'package:sankofasave/models/susu_group_model.dart';
 import 'package:sankofasave/models/user_model.dart';
 import 'package:sankofasave/screens/group_creation_wizard_screen.dart';
@@ -383,7 +382,7 @@ class _GroupsScreenState extends State<GroupsScreen> {
     final payoutDate = DateFormat('MMM dd').format(group.nextPayoutDate);
     final progress = group.cycleNumber / group.totalCycles;
     final userId = _currentUser?.id;
-    final isMember = userId != null && group.memberIds.contains(userId);
+    final isMember = group.includesMember(userId);
     final seatsOpen = _availableSeats(group);
     final status = progress < 0.34
         ? 'Newly started'
@@ -539,7 +538,7 @@ class _GroupsScreenState extends State<GroupsScreen> {
             ),
             const SizedBox(height: 16),
             _buildMemberRow(group),
-            if (group.invites.isNotEmpty) ...[
+            if (group.pendingInviteCount > 0) ...[
               const SizedBox(height: 12),
               _buildInviteIndicators(group),
             ],
@@ -554,18 +553,10 @@ class _GroupsScreenState extends State<GroupsScreen> {
   }
 
   String _buildMemberSummary(SusuGroupModel group) {
-    final active = group.memberNames.length;
-    final ready = group.invites
-        .where((invite) => invite.status == GroupInviteStatus.accepted)
-        .length;
-    final pending = group.invites
-        .where((invite) => invite.status == GroupInviteStatus.pending)
-        .length;
+    final active = group.memberCount;
+    final pending = group.pendingInviteCount;
 
     final parts = <String>['$active active'];
-    if (ready > 0) {
-      parts.add('$ready ready to join');
-    }
     if (pending > 0) {
       parts.add('$pending pending');
     }
@@ -579,8 +570,7 @@ class _GroupsScreenState extends State<GroupsScreen> {
   }
 
   int _availableSeats(SusuGroupModel group) {
-    final seats = group.targetMemberCount - group.memberNames.length;
-    return seats < 0 ? 0 : seats;
+    return group.seatsRemaining;
   }
 
   Widget _buildDetailChip(IconData icon, String label, Color color) {
@@ -674,7 +664,7 @@ class _GroupsScreenState extends State<GroupsScreen> {
   }
 
   Widget _buildMemberRow(SusuGroupModel group) {
-    final memberCount = group.memberNames.length;
+    final memberCount = group.memberCount;
     final showExtra = memberCount > 3;
     final displayCount = showExtra ? 3 : memberCount;
 
@@ -683,13 +673,19 @@ class _GroupsScreenState extends State<GroupsScreen> {
       child: Row(
         children: [
           ...List.generate(displayCount, (index) {
-            final memberName = group.memberNames[index];
-            final asset = UserAvatarResolver.resolve(memberName);
+            // Compact list entries carry a member count, not names.
+            final memberName = index < group.memberNames.length
+                ? group.memberNames[index]
+                : '';
             return Padding(
               padding: EdgeInsets.only(right: index == displayCount - 1 ? 0 : 12),
               child: UserAvatar(
-                initials: memberName.substring(0, 1).toUpperCase(),
-                imagePath: asset,
+                initials: memberName.isEmpty
+                    ? ''
+                    : memberName.substring(0, 1).toUpperCase(),
+                imagePath: memberName.isEmpty
+                    ? null
+                    : UserAvatarResolver.resolve(memberName),
                 size: 40,
               ),
             );
@@ -717,19 +713,10 @@ class _GroupsScreenState extends State<GroupsScreen> {
 
   Widget _buildInviteIndicators(SusuGroupModel group) {
     final theme = Theme.of(context);
-    final pendingCount = group.invites
-        .where((invite) => invite.status == GroupInviteStatus.pending)
-        .length;
-    final kycPending = group.invites
-        .where((invite) =>
-            invite.status != GroupInviteStatus.declined && !invite.kycCompleted)
-        .length;
-    final accepted = group.invites
-        .where((invite) => invite.status == GroupInviteStatus.accepted)
-        .length;
-    final blockers = (group.targetMemberCount -
-            (group.memberNames.length + accepted))
-        .clamp(0, group.targetMemberCount);
+    // The list carries counters only; per-invite KYC progress is shown on
+    // the group detail screen.
+    final pendingCount = group.pendingInviteCount;
+    final blockers = group.seatsRemaining;
 
     final chips = <Widget>[];
     if (pendingCount > 0) {
@@ -743,17 +730,6 @@ class _GroupsScreenState extends State<GroupsScreen> {
         ),
       );
     }
-    if (kycPending > 0) {
-      chips.add(
-        _GroupInsightChip(
-          icon: Icons.verified_outlined,
-          label:
-              '$kycPending KYC ${kycPending == 1 ? 'check' : 'checks'} outstanding',
-          foreground: theme.colorScheme.primary,
-          background: theme.colorScheme.primary.withValues(alpha: 0.12),
-        ),
-      );
-    }
     chips.add(
       _GroupInsightChip(
         icon: blockers > 0 ? Icons.warning_rounded : Icons.rocket_launch,
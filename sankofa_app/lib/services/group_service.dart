@@ -16,11 +16,30 @@ class GroupService {
 
   static const String _draftKey = 'susu_group_draft';
 
+  /// Group fields read from the detail endpoint; member and invite rows come
+  /// from the paginated sub-resources instead.
+  static const String _detailFields =
+      'id,name,memberCount,pendingInviteCount,seatsRemaining,isMember,'
+      'version,ownerId,ownerName,ownedByPlatform,targetMemberCount,'
+      'contributionAmount,cycleNumber,totalCycles,nextPayoutDate,payoutOrder,'
+      'isPublic,description,frequency,location,requiresApproval,createdAt,'
+      'updatedAt';
+
+  /// Largest page the `members/` and `invites/` sub-resources serve.
+  static const int _pageSize = 200;
+
   List<SusuGroupModel>? _cachedGroups;
 
+  /// Loads the groups the caller belongs to or owns from the compact list
+  /// endpoint.
+  ///
+  /// The list carries counters (`memberCount`, `pendingInviteCount`,
+  /// `seatsRemaining`, `isMember`) rather than member and invite rows;
+  /// [getGroupById] loads those when a group is opened.
   Future<List<SusuGroupModel>> getGroups({bool forceRefresh = false}) async {
-    if (!forceRefresh && _cachedGroups != null) {
-      return _cachedGroups!;
+    final cached = _cachedGroups;
+    if (!forceRefresh && cached != null) {
+      return cached;
     }
 
     try {
@@ -41,20 +60,49 @@ class GroupService {
     return _cachedGroups!;
   }
 
+  /// Loads public groups from the cached discovery snapshot.
+  ///
+  /// The group list only holds groups the caller belongs to or owns, so the
+  /// join flow browses public circles here.
+  Future<List<SusuGroupModel>> discoverGroups({bool hasSeats = true}) async {
+    try {
+      final response = await _apiClient.get(
+        '/api/groups/discover/?page_size=200${hasSeats ? '&has_seats=true' : ''}',
+      );
+      final results = response is Map ? response['results'] : null;
+      if (results is List) {
+        return results
+            .whereType<Map>()
+            .map((item) => SusuGroupModel.fromDiscovery(item.cast<String, dynamic>()))
+            .toList();
+      }
+    } catch (_) {
+      // Swallow errors so the join flow can show its empty state
+    }
+    return const [];
+  }
+
   Future<SusuGroupModel?> getGroupById(String id) async {
+    SusuGroupModel? cachedGroup;
     final cachedList = _cachedGroups;
     if (cachedList != null) {
       try {
-        return cachedList.firstWhere((group) => group.id == id);
+        cachedGroup = cachedList.firstWhere((group) => group.id == id);
       } catch (_) {
         // not found in cache
       }
     }
+    if (cachedGroup != null && cachedGroup.hasMemberDetails) {
+      return cachedGroup;
+    }
 
     try {
-      final response = await _apiClient.get('/api/groups/$id/');
+      final response = await _apiClient.get(
+        '/api/groups/$id/',
+        queryParameters: {'fields': _detailFields},
+      );
       if (response is Map<String, dynamic>) {
-        final group = SusuGroupModel.fromApi(response);
+        final group = await _withMemberDetails(SusuGroupModel.fromApi(response));
         _upsertCachedGroup(group);
         return group;
       }
@@ -62,7 +110,46 @@ class GroupService {
       // swallow errors so the UI can continue showing local data
     }
 
-    return null;
+    return cachedGroup;
+  }
+
+  /// Fills in member and invite rows from the paginated `members/` and
+  /// `invites/` sub-resources.
+  Future<SusuGroupModel> _withMemberDetails(SusuGroupModel group) async {
+    final members = await _getAllPages('/api/groups/${group.id}/members/');
+    final invites = await _getAllPages('/api/groups/${group.id}/invites/');
+    return group.copyWith(
+      memberIds: members.map((member) => member['id'].toString()).toList(),
+      memberNames: members.map((member) => member['name'].toString()).toList(),
+      invites: invites.map(GroupInviteModel.fromJson).toList(),
+      // Keep the server's counters rather than recounting the loaded rows.
+      memberCount: group.memberCount,
+      pendingInviteCount: group.pendingInviteCount,
+      seatsRemaining: group.seatsRemaining,
+      hasMemberDetails: true,
+    );
+  }
+
+  Future<List<Map<String, dynamic>>> _getAllPages(String path) async {
+    final rows = <Map<String, dynamic>>[];
+    for (var page = 1;; page++) {
+      final response = await _apiClient.get(
+        path,
+        queryParameters: {'page': '$page', 'page_size': '$_pageSize'},
+      );
+      if (response is! Map) {
+        throw ApiException('Unexpected response from server.');
+      }
+      final results = response['results'];
+      if (results is List) {
+        rows.addAll(
+          results.whereType<Map>().map((item) => item.cast<String, dynamic>()),
+        );
+      }
+      if (response['next'] == null) {
+        return rows;
+      }
+    }
   }
 
   Future<void> updateGroup(SusuGroupModel updatedGroup) async {
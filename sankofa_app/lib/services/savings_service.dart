@@ -127,8 +127,10 @@ class SavingsService {
   Future<List<SavingsContributionModel>> getContributions(String goalId) async {
     try {
       final response = await _apiClient.get('/api/savings/goals/$goalId/contributions/');
-      if (response is List) {
-        return response
+      // The endpoint is cursor-paginated; the first page holds the latest entries.
+      final rawList = response is Map ? response['results'] : response;
+      if (rawList is List) {
+        return rawList
             .whereType<Map>()
             .map((item) => SavingsContributionModel.fromApi(item.cast<String, dynamic>()))
             .toList();
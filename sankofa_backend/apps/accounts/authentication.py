@@ -0,0 +1,105 @@
+"""JWT authentication backed by a short-lived user snapshot cache."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+USER_CACHE_PREFIX = "accounts:user"
+
+# Never keep password hashes in the shared cache; the field stays deferred and
+# is only loaded if something like ``check_password`` actually needs it.
+_UNCACHED_FIELDS = frozenset({"password"})
+
+
+def user_cache_key(user_id: Any) -> str:
+    return f"{USER_CACHE_PREFIX}:{user_id}"
+
+
+def _cache_ttl() -> int:
+    return int(getattr(settings, "AUTH_USER_CACHE_TTL_SECONDS", 60))
+
+
+def _cached_attnames() -> list[str]:
+    User = get_user_model()
+    return [field.attname for field in User._meta.concrete_fields if field.attname not in _UNCACHED_FIELDS]
+
+
+def _build_user(snapshot: dict[str, Any]):
+    """Rehydrate a ``User`` instance from a cached snapshot without touching the database."""
+
+    User = get_user_model()
+    attnames = [name for name in _cached_attnames() if name in snapshot]
+    return User.from_db(
+        router.db_for_read(User),
+        attnames,
+        [snapshot[name] for name in attnames],
+    )
+
+
+def get_cached_user(user_id: Any):
+    """Return the cached user for ``user_id`` or ``None`` on a cache miss."""
+
+    if _cache_ttl() <= 0:
+        return None
+    snapshot = cache.get(user_cache_key(user_id))
+    if snapshot is None:
+        return None
+    return _build_user(snapshot)
+
+
+def load_user(user_id: Any):
+    """Load a user from the database and refresh its cache entry."""
+
+    User = get_user_model()
+    snapshot = User.objects.filter(pk=user_id).values(*_cached_attnames()).first()
+    if snapshot is None:
+        return None
+
+    ttl = _cache_ttl()
+    if ttl > 0:
+        cache.set(user_cache_key(user_id), snapshot, ttl)
+    return _build_user(snapshot)
+
+
+def invalidate_cached_user(user_id: Any) -> None:
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """Authenticate bearer tokens using signed claims plus a cached user snapshot.
+
+    The token signature proves the ``user_id`` claim, so the only remaining work
+    is resolving the user. Snapshots are cached for ``AUTH_USER_CACHE_TTL_SECONDS``
+    and invalidated whenever the ``User`` row is saved or deleted, which keeps
+    deactivations and KYC changes visible immediately on the next request.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares password hashes, which are never cached.
+            return super().get_user(validated_token)
+
+        user_id = self.get_user_id(validated_token)
+        user = get_cached_user(user_id) or load_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+    def get_user_id(self, validated_token) -> Any:
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from exc
@@ -6,7 +6,8 @@ from urllib.parse import parse_qs
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AnonymousUser
 from django.db import close_old_connections
-from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .authentication import CachedJWTAuthentication, get_cached_user, load_user
 
 
 class JWTAuthMiddleware:
@@ -14,15 +15,17 @@ class JWTAuthMiddleware:
 
     def __init__(self, inner):
         self.inner = inner
-        self._jwt_auth = JWTAuthentication()
+        self._jwt_auth = CachedJWTAuthentication()
 
     async def __call__(self, scope, receive, send):
-        scope["user"] = await sync_to_async(_authenticate, thread_sensitive=True)(scope, self._jwt_auth)
+        # Token verification and cache hits are CPU-only, so handshakes can run on
+        # the shared thread pool instead of queueing behind the single
+        # thread-sensitive executor.
+        scope["user"] = await sync_to_async(_authenticate, thread_sensitive=False)(scope, self._jwt_auth)
         return await self.inner(scope, receive, send)
 
 
-def _authenticate(scope, jwt_auth: JWTAuthentication):
-    close_old_connections()
+def _authenticate(scope, jwt_auth: CachedJWTAuthentication):
     query_string = scope.get("query_string", b"").decode()
     params = parse_qs(query_string)
     token = params.get("token", [None])[0]
@@ -32,10 +35,21 @@ def _authenticate(scope, jwt_auth: JWTAuthentication):
 
     try:
         validated = jwt_auth.get_validated_token(token)
-        user = jwt_auth.get_user(validated)
+        user_id = jwt_auth.get_user_id(validated)
     except Exception:  # pragma: no cover - invalid tokens fall back to anonymous
         return AnonymousUser()
 
+    user = get_cached_user(user_id)
+    if user is None:
+        close_old_connections()
+        try:
+            user = load_user(user_id)
+        finally:
+            close_old_connections()
+
+    if user is None or not user.is_active:
+        return AnonymousUser()
+
     return user
 
 
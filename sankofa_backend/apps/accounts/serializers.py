@@ -102,6 +102,8 @@ class OTPVerifySerializer(serializers.Serializer):
     code = serializers.CharField(max_length=6, min_length=4)
     purpose = serializers.ChoiceField(choices=PhoneOTP.PURPOSE_CHOICES)
     new_password = serializers.CharField(write_only=True, required=False, min_length=8)
+    # Group invites sent to the number are only accepted once the code proves the caller owns it.
+    accept_invites = serializers.BooleanField(write_only=True, required=False, default=False)
 
     default_error_messages = {
         "otp_invalid": _("The code you entered is incorrect."),
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .authentication import invalidate_cached_user
+
 
 User = get_user_model()
 
@@ -19,3 +22,13 @@ def ensure_wallet_for_user(sender, instance: User, created: bool, **_: object) -
         # Avoid breaking user creation if storage is temporarily unavailable.
         # The wallet will be lazily provisioned when next accessed.
         pass
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance: User, **_: object) -> None:
+    user_id = instance.pk
+    invalidate_cached_user(user_id)
+    # A concurrent request may re-cache the pre-commit row, so drop it again once
+    # the change is visible to other connections.
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
@@ -6,12 +6,15 @@ from decimal import Decimal
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
 
 from PIL import Image
 
+from sankofa_backend.apps.accounts.authentication import CachedJWTAuthentication
 from sankofa_backend.apps.accounts.models import PhoneOTP
 from sankofa_backend.apps.transactions.models import Wallet
 
@@ -215,3 +218,68 @@ class AuthenticationFlowTests(TestCase):
         )
 
         self.assertEqual(verify_response.status_code, 200)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self) -> None:
+        self.authentication = CachedJWTAuthentication()
+        self.user = User.objects.create_user(phone_number="0241234567", full_name="Kwame")
+        self.token = AccessToken.for_user(self.user)
+
+    def test_repeat_authentication_is_served_from_cache(self):
+        self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.phone_number, "+233241234567")
+
+    def test_kyc_change_invalidates_cached_user(self):
+        self.authentication.get_user(self.token)
+
+        self.user.kyc_status = "approved"
+        self.user.save(update_fields=["kyc_status", "updated_at"])
+
+        user = self.authentication.get_user(self.token)
+        self.assertEqual(user.kyc_status, "approved")
+
+    def test_deactivated_user_is_rejected_after_cache_warmup(self):
+        self.authentication.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_bearer_token_authenticates_current_user_endpoint(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+        response = client.get(reverse("accounts:current-user"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], str(self.user.id))
+
+
+class NormalizePhonesTests(SimpleTestCase):
+    def test_matches_scalar_normalization(self):
+        numbers = [
+            "0240000000",
+            "+233 24 000 0000",
+            "233240000000",
+            "240000000",
+            "(024) 000-0000",
+            "00233240000000",
+            "+44 20 7946 0958",
+            "٠٢٤٠٠٠٠٠٠٠",
+            "",
+            "abc",
+        ]
+
+        self.assertEqual(
+            User.objects.normalize_phones(numbers),
+            [User.objects.normalize_phone(number) for number in numbers],
+        )
+        self.assertEqual(User.objects.normalize_phones([]), [])
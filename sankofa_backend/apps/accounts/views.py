@@ -5,6 +5,7 @@ from rest_framework import parsers, permissions, response, status, views
 from rest_framework.exceptions import ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from ..groups.onboarding import link_pending_invites
 from .models import PhoneOTP
 from .serializers import (
     GhanaCardUploadSerializer,
@@ -27,6 +28,15 @@ def _serialize_user(user: User, *, request=None) -> dict:
     return UserSerializer(user, context=context).data
 
 
+def _serialize_invite(invite) -> dict:
+    return {
+        "id": str(invite.pk),
+        "group_id": str(invite.group_id),
+        "name": invite.name,
+        "status": invite.status,
+    }
+
+
 def _issue_tokens_for_user(user: User, *, request=None) -> dict:
     refresh = RefreshToken.for_user(user)
     return {
@@ -127,6 +137,10 @@ class OTPVerifyView(views.APIView):
             raise ValidationError({"detail": "Account setup is incomplete. Please register first."})
 
         tokens = _issue_tokens_for_user(user, request=request)
+        if purpose == PhoneOTP.PURPOSE_SIGNUP:
+            # Invites are only tied to the account once the OTP proves the caller owns the number.
+            invites = link_pending_invites(user, accept=serializer.validated_data["accept_invites"])
+            tokens["group_invites"] = [_serialize_invite(invite) for invite in invites]
         return response.Response(tokens, status=status.HTTP_200_OK)
 
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -15,7 +14,8 @@ from ..disputes.serializers import (
     DisputeUpdateSerializer as BaseDisputeUpdateSerializer,
     SupportArticleSerializer as BaseSupportArticleSerializer,
 )
-from ..groups.models import Group, GroupInvite
+from ..groups.models import Group, GroupInvite, GroupMembershipEvent
+from ..groups.services import create_invites
 from ..savings.models import SavingsGoal
 from ..transactions.models import Transaction, Wallet
 from .models import AuditLog
@@ -171,6 +171,20 @@ class AuditLogSerializer(serializers.ModelSerializer):
         return "System"
 
 
+class GroupMembershipEventSerializer(serializers.ModelSerializer):
+    user_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = GroupMembershipEvent
+        fields = ("id", "event_type", "delta", "user", "user_name", "occurred_at")
+        read_only_fields = fields
+
+    def get_user_name(self, obj: GroupMembershipEvent) -> str | None:
+        if obj.user:
+            return obj.user.full_name or obj.user.phone_number
+        return None
+
+
 class GroupInviteSerializer(serializers.ModelSerializer):
     class Meta:
         model = GroupInvite
@@ -185,8 +199,8 @@ class GroupMemberSerializer(serializers.Serializer):
 
 
 class GroupSerializer(serializers.ModelSerializer):
-    member_count = serializers.IntegerField()
-    pending_invites = serializers.IntegerField()
+    member_count = serializers.IntegerField(read_only=True)
+    pending_invites = serializers.IntegerField(source="pending_invite_count", read_only=True)
     owner_name = serializers.SerializerMethodField()
     invites = GroupInviteSerializer(many=True, read_only=True)
     members = serializers.SerializerMethodField()
@@ -341,13 +355,7 @@ class GroupWriteSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Platform owner account is not provisioned.")
 
         group = Group.objects.create(owner=owner, **validated_data)
-
-        for invite in invites:
-            GroupInvite.objects.create(
-                group=group,
-                name=invite["name"],
-                phone_number=invite["phone_number"],
-            )
+        create_invites(group=group, invites=[(invite["name"], invite["phone_number"]) for invite in invites])
 
         return group
 
@@ -358,8 +366,7 @@ class GroupWriteSerializer(serializers.ModelSerializer):
 
         target_member_count = validated_data.get("target_member_count")
         if target_member_count is not None:
-            member_count = instance.memberships.count()
-            if target_member_count < member_count:
+            if target_member_count < instance.member_count:
                 raise serializers.ValidationError(
                     {"target_member_count": "Cannot reduce below the current member count."}
                 )
@@ -483,14 +490,6 @@ class AdminUserDetailSerializer(AdminUserSummarySerializer):
         queryset = (
             Group.objects.filter(memberships__user=obj)
             .prefetch_related("invites")
-            .annotate(
-                member_count=Count("memberships", distinct=True),
-                pending_invites=Count(
-                    "invites",
-                    filter=Q(invites__status=GroupInvite.STATUS_PENDING),
-                    distinct=True,
-                ),
-            )
             .distinct()
         )
         return GroupSerializer(queryset, many=True, context=self.context).data
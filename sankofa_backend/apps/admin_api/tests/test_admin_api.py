@@ -11,7 +11,8 @@ from rest_framework.test import APIClient, APITestCase
 from sankofa_backend.apps.accounts.models import User
 from sankofa_backend.apps.admin_api.models import AuditLog
 from sankofa_backend.apps.disputes.models import Dispute, DisputeMessage, SupportArticle
-from sankofa_backend.apps.groups.models import Group, GroupInvite, GroupMembership
+from sankofa_backend.apps.groups.history import rollup_membership_events
+from sankofa_backend.apps.groups.models import Group, GroupInvite, GroupMembership, GroupMembershipEvent
 from sankofa_backend.apps.savings.models import SavingsGoal
 from sankofa_backend.apps.transactions.models import Transaction, Wallet
 
@@ -91,13 +92,16 @@ class AdminApiTests(APITestCase):
             channel="Bank Transfer",
         )
 
-        self.support_article = SupportArticle.objects.create(
+        # The disputes data migration already seeds this article.
+        self.support_article, _ = SupportArticle.objects.update_or_create(
             slug="faq-contribution-missing-payment",
-            category="Wallet & Cashflow",
-            title="Reconcile a missing contribution payment",
-            summary="Checklist for verifying MoMo receipts when contributions fail to post.",
-            link="https://support.sankofa/disputes/missing-contribution",
-            tags=["MoMo", "Ledger"],
+            defaults={
+                "category": "Wallet & Cashflow",
+                "title": "Reconcile a missing contribution payment",
+                "summary": "Checklist for verifying MoMo receipts when contributions fail to post.",
+                "link": "https://support.sankofa/disputes/missing-contribution",
+                "tags": ["MoMo", "Ledger"],
+            },
         )
 
         self.dispute = Dispute.objects.create(
@@ -302,6 +306,33 @@ class AdminApiTests(APITestCase):
         self.assertEqual(remove_response.status_code, status.HTTP_200_OK)
         self.assertEqual(remove_response.data["member_count"], 0)
 
+    def test_admin_membership_history_and_timeline(self):
+        self.authenticate()
+        remove_url = reverse("admin-api:admin-groups-remove-member", args=[self.group.pk, self.member.pk])
+        self.assertEqual(self.client.delete(remove_url).status_code, status.HTTP_200_OK)
+        rollup_membership_events(since=timezone.localdate())
+
+        events_url = reverse("admin-api:admin-groups-membership-events", args=[self.group.pk])
+        events = self.client.get(events_url).data["results"]
+        self.assertEqual(
+            [(event["event_type"], event["delta"]) for event in events],
+            [(GroupMembershipEvent.EVENT_REMOVED, -1), (GroupMembershipEvent.EVENT_JOINED, 1)],
+        )
+        self.assertEqual(events[0]["user_name"], "Member User")
+
+        today = timezone.localdate().isoformat()
+        timeline_url = reverse("admin-api:admin-groups-membership-timeline", args=[self.group.pk])
+        timeline = self.client.get(timeline_url, {"start": today, "end": today}).data["timeline"]
+        self.assertEqual(timeline, [{"date": today, "joined": 1, "left": 1, "members": 0}])
+
+        platform_url = reverse("admin-api:admin-groups-platform-membership-timeline")
+        platform = self.client.get(platform_url).data
+        self.assertEqual(len(platform["timeline"]), 30)
+        self.assertEqual(platform["timeline"][-1]["joined"], 1)
+
+        invalid = self.client.get(platform_url, {"start": "yesterday"})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_savings_goals_list_filters_by_user(self):
         self.authenticate()
         url = reverse("admin-api:admin-savings-goals-list")
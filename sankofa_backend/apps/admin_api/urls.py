@@ -8,6 +8,7 @@ from .views import (
     DashboardMetricsView,
     DisputeViewSet,
     GroupViewSet,
+    RealtimeMetricsView,
     SavingsGoalViewSet,
     SupportArticleViewSet,
     TransactionViewSet,
@@ -27,5 +28,6 @@ urlpatterns = [
     path("auth/token/", AdminAuthView.as_view(), name="admin-auth-token"),
     path("dashboard/", DashboardMetricsView.as_view(), name="admin-dashboard"),
     path("cashflow/queues/", CashflowQueuesView.as_view(), name="admin-cashflow-queues"),
+    path("realtime/metrics/", RealtimeMetricsView.as_view(), name="admin-realtime-metrics"),
     path("", include(router.urls)),
 ]
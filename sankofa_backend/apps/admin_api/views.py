@@ -19,7 +19,11 @@ from rest_framework.views import APIView
 
 from ..disputes.models import Dispute, SupportArticle
 from ..disputes.serializers import DisputeMessageCreateSerializer
-from ..groups.models import Group, GroupInvite
+from ..groups.backpressure import BackpressureConfig
+from ..groups.backpressure import metrics as realtime_metrics
+from ..groups.models import Group, GroupInvite, GroupMembership, GroupMembershipEvent
+from ..groups.history import membership_timeline
+from ..groups.services import create_invites
 from ..savings.models import SavingsGoal
 from ..transactions.models import Transaction, Wallet
 from .models import AuditLog
@@ -36,6 +40,7 @@ from .serializers import (
     DashboardMetricsSerializer,
     GroupSerializer,
     GroupInviteInputSerializer,
+    GroupMembershipEventSerializer,
     GroupWriteSerializer,
     SavingsGoalSerializer,
     TransactionSerializer,
@@ -43,6 +48,9 @@ from .serializers import (
 
 User = get_user_model()
 
+# Upper bound on the days returned by one membership timeline request.
+MEMBERSHIP_TIMELINE_MAX_DAYS = 366
+
 
 class AdminPagination(PageNumberPagination):
     page_size = 25
@@ -145,18 +153,13 @@ class GroupViewSet(viewsets.ModelViewSet):
     serializer_class = GroupSerializer
 
     def get_queryset(self):
+        if self.action in {"membership_events", "membership_timeline"}:
+            return Group.objects.all()
+
         queryset = (
             Group.objects.all()
             .prefetch_related("invites", "memberships__user")
             .select_related("owner")
-            .annotate(
-                member_count=Count("memberships", distinct=True),
-                pending_invites=Count(
-                    "invites",
-                    filter=Q(invites__status=GroupInvite.STATUS_PENDING),
-                    distinct=True,
-                ),
-            )
             .order_by("name")
         )
 
@@ -254,33 +257,11 @@ class GroupViewSet(viewsets.ModelViewSet):
         serializer = GroupInviteInputSerializer(data=invites_payload, many=True)
         serializer.is_valid(raise_exception=True)
 
-        created = []
-        seen_numbers: set[str] = set()
-        for invite_data in serializer.validated_data:
-            phone_number = invite_data["phone_number"]
-            if phone_number in seen_numbers:
-                continue
-            seen_numbers.add(phone_number)
-            if group.memberships.filter(user__phone_number=phone_number).exists():
-                continue
-            if group.invites.filter(phone_number=phone_number, status=GroupInvite.STATUS_PENDING).exists():
-                continue
-            created.append(
-                GroupInvite.objects.create(
-                    group=group,
-                    name=invite_data["name"],
-                    phone_number=phone_number,
-                )
-            )
-
-        if created:
-            AuditLog.objects.create(
-                actor=request.user,
-                action="group.invite.created",
-                target_type="groups.Group",
-                target_id=str(group.pk),
-                metadata={"count": len(created)},
-            )
+        create_invites(
+            group=group,
+            invites=[(invite["name"], invite["phone_number"]) for invite in serializer.validated_data],
+            actor=request.user,
+        )
 
         return self._build_response(group)
 
@@ -297,10 +278,15 @@ class GroupViewSet(viewsets.ModelViewSet):
                 defaults={"full_name": invite.name},
             )
 
-            membership, created_membership = group.memberships.get_or_create(
-                user=member,
-                defaults={"display_name": invite.name or member.full_name or member.phone_number},
-            )
+            membership = group.memberships.filter(user=member).first()
+            if membership is None:
+                membership = GroupMembership(
+                    group=group,
+                    user=member,
+                    display_name=invite.name or member.full_name or member.phone_number,
+                )
+                membership._membership_event = GroupMembershipEvent.EVENT_INVITE_ACCEPTED
+                membership.save(force_insert=True)
 
             invite.status = GroupInvite.STATUS_ACCEPTED
             invite.kyc_completed = True
@@ -359,6 +345,7 @@ class GroupViewSet(viewsets.ModelViewSet):
         if membership is None:
             return Response({"detail": "Member not found."}, status=status.HTTP_404_NOT_FOUND)
 
+        membership._membership_event = GroupMembershipEvent.EVENT_REMOVED
         membership.delete()
 
         AuditLog.objects.create(
@@ -371,6 +358,44 @@ class GroupViewSet(viewsets.ModelViewSet):
 
         return self._build_response(group)
 
+    def _timeline_response(self, request, *, group_id=None) -> Response:
+        today = timezone.localdate()
+        try:
+            end = date.fromisoformat(request.query_params.get("end") or today.isoformat())
+            start = date.fromisoformat(request.query_params.get("start") or (end - timedelta(days=29)).isoformat())
+        except ValueError:
+            return Response({"detail": "Dates must use YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        if start > end or (end - start).days >= MEMBERSHIP_TIMELINE_MAX_DAYS:
+            return Response(
+                {"detail": f"Choose a range of at most {MEMBERSHIP_TIMELINE_MAX_DAYS} days."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {
+                "group": str(group_id) if group_id is not None else None,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "timeline": membership_timeline(start=start, end=end, group_id=group_id),
+            }
+        )
+
+    @action(methods=["get"], detail=True, url_path="membership-events")
+    def membership_events(self, request, pk=None):
+        group = self.get_object()
+        events = GroupMembershipEvent.objects.filter(group=group).select_related("user").order_by("-occurred_at")
+        page = self.paginate_queryset(events)
+        serializer = GroupMembershipEventSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(methods=["get"], detail=True, url_path="membership-timeline")
+    def membership_timeline(self, request, pk=None):
+        group = self.get_object()
+        return self._timeline_response(request, group_id=group.pk)
+
+    @action(methods=["get"], detail=False, url_path="membership-timeline")
+    def platform_membership_timeline(self, request):
+        return self._timeline_response(request)
+
 
 class DisputeViewSet(viewsets.ModelViewSet):
     permission_classes = [IsStaffUser]
@@ -785,3 +810,17 @@ class CashflowQueuesView(APIView):
             {"deposits": queues.get("deposits", []), "withdrawals": queues.get("withdrawals", [])}
         )
         return Response(serializer.data)
+
+
+class RealtimeMetricsView(APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        config = BackpressureConfig.from_settings()
+        return Response(
+            {
+                **realtime_metrics.snapshot(),
+                "max_pending_frames": config.max_pending,
+                "slow_consumer_policy": config.policy,
+            }
+        )
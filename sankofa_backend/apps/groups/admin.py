@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import Group, GroupInvite, GroupInviteReminder, GroupMembership
+from .models import (
+    Group,
+    GroupCycle,
+    GroupInvite,
+    GroupInviteReminder,
+    GroupMembership,
+    GroupMembershipEvent,
+)
 
 
 @admin.register(Group)
@@ -16,6 +23,7 @@ class GroupAdmin(admin.ModelAdmin):
         "cycle_number",
         "total_cycles",
         "next_payout_date",
+        "payouts_completed_at",
     )
     list_filter = ("is_public", "requires_approval")
     search_fields = ("name", "description", "location", "owner__phone_number", "owner__full_name")
@@ -23,6 +31,15 @@ class GroupAdmin(admin.ModelAdmin):
     autocomplete_fields = ("owner",)
 
 
+@admin.register(GroupCycle)
+class GroupCycleAdmin(admin.ModelAdmin):
+    list_display = ("group", "number", "due_date", "recipient", "status", "opened_at")
+    list_filter = ("status", "due_date")
+    search_fields = ("group__name", "recipient__phone_number")
+    autocomplete_fields = ("group", "recipient")
+    ordering = ("-due_date",)
+
+
 @admin.register(GroupMembership)
 class GroupMembershipAdmin(admin.ModelAdmin):
     list_display = ("group", "user", "display_name", "joined_at")
@@ -32,6 +49,18 @@ class GroupMembershipAdmin(admin.ModelAdmin):
     ordering = ("group", "joined_at")
 
 
+@admin.register(GroupMembershipEvent)
+class GroupMembershipEventAdmin(admin.ModelAdmin):
+    # Events outlive their group and the foreign key has no database
+    # constraint, so the list shows ``group_id`` and never joins the group.
+    list_display = ("group_id", "user", "event_type", "delta", "occurred_at")
+    list_select_related = ("user",)
+    list_filter = ("event_type", "occurred_at")
+    search_fields = ("group__name", "user__phone_number")
+    autocomplete_fields = ("group", "user")
+    ordering = ("-occurred_at",)
+
+
 @admin.register(GroupInvite)
 class GroupInviteAdmin(admin.ModelAdmin):
     list_display = (
@@ -51,7 +80,7 @@ class GroupInviteAdmin(admin.ModelAdmin):
 
 @admin.register(GroupInviteReminder)
 class GroupInviteReminderAdmin(admin.ModelAdmin):
-    list_display = ("invite", "reminded_at")
-    list_filter = ("reminded_at",)
+    list_display = ("invite", "channel", "status", "reminded_at", "sent_at")
+    list_filter = ("status", "channel", "reminded_at")
     autocomplete_fields = ("invite",)
     ordering = ("-reminded_at",)
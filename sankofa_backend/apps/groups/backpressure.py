@@ -0,0 +1,156 @@
+"""Per-connection send queues for group activity websockets.
+
+Each ``GroupActivityConsumer`` drains the channel layer into a bounded
+``SendQueue`` and a writer task forwards frames to the socket. When a client
+cannot keep up, the configured policy decides what happens to the backlog
+instead of letting the channel layer drop messages silently.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+
+
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_RESYNC = "resync"
+POLICY_DISCONNECT = "disconnect"
+POLICIES = (POLICY_DROP_OLDEST, POLICY_RESYNC, POLICY_DISCONNECT)
+
+RESYNC_EVENT = "group.resync_required"
+
+# Close code sent to clients that were disconnected for falling behind.
+SLOW_CONSUMER_CLOSE_CODE = 4408
+
+
+@dataclass(slots=True, frozen=True)
+class BackpressureConfig:
+    max_pending: int
+    policy: str
+
+    @classmethod
+    def from_settings(cls) -> "BackpressureConfig":
+        policy = str(getattr(settings, "GROUP_ACTIVITY_SLOW_CONSUMER_POLICY", POLICY_RESYNC)).lower()
+        if policy not in POLICIES:
+            policy = POLICY_RESYNC
+        max_pending = max(int(getattr(settings, "GROUP_ACTIVITY_MAX_PENDING_FRAMES", 100)), 1)
+        return cls(max_pending=max_pending, policy=policy)
+
+
+class SendQueue:
+    """Bounded FIFO of encoded frames with an overflow policy.
+
+    ``push`` returns ``False`` only when the policy is ``disconnect`` and the
+    queue is full; the caller is expected to close the socket.
+    """
+
+    def __init__(self, config: BackpressureConfig, *, resync_frame: Any = None) -> None:
+        self.config = config
+        self.resync_frame = resync_frame
+        self._frames: deque[Any] = deque()
+        self._resync_pending = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def resync_pending(self) -> bool:
+        return self._resync_pending
+
+    def push(self, frame: Any) -> bool:
+        if self._resync_pending:
+            # The client will refetch state, so anything queued behind the marker is redundant.
+            self.dropped += 1
+            return True
+
+        if len(self._frames) < self.config.max_pending:
+            self._frames.append(frame)
+            return True
+
+        if self.config.policy == POLICY_DISCONNECT:
+            return False
+
+        if self.config.policy == POLICY_DROP_OLDEST:
+            self._frames.popleft()
+            self._frames.append(frame)
+            self.dropped += 1
+            return True
+
+        self.dropped += len(self._frames) + 1
+        self._frames.clear()
+        self._frames.append(self.resync_frame)
+        self._resync_pending = True
+        return True
+
+    def pop(self) -> Any:
+        frame = self._frames.popleft()
+        if not self._frames:
+            self._resync_pending = False
+        return frame
+
+
+class RealtimeMetrics:
+    """Process-local counters for group activity sockets.
+
+    Each Channels worker keeps its own registry; the admin endpoint reports the
+    worker that served the request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._depths: dict[str, int] = {}
+            self.frames_sent = 0
+            self.frames_dropped = 0
+            self.resyncs = 0
+            self.slow_disconnects = 0
+
+    def connection_opened(self, channel_name: str) -> None:
+        with self._lock:
+            self._depths[channel_name] = 0
+
+    def connection_closed(self, channel_name: str) -> None:
+        with self._lock:
+            self._depths.pop(channel_name, None)
+
+    def record_depth(self, channel_name: str, depth: int) -> None:
+        with self._lock:
+            if channel_name in self._depths:
+                self._depths[channel_name] = depth
+
+    def record_sent(self) -> None:
+        with self._lock:
+            self.frames_sent += 1
+
+    def record_dropped(self, count: int, *, resync: bool = False) -> None:
+        with self._lock:
+            self.frames_dropped += count
+            if resync:
+                self.resyncs += 1
+
+    def record_slow_disconnect(self) -> None:
+        with self._lock:
+            self.slow_disconnects += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            depths = list(self._depths.values())
+            return {
+                "connections": len(depths),
+                "queued_frames": sum(depths),
+                "max_queue_depth": max(depths, default=0),
+                "frames_sent": self.frames_sent,
+                "frames_dropped": self.frames_dropped,
+                "resyncs": self.resyncs,
+                "slow_consumer_disconnects": self.slow_disconnects,
+            }
+
+
+metrics = RealtimeMetrics()
@@ -0,0 +1,171 @@
+"""Contribution collection for open payout cycles.
+
+Each member of the group is debited ``contribution_amount`` for the cycle. The
+engine does not run one locked transaction per member. It locks every member
+wallet of the cycle in primary-key order and then the platform float. Members
+who can pay are debited with a single ``UPDATE`` and the contribution rows are
+written with ``bulk_create``. Members who cannot pay are reported as
+shortfalls. A cycle stays open until every member has paid, so re-running
+collection only retries the shortfalls. Each run stamps the cycle's
+``collection_attempted_at`` and batches pick the least recently attempted
+cycles first, so cycles stuck on shortfalls cannot starve newer ones.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..transactions.models import Transaction, Wallet
+from .leaderboard import record_contributions
+from .models import GroupCycle, GroupMembership
+from .services import apply_cycle_totals
+
+
+@dataclass(slots=True)
+class ContributionShortfall:
+    user_id: Any
+    balance: Decimal
+    required: Decimal
+
+    @property
+    def missing(self) -> Decimal:
+        return self.required - self.balance
+
+
+@dataclass(slots=True)
+class CollectionResult:
+    cycle_id: Any
+    amount: Decimal
+    collected_count: int = 0
+    collected_total: Decimal = Decimal("0.00")
+    shortfalls: list[ContributionShortfall] = field(default_factory=list)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.shortfalls
+
+
+def _paid_user_ids(cycle: GroupCycle):
+    return Transaction.objects.filter(
+        group_cycle=cycle,
+        transaction_type=Transaction.TYPE_CONTRIBUTION,
+        status=Transaction.STATUS_SUCCESS,
+    ).values("user_id")
+
+
+def collect_cycle(cycle_id: Any, *, now: datetime | None = None) -> CollectionResult | None:
+    """Collect contributions for one open cycle.
+
+    Returns ``None`` when the cycle is not open or another worker holds it.
+    """
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        cycle = (
+            GroupCycle.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("group")
+            .filter(pk=cycle_id, status=GroupCycle.STATUS_OPEN)
+            .first()
+        )
+        if cycle is None:
+            return None
+
+        group = cycle.group
+        amount = Decimal(group.contribution_amount).quantize(Decimal("0.01"))
+        result = CollectionResult(cycle_id=cycle.pk, amount=amount)
+
+        member_ids = GroupMembership.objects.filter(group_id=group.pk).values("user_id")
+        unpaid = Wallet.objects.filter(user_id__in=member_ids).exclude(user_id__in=_paid_user_ids(cycle))
+
+        # Every path that moves money locks member wallets before the platform
+        # float, and the members here are locked in primary-key order, so
+        # concurrent collections and single-member flows cannot deadlock.
+        wallets = list(unpaid.select_for_update().order_by("pk").only("id", "user_id", "balance"))
+        platform_wallet = Wallet.objects.select_for_update().get(pk=Wallet.objects.ensure_platform().pk)
+
+        payers = [wallet for wallet in wallets if wallet.balance >= amount]
+        result.shortfalls = [
+            ContributionShortfall(user_id=wallet.user_id, balance=wallet.balance, required=amount)
+            for wallet in wallets
+            if wallet.balance < amount
+        ]
+        # Members who never opened a wallet cannot pay either.
+        result.shortfalls.extend(
+            ContributionShortfall(user_id=user_id, balance=Decimal("0.00"), required=amount)
+            for user_id in GroupMembership.objects.filter(group_id=group.pk, user__wallet__isnull=True).values_list(
+                "user_id", flat=True
+            )
+        )
+
+        if payers:
+            total = amount * len(payers)
+            # The rows are locked, so this matches exactly the payers selected above.
+            unpaid.filter(balance__gte=amount).update(balance=F("balance") - amount, updated_at=now)
+            Wallet.objects.filter(pk=platform_wallet.pk).update(balance=F("balance") + total, updated_at=now)
+
+            platform_balance = platform_wallet.balance
+            description = f"Contribution to {group.name} (cycle {cycle.number})"
+            contributions = []
+            for wallet in payers:
+                platform_balance += amount
+                contributions.append(
+                    Transaction(
+                        user_id=wallet.user_id,
+                        transaction_type=Transaction.TYPE_CONTRIBUTION,
+                        status=Transaction.STATUS_SUCCESS,
+                        amount=amount,
+                        description=description,
+                        occurred_at=now,
+                        counterparty=group.name,
+                        balance_after=wallet.balance - amount,
+                        platform_balance_after=platform_balance,
+                        group_id=group.pk,
+                        group_cycle=cycle,
+                    )
+                )
+            Transaction.objects.bulk_create(contributions, batch_size=1000)
+            # ``bulk_create`` skips the transaction signals that keep cycle totals current.
+            apply_cycle_totals(cycle.pk, group_id=group.pk, collected=total)
+            record_contributions(group.pk, cycle.pk, ((wallet.user_id, amount) for wallet in payers))
+            result.collected_count = len(payers)
+            result.collected_total = total
+
+        changes: dict[str, Any] = {"collection_attempted_at": now}
+        if result.is_complete:
+            changes["status"] = GroupCycle.STATUS_COLLECTED
+        GroupCycle.objects.filter(pk=cycle.pk).update(**changes)
+
+    return result
+
+
+def collect_open_cycles(*, limit: int | None = None, now: datetime | None = None) -> dict[str, Any]:
+    """Run collection for open cycles, each in its own transaction.
+
+    Cycles never attempted come first, then the least recently attempted, each
+    group ordered by due date.
+    """
+
+    limit = limit or int(getattr(settings, "GROUP_COLLECTION_BATCH_SIZE", 100))
+    now = now or timezone.now()
+    summary: dict[str, Any] = {"cycles": 0, "completed": 0, "collected": 0, "shortfalls": 0}
+    cycle_ids = list(
+        GroupCycle.objects.filter(status=GroupCycle.STATUS_OPEN, due_date__lte=now)
+        .order_by(F("collection_attempted_at").asc(nulls_first=True), "due_date")
+        .values_list("pk", flat=True)[:limit]
+    )
+    for cycle_id in cycle_ids:
+        result = collect_cycle(cycle_id, now=now)
+        if result is None:
+            continue
+        summary["cycles"] += 1
+        summary["completed"] += int(result.is_complete)
+        summary["collected"] += result.collected_count
+        summary["shortfalls"] += len(result.shortfalls)
+    return summary
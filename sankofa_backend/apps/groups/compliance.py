@@ -0,0 +1,151 @@
+"""Members x cycles contribution compliance matrix, cached per group version.
+
+Contributions are read with one grouped query (one row per member and cycle)
+and pivoted into NumPy arrays. Flags and scores are then computed with array
+operations, not per-member loops or queries.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Sum
+
+from ..transactions.models import Transaction
+from .models import Group, GroupCycle, GroupMembership
+
+
+STATUS_PAID = "paid"
+STATUS_LATE = "late"
+STATUS_MISSING = "missing"
+STATUS_NOT_MEMBER = "not_member"
+
+COMPLIANCE_CACHE_PREFIX = "groups:compliance"
+
+
+def compliance_cache_key(group_id: Any, version: int) -> str:
+    return f"{COMPLIANCE_CACHE_PREFIX}:{group_id}:{version}"
+
+
+def _to_cents(amount: Decimal | None) -> int:
+    return int((amount or Decimal("0")) * 100)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> list[float | None]:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.round(numerator / denominator, 4)
+    return [None if count == 0 else float(ratio) for ratio, count in zip(ratios, denominator)]
+
+
+def build_compliance(group: Group) -> dict[str, Any]:
+    """Compute paid, late and missing flags for every member and cycle of ``group``.
+
+    A member is expected to pay a cycle when they had joined by its due date,
+    or when they paid it anyway. A payment counts as late when the
+    contribution settles more than ``GROUP_CONTRIBUTION_GRACE_HOURS`` after the
+    due date. Punctuality is the share of expected cycles paid on time.
+    """
+
+    cycles = list(GroupCycle.objects.filter(group=group).order_by("number").values_list("number", "due_date"))
+    members = list(
+        GroupMembership.objects.filter(group=group)
+        .order_by("joined_at", "pk")
+        .values_list("user_id", "display_name", "joined_at")
+    )
+    rows = list(
+        Transaction.objects.filter(
+            group=group,
+            group_cycle__isnull=False,
+            transaction_type=Transaction.TYPE_CONTRIBUTION,
+            status=Transaction.STATUS_SUCCESS,
+        )
+        .order_by()
+        .values_list("user_id", "group_cycle__number")
+        .annotate(total=Sum("amount"), last_paid_at=Max("occurred_at"))
+    )
+
+    member_index = {user_id: index for index, (user_id, _name, _joined) in enumerate(members)}
+    cycle_index = {number: index for index, (number, _due) in enumerate(cycles)}
+    shape = (len(members), len(cycles))
+
+    paid_cents = np.zeros(shape, dtype=np.int64)
+    paid_at = np.full(shape, np.inf)
+    cells = [
+        (member_index[user_id], cycle_index[number], _to_cents(total), last_paid_at.timestamp())
+        for user_id, number, total, last_paid_at in rows
+        if user_id in member_index and number in cycle_index
+    ]
+    if cells:
+        member_rows, cycle_cols, cents, settled = (np.asarray(column) for column in zip(*cells))
+        paid_cents[member_rows, cycle_cols] = cents
+        paid_at[member_rows, cycle_cols] = settled
+
+    grace = timedelta(hours=int(getattr(settings, "GROUP_CONTRIBUTION_GRACE_HOURS", 48))).total_seconds()
+    due = np.array([due_date.timestamp() for _number, due_date in cycles], dtype=float)
+    joined = np.array([joined_at.timestamp() for _user_id, _name, joined_at in members], dtype=float)
+
+    paid = paid_cents >= _to_cents(group.contribution_amount)
+    expected = (joined[:, None] <= due[None, :]) | paid
+    late = paid & (paid_at > due[None, :] + grace)
+    on_time = paid & ~late
+    missing = expected & ~paid
+
+    statuses = np.select(
+        [~expected, on_time, late],
+        [STATUS_NOT_MEMBER, STATUS_PAID, STATUS_LATE],
+        default=STATUS_MISSING,
+    )
+    expected_per_member = expected.sum(axis=1)
+    punctuality = _ratio(on_time.sum(axis=1), expected_per_member)
+    collection_rate = _ratio(paid.sum(axis=0), expected.sum(axis=0))
+
+    return {
+        "groupId": str(group.pk),
+        "version": group.version,
+        "contributionAmount": float(group.contribution_amount),
+        "cycles": [
+            {
+                "number": number,
+                "dueDate": due_date.isoformat(),
+                "paidCount": int(paid[:, index].sum()),
+                "expectedCount": int(expected[:, index].sum()),
+                "collectionRate": collection_rate[index],
+            }
+            for index, (number, due_date) in enumerate(cycles)
+        ],
+        "members": [
+            {
+                "id": str(user_id),
+                "name": name,
+                "punctuality": punctuality[index],
+                "paidCount": int(on_time[index].sum()),
+                "lateCount": int(late[index].sum()),
+                "missingCount": int(missing[index].sum()),
+                "cycles": statuses[index].tolist(),
+            }
+            for index, (user_id, name, _joined) in enumerate(members)
+        ],
+    }
+
+
+def get_compliance(group: Group) -> dict[str, Any]:
+    """Return the compliance matrix for ``group``, computing it once per version.
+
+    Memberships, cycles and contributions all bump ``Group.version``, so a
+    cached matrix is never stale.
+    """
+
+    ttl = int(getattr(settings, "GROUP_COMPLIANCE_CACHE_TTL_SECONDS", 300))
+    key = compliance_cache_key(group.pk, group.version)
+    if ttl > 0:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    report = build_compliance(group)
+    if ttl > 0:
+        cache.set(key, report, ttl)
+    return report
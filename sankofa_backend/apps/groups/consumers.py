@@ -1,19 +1,31 @@
 """Channels consumer streaming group activity updates."""
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.contrib.auth.models import AnonymousUser
 
+from .backpressure import (
+    RESYNC_EVENT,
+    SLOW_CONSUMER_CLOSE_CODE,
+    BackpressureConfig,
+    SendQueue,
+    metrics,
+)
 from .models import GroupMembership
-from .realtime import group_channel_name
+from .realtime import MSGPACK_SUBPROTOCOL, encode_frames, group_channel_name
 
 
 class GroupActivityConsumer(AsyncJsonWebsocketConsumer):
     """Streams membership and savings activity to connected group members."""
 
+    use_msgpack = False
+    outbox: SendQueue | None = None
+    _writer: asyncio.Task | None = None
+
     async def connect(self) -> None:  # pragma: no cover - exercised via tests
         user = self.scope.get("user")
         if user is None or isinstance(user, AnonymousUser) or user.is_anonymous:
@@ -29,15 +41,72 @@ class GroupActivityConsumer(AsyncJsonWebsocketConsumer):
             await self.close(code=4403)
             return
 
+        self.use_msgpack = MSGPACK_SUBPROTOCOL in self.scope.get("subprotocols", [])
+
+        self.outbox = SendQueue(
+            BackpressureConfig.from_settings(),
+            resync_frame=encode_frames(event=RESYNC_EVENT, payload={"groupId": self.group_id}),
+        )
+        self._outbox_ready = asyncio.Event()
+
         await self.channel_layer.group_add(self.group_name, self.channel_name)
-        await self.accept()
+        await self.accept(subprotocol=MSGPACK_SUBPROTOCOL if self.use_msgpack else None)
+        metrics.connection_opened(self.channel_name)
+        self._writer = asyncio.ensure_future(self._drain_outbox())
 
     async def disconnect(self, code: int) -> None:  # pragma: no cover - exercised via framework
+        self._stop_writer()
         if hasattr(self, "group_name"):
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
     async def group_activity(self, event: dict[str, Any]) -> None:
-        await self.send_json({"type": event["event"], "payload": event.get("payload", {})})
+        outbox = self.outbox
+        if outbox is None:
+            return
+
+        frames = event.get("frames")
+        if frames is None:
+            # Messages from older publishers carry the raw payload only.
+            frames = encode_frames(event=event["event"], payload=event.get("payload", {}))
+
+        # Frames are queued rather than sent inline so the channel layer keeps
+        # draining even while this client's socket is slow; the queue bound and
+        # policy decide what happens to the backlog.
+        dropped_before, resync_before = outbox.dropped, outbox.resync_pending
+        if not outbox.push(frames):
+            metrics.record_dropped(len(outbox) + 1)
+            metrics.record_slow_disconnect()
+            self._stop_writer()
+            await self.close(code=SLOW_CONSUMER_CLOSE_CODE)
+            return
+
+        dropped = outbox.dropped - dropped_before
+        if dropped:
+            metrics.record_dropped(dropped, resync=outbox.resync_pending and not resync_before)
+        metrics.record_depth(self.channel_name, len(outbox))
+        self._outbox_ready.set()
+
+    async def _drain_outbox(self) -> None:
+        outbox = self.outbox
+        while outbox is not None:
+            await self._outbox_ready.wait()
+            self._outbox_ready.clear()
+            while outbox:
+                frames = outbox.pop()
+                if self.use_msgpack:
+                    await self.send(bytes_data=frames["msgpack"])
+                else:
+                    await self.send(text_data=frames["json"])
+                metrics.record_sent()
+                metrics.record_depth(self.channel_name, len(outbox))
+
+    def _stop_writer(self) -> None:
+        if self.outbox is not None:
+            metrics.connection_closed(self.channel_name)
+        self.outbox = None
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
 
     @sync_to_async
     def _user_can_subscribe(self, *, user_id: str, group_id: str) -> bool:
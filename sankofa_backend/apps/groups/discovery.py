@@ -0,0 +1,174 @@
+"""Precomputed snapshot of public groups for the discovery endpoint.
+
+Every public group is serialized into one cached snapshot. A beat task
+refreshes it before it goes stale, and requests only filter and page the
+cached list.
+
+When the snapshot is stale or missing, a single request rebuilds it. That
+request takes a short ``cache.add`` lock. The other requests keep serving the
+stale copy, or wait briefly for the rebuild if there is no copy at all. This
+way an expiry under load costs one query instead of one per request.
+"""
+from __future__ import annotations
+
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Group
+from .payouts import parse_frequency
+
+
+SNAPSHOT_CACHE_KEY = "groups:discovery:snapshot"
+REBUILD_LOCK_KEY = "groups:discovery:rebuild"
+
+# How long a rebuild may hold the lock, and how long requests with no snapshot
+# wait for another worker's rebuild before building one themselves.
+REBUILD_LOCK_SECONDS = 30
+REBUILD_WAIT_SECONDS = 2.0
+REBUILD_POLL_SECONDS = 0.05
+
+SNAPSHOT_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "location",
+    "frequency",
+    "contribution_amount",
+    "member_count",
+    "target_member_count",
+    "requires_approval",
+    "cycle_number",
+    "total_cycles",
+    "next_payout_date",
+)
+
+
+def _ttl() -> int:
+    return max(int(getattr(settings, "GROUP_DISCOVERY_CACHE_TTL_SECONDS", 300)), 1)
+
+
+def _schedule_key(frequency: str) -> str:
+    schedule = parse_frequency(frequency)
+    return f"{schedule.unit}:{schedule.interval}"
+
+
+def build_snapshot() -> dict[str, Any]:
+    groups = []
+    for row in Group.objects.filter(is_public=True).order_by("name", "pk").values(*SNAPSHOT_FIELDS):
+        groups.append(
+            {
+                "id": str(row["id"]),
+                "name": row["name"],
+                "description": row["description"],
+                "location": row["location"],
+                "frequency": row["frequency"],
+                "contributionAmount": float(row["contribution_amount"]),
+                "memberCount": row["member_count"],
+                "targetMemberCount": row["target_member_count"],
+                "seatsRemaining": max(row["target_member_count"] - row["member_count"], 0),
+                "requiresApproval": row["requires_approval"],
+                "cycleNumber": row["cycle_number"],
+                "totalCycles": row["total_cycles"],
+                "nextPayoutDate": row["next_payout_date"].isoformat(),
+                "_scheduleKey": _schedule_key(row["frequency"]),
+            }
+        )
+    return {"builtAt": time.time(), "groups": groups}
+
+
+def refresh_snapshot() -> dict[str, Any]:
+    """Rebuild and store the snapshot unconditionally; used by the beat task."""
+
+    snapshot = build_snapshot()
+    # Stale copies stay available for a while past the TTL so they can be
+    # served during a rebuild.
+    cache.set(SNAPSHOT_CACHE_KEY, snapshot, _ttl() * 4)
+    return snapshot
+
+
+def _rebuild_single_flight() -> dict[str, Any] | None:
+    if not cache.add(REBUILD_LOCK_KEY, True, REBUILD_LOCK_SECONDS):
+        return None
+    try:
+        return refresh_snapshot()
+    finally:
+        cache.delete(REBUILD_LOCK_KEY)
+
+
+def get_snapshot() -> dict[str, Any]:
+    snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+    if snapshot is not None:
+        if time.time() - snapshot["builtAt"] > _ttl():
+            # Only the lock holder rebuilds; everyone else serves the stale copy.
+            snapshot = _rebuild_single_flight() or snapshot
+        return snapshot
+
+    rebuilt = _rebuild_single_flight()
+    if rebuilt is not None:
+        return rebuilt
+
+    deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(REBUILD_POLL_SECONDS)
+        snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+        if snapshot is not None:
+            return snapshot
+    # The rebuilding worker stalled; answer this request without touching the cache.
+    return build_snapshot()
+
+
+def _decimal_param(value: str | None) -> Decimal | None:
+    if value in (None, ""):
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(value) from None
+
+
+def filter_groups(
+    groups: list[dict[str, Any]],
+    *,
+    location: str | None = None,
+    frequency: str | None = None,
+    min_contribution: str | None = None,
+    max_contribution: str | None = None,
+    has_seats: bool = False,
+) -> list[dict[str, Any]]:
+    """Filter snapshot entries.
+
+    Frequencies match by parsed schedule, so ``weekly`` also finds groups
+    described as ``"Weekly contributions"``. Raises ``ValueError`` for a
+    contribution bound that is not a number.
+    """
+
+    minimum = _decimal_param(min_contribution)
+    maximum = _decimal_param(max_contribution)
+    location_term = (location or "").strip().lower()
+    schedule_key = _schedule_key(frequency) if frequency else None
+
+    results = []
+    for group in groups:
+        if location_term and location_term not in group["location"].lower():
+            continue
+        if schedule_key and group["_scheduleKey"] != schedule_key:
+            continue
+        amount = Decimal(str(group["contributionAmount"]))
+        if minimum is not None and amount < minimum:
+            continue
+        if maximum is not None and amount > maximum:
+            continue
+        if has_seats and group["seatsRemaining"] <= 0:
+            continue
+        results.append(group)
+    return results
+
+
+def render_entry(group: dict[str, Any], *, member_group_ids: set[str]) -> dict[str, Any]:
+    data = {key: value for key, value in group.items() if not key.startswith("_")}
+    data["isMember"] = group["id"] in member_group_ids
+    return data
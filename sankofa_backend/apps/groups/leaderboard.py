@@ -0,0 +1,224 @@
+"""Per-cycle contribution leaderboards kept in sorted sets.
+
+Each payout cycle has one sorted set: the members are user ids and the scores
+are the amounts contributed, in pesewas. The ledger services add to the
+scores after their transactions commit, so reading the top contributors never
+touches ``Transaction``. Production uses Redis (``ZINCRBY``/``ZREVRANGE``);
+``MemoryLeaderboardStore`` is an in-process stand-in with the same interface
+for tests and single-process development.
+
+``rebuild_leaderboards`` regenerates the sets from the ledger when they are
+lost or drift, streaming contributions in batches ordered by cycle. Each
+cycle's set is built under a temporary key and renamed over the live one, so
+readers never see an empty or half-built board during a rebuild.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Iterable, Mapping
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from ..transactions.models import Transaction
+from .realtime import broadcast_group_event
+
+logger = logging.getLogger(__name__)
+
+
+LEADERBOARD_KEY_PREFIX = "groups:leaderboard"
+LEADERBOARD_EVENT = "group.leaderboard.updated"
+# Outside the live key prefix, so pruning live keys never removes a set still being built.
+REBUILD_KEY_PREFIX = f"{LEADERBOARD_KEY_PREFIX}-rebuild"
+
+
+def leaderboard_key(group_id: Any, cycle_id: Any) -> str:
+    return f"{LEADERBOARD_KEY_PREFIX}:{group_id}:{cycle_id}"
+
+
+def to_score(amount: Decimal) -> int:
+    return int(Decimal(amount) * 100)
+
+
+class MemoryLeaderboardStore:
+    """Process-local sorted sets; ties are broken by member id, as in Redis."""
+
+    def __init__(self) -> None:
+        self._sets: dict[str, dict[str, int]] = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def increment_many(self, key: str, scores: Mapping[str, int]) -> None:
+        with self._lock:
+            board = self._sets[key]
+            for member, score in scores.items():
+                board[member] = board.get(member, 0) + score
+                if board[member] <= 0:
+                    del board[member]
+
+    def replace(self, key: str, scores: Mapping[str, int]) -> None:
+        with self._lock:
+            self._sets[key] = dict(scores)
+
+    def top(self, key: str, limit: int) -> list[tuple[str, int]]:
+        with self._lock:
+            board = list(self._sets.get(key, {}).items())
+        board.sort(key=lambda item: (item[1], item[0]), reverse=True)
+        return board[:limit]
+
+    def keys(self, prefix: str) -> set[str]:
+        with self._lock:
+            return {key for key in self._sets if key.startswith(prefix)}
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._sets.pop(key, None)
+
+
+class RedisLeaderboardStore:
+    def __init__(self, url: str) -> None:
+        self._client = redis.Redis.from_url(url)
+
+    def increment_many(self, key: str, scores: Mapping[str, int]) -> None:
+        pipeline = self._client.pipeline(transaction=False)
+        for member, score in scores.items():
+            pipeline.zincrby(key, score, member)
+        # Fully reversed contributions drop off the board.
+        pipeline.zremrangebyscore(key, "-inf", 0)
+        pipeline.execute()
+
+    def replace(self, key: str, scores: Mapping[str, int]) -> None:
+        if not scores:
+            self._client.delete(key)
+            return
+        # Build aside, then swap in with one atomic RENAME.
+        temporary = f"{REBUILD_KEY_PREFIX}:{uuid.uuid4().hex}"
+        pipeline = self._client.pipeline(transaction=False)
+        pipeline.zadd(temporary, dict(scores))
+        pipeline.rename(temporary, key)
+        pipeline.execute()
+
+    def top(self, key: str, limit: int) -> list[tuple[str, int]]:
+        rows = self._client.zrevrange(key, 0, limit - 1, withscores=True)
+        return [(member.decode(), int(score)) for member, score in rows]
+
+    def keys(self, prefix: str) -> set[str]:
+        return {key.decode() for key in self._client.scan_iter(match=f"{prefix}*", count=1000)}
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        for start in range(0, len(keys), 1000):
+            self._client.delete(*keys[start : start + 1000])
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if getattr(settings, "GROUP_LEADERBOARD_BACKEND", "memory") == "redis":
+                    _store = RedisLeaderboardStore(settings.GROUP_LEADERBOARD_URL)
+                else:
+                    _store = MemoryLeaderboardStore()
+    return _store
+
+
+def reset_store() -> None:
+    """Forget the configured store so the next call re-reads the settings."""
+
+    global _store
+    _store = None
+
+
+def top_contributors(group_id: Any, cycle_id: Any, *, limit: int = 10) -> list[dict[str, Any]]:
+    return [
+        {"userId": member, "amount": float(Decimal(score) / 100), "rank": rank}
+        for rank, (member, score) in enumerate(get_store().top(leaderboard_key(group_id, cycle_id), limit), start=1)
+    ]
+
+
+def _publish(group_id: Any, cycle_id: Any, scores: Mapping[str, int]) -> None:
+    try:
+        get_store().increment_many(leaderboard_key(group_id, cycle_id), scores)
+        leaders = top_contributors(group_id, cycle_id)
+    except Exception:
+        # The money has already moved; ``rebuild_leaderboards`` repairs the scores later.
+        logger.warning("Failed to update leaderboard for cycle %s", cycle_id, exc_info=True)
+        return
+    broadcast_group_event(
+        group_id=group_id,
+        event=LEADERBOARD_EVENT,
+        payload={"groupId": str(group_id), "cycleId": str(cycle_id), "leaders": leaders},
+    )
+
+
+def record_contributions(group_id: Any, cycle_id: Any, amounts: Iterable[tuple[Any, Decimal]]) -> None:
+    """Add ``(user_id, amount)`` contributions to the cycle's leaderboard once the transaction commits.
+
+    Negative amounts remove a reversed contribution. Subscribers receive the
+    new top of the board in one ``group.leaderboard.updated`` event.
+    """
+
+    scores: dict[str, int] = defaultdict(int)
+    for user_id, amount in amounts:
+        scores[str(user_id)] += to_score(amount)
+    if scores:
+        transaction.on_commit(lambda: _publish(group_id, cycle_id, scores))
+
+
+def rebuild_leaderboards(*, group_ids: Iterable[Any] | None = None, batch_size: int = 2000) -> int:
+    """Regenerate leaderboards from successful cycle contributions.
+
+    Rows are streamed with a server-side cursor in ``(group_cycle, user)``
+    order, so only one cycle's totals are held in memory at a time. Each
+    cycle's board is swapped in whole; boards that existed before the rebuild
+    but have no contributions left are deleted at the end. Returns the number
+    of cycles rebuilt.
+    """
+
+    store = get_store()
+    contributions = Transaction.objects.filter(
+        transaction_type=Transaction.TYPE_CONTRIBUTION,
+        status=Transaction.STATUS_SUCCESS,
+        group_cycle__isnull=False,
+    )
+    stale: set[str] = set()
+    if group_ids is not None:
+        group_ids = list(group_ids)
+        contributions = contributions.filter(group_cycle__group_id__in=group_ids)
+        for group_id in group_ids:
+            stale |= store.keys(f"{LEADERBOARD_KEY_PREFIX}:{group_id}:")
+    else:
+        stale = store.keys(f"{LEADERBOARD_KEY_PREFIX}:")
+
+    rebuilt = 0
+    current: tuple[Any, Any] | None = None
+    scores: dict[str, int] = defaultdict(int)
+    rows = (
+        contributions.order_by("group_cycle_id", "user_id")
+        .values_list("group_cycle__group_id", "group_cycle_id", "user_id", "amount")
+        .iterator(chunk_size=batch_size)
+    )
+    for group_id, cycle_id, user_id, amount in rows:
+        if current != (group_id, cycle_id):
+            if current is not None:
+                store.replace(leaderboard_key(*current), scores)
+                stale.discard(leaderboard_key(*current))
+                rebuilt += 1
+            current, scores = (group_id, cycle_id), defaultdict(int)
+        scores[str(user_id)] += to_score(amount)
+    if current is not None:
+        store.replace(leaderboard_key(*current), scores)
+        stale.discard(leaderboard_key(*current))
+        rebuilt += 1
+    store.delete(stale)
+    return rebuilt
@@ -0,0 +1,311 @@
+"""Fan-out load harness for ``GroupActivityConsumer``.
+
+Opens many simulated members with Channels' ``WebsocketCommunicator``, drives
+``broadcast_group_event`` and measures what the members actually receive. Used
+by the ``loadtest_group_activity`` management command.
+
+Fixture users get numbers under ``LOADTEST_PHONE_PREFIX``. No Ghanaian
+subscriber number starts with the trunk digit 0, so nothing can be delivered to
+them. A run refuses to write to anything but a test database unless
+``allow_live_database`` is set. Fixtures are removed afterwards, and
+``purge_fixtures`` clears whatever an interrupted run left behind.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Any
+
+import msgpack
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from .consumers import GroupActivityConsumer
+from .models import Group, GroupMembership, GroupMembershipDaily, GroupMembershipEvent
+from .realtime import MSGPACK_SUBPROTOCOL, broadcast_group_event
+
+
+LOADTEST_EVENT = "loadtest.ping"
+LOADTEST_NAME_PREFIX = "Load test"
+# "+233" followed by the national trunk digit: valid in shape, never routable.
+LOADTEST_PHONE_PREFIX = "+2330"
+
+
+@dataclass(slots=True)
+class FanoutConfig:
+    group_sizes: list[int]
+    broadcasts: int = 10
+    interval_ms: int = 0
+    connect_batch: int = 200
+    receive_timeout: float = 5.0
+    channel_layer: str = "memory"
+    redis_url: str = "redis://localhost:6379/3"
+    capacity: int = 100
+    measure_memory: bool = True
+    keep_data: bool = False
+    msgpack: bool = False
+    allow_live_database: bool = False
+
+
+@dataclass(slots=True)
+class FanoutReport:
+    groups: int
+    connections: int
+    connect_seconds: float
+    broadcasts: int
+    expected_messages: int
+    delivered_messages: int
+    dropped_messages: int
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    memory_per_connection_kib: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def channel_layer_settings(config: FanoutConfig) -> dict[str, Any]:
+    if config.channel_layer == "redis":
+        return {
+            "default": {
+                "BACKEND": "channels_redis.core.RedisChannelLayer",
+                "CONFIG": {"hosts": [config.redis_url], "capacity": config.capacity},
+            }
+        }
+    return {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer",
+            "CONFIG": {"capacity": config.capacity},
+        }
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def is_test_database() -> bool:
+    """Whether the default connection points at a database created by the test runner."""
+
+    name = str(connection.settings_dict["NAME"])
+    return name == connection.creation._get_test_db_name() or name.startswith("test_")
+
+
+@transaction.atomic
+def create_fixtures(config: FanoutConfig) -> tuple[list[Group], list[list[Any]]]:
+    """Bulk insert throwaway users, groups and memberships for one run."""
+
+    User = get_user_model()
+    run_prefix = uuid.uuid4().int % 90 + 10
+    total_members = sum(config.group_sizes)
+    users = User.objects.bulk_create(
+        [
+            User(
+                phone_number=f"{LOADTEST_PHONE_PREFIX}{run_prefix:02d}{index:06d}",
+                full_name=f"{LOADTEST_NAME_PREFIX} member {index}",
+            )
+            for index in range(total_members)
+        ]
+    )
+
+    groups = Group.objects.bulk_create(
+        [
+            Group(
+                name=f"{LOADTEST_NAME_PREFIX} group {index}",
+                target_member_count=size,
+                member_count=size,
+                total_cycles=max(size, 1),
+                contribution_amount=Decimal("10.00"),
+                next_payout_date=timezone.now(),
+            )
+            for index, size in enumerate(config.group_sizes)
+        ]
+    )
+
+    members_by_group: list[list[Any]] = []
+    memberships: list[GroupMembership] = []
+    offset = 0
+    for group, size in zip(groups, config.group_sizes):
+        group_users = users[offset : offset + size]
+        offset += size
+        members_by_group.append(group_users)
+        memberships.extend(
+            GroupMembership(group=group, user=user, display_name=user.full_name) for user in group_users
+        )
+    # bulk_create skips the counter signals; ``member_count`` is preset on the groups above.
+    GroupMembership.objects.bulk_create(memberships)
+    return groups, members_by_group
+
+
+@transaction.atomic
+def _delete(groups, users) -> None:
+    group_ids = list(groups.values_list("pk", flat=True))
+    groups.delete()
+    # Membership history outlives deleted groups; the fixtures' history must not.
+    GroupMembershipEvent.objects.filter(group_id__in=group_ids).delete()
+    GroupMembershipDaily.objects.filter(group_id__in=group_ids).delete()
+    users.delete()
+
+
+def delete_fixtures(groups: list[Group], members_by_group: list[list[Any]]) -> None:
+    User = get_user_model()
+    _delete(
+        Group.objects.filter(pk__in=[group.pk for group in groups]),
+        User.objects.filter(pk__in=[user.pk for members in members_by_group for user in members]),
+    )
+
+
+def purge_fixtures() -> int:
+    """Delete fixtures left by interrupted runs; returns the number of users removed."""
+
+    User = get_user_model()
+    users = User.objects.filter(
+        phone_number__startswith=LOADTEST_PHONE_PREFIX, full_name__startswith=LOADTEST_NAME_PREFIX
+    )
+    removed = users.count()
+    groups = Group.objects.filter(
+        name__startswith=LOADTEST_NAME_PREFIX, owner__isnull=True, memberships__user__in=users
+    ).distinct()
+    _delete(Group.objects.filter(pk__in=list(groups.values_list("pk", flat=True))), users)
+    return removed
+
+
+async def _open_connection(group: Group, user, *, use_msgpack: bool) -> WebsocketCommunicator:
+    communicator = WebsocketCommunicator(
+        GroupActivityConsumer.as_asgi(),
+        f"/ws/groups/{group.pk}/",
+        subprotocols=[MSGPACK_SUBPROTOCOL] if use_msgpack else None,
+    )
+    communicator.scope["user"] = user
+    communicator.scope["url_route"] = {"kwargs": {"group_id": group.pk}}
+    connected, _ = await communicator.connect()
+    if not connected:
+        raise RuntimeError(f"Simulated member {user.pk} was rejected by group {group.pk}")
+    return communicator
+
+
+async def _drain(communicator: WebsocketCommunicator, expected: int, timeout: float, latencies: list[float]) -> int:
+    """Collect loadtest frames until ``expected`` arrive or the stream goes quiet."""
+
+    received = 0
+    while received < expected:
+        try:
+            # Read the output queue directly: ``receive_from`` cancels the
+            # application on timeout, which would skew the remaining members.
+            message = await asyncio.wait_for(communicator.output_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        frame = _decode(message)
+        if frame is None or frame.get("type") != LOADTEST_EVENT:
+            continue
+        latencies.append((time.perf_counter() - frame["payload"]["sentAt"]) * 1000)
+        received += 1
+    return received
+
+
+def _decode(message: dict[str, Any]) -> dict[str, Any] | None:
+    if message.get("bytes") is not None:
+        return msgpack.unpackb(message["bytes"])
+    text = message.get("text")
+    if text is None:
+        return None
+    return json.loads(text)
+
+
+async def run_fanout(config: FanoutConfig, groups: list[Group], members_by_group: list[list[Any]]) -> FanoutReport:
+    pairs = [(group, user) for group, members in zip(groups, members_by_group) for user in members]
+
+    if config.measure_memory:
+        tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0] if config.measure_memory else 0
+
+    started = time.perf_counter()
+    communicators: list[WebsocketCommunicator] = []
+    batch_size = max(config.connect_batch, 1)
+    for start in range(0, len(pairs), batch_size):
+        batch = pairs[start : start + batch_size]
+        communicators.extend(
+            await asyncio.gather(
+                *(_open_connection(group, user, use_msgpack=config.msgpack) for group, user in batch)
+            )
+        )
+    connect_seconds = time.perf_counter() - started
+
+    memory_per_connection = None
+    if config.measure_memory:
+        memory_after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        if communicators:
+            memory_per_connection = (memory_after - memory_before) / len(communicators) / 1024
+
+    latencies: list[float] = []
+    drains = [
+        asyncio.ensure_future(_drain(communicator, config.broadcasts, config.receive_timeout, latencies))
+        for communicator in communicators
+    ]
+
+    broadcast = sync_to_async(broadcast_group_event, thread_sensitive=True)
+    for sequence in range(config.broadcasts):
+        for group in groups:
+            await broadcast(
+                group_id=group.pk,
+                event=LOADTEST_EVENT,
+                payload={"sequence": sequence, "sentAt": time.perf_counter()},
+            )
+        if config.interval_ms:
+            await asyncio.sleep(config.interval_ms / 1000)
+
+    delivered = sum(await asyncio.gather(*drains))
+    await asyncio.gather(*(communicator.disconnect() for communicator in communicators))
+
+    expected = len(communicators) * config.broadcasts
+    latencies.sort()
+    return FanoutReport(
+        groups=len(groups),
+        connections=len(communicators),
+        connect_seconds=round(connect_seconds, 3),
+        broadcasts=config.broadcasts,
+        expected_messages=expected,
+        delivered_messages=delivered,
+        dropped_messages=expected - delivered,
+        latency_ms={
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p90": round(percentile(latencies, 0.90), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+        memory_per_connection_kib=round(memory_per_connection, 2) if memory_per_connection is not None else None,
+    )
+
+
+def run_loadtest(config: FanoutConfig) -> FanoutReport:
+    """Create fixtures, run the fan-out scenario and clean up afterwards."""
+
+    if not (config.allow_live_database or is_test_database()):
+        raise RuntimeError(
+            f"Refusing to write load-test fixtures to {connection.settings_dict['NAME']!r}, "
+            "which is not a test database."
+        )
+    groups, members_by_group = create_fixtures(config)
+    try:
+        # Coalescing would merge the pings, so measure raw per-event fan-out.
+        with override_settings(
+            CHANNEL_LAYERS=channel_layer_settings(config),
+            GROUP_ACTIVITY_COALESCE_WINDOW_MS=0,
+        ):
+            return async_to_sync(run_fanout)(config, groups, members_by_group)
+    finally:
+        if not config.keep_data:
+            delete_fixtures(groups, members_by_group)
@@ -0,0 +1,97 @@
+"""Measure websocket fan-out for group activity broadcasts."""
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...loadtest import FanoutConfig, purge_fixtures, run_loadtest
+
+
+class Command(BaseCommand):
+    help = (
+        "Open simulated GroupActivityConsumer connections, drive broadcast_group_event "
+        "and report delivery latency, memory per connection and dropped messages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--groups", type=int, default=10, help="Number of groups to simulate.")
+        parser.add_argument("--members", type=int, default=100, help="Members per group.")
+        parser.add_argument(
+            "--group-sizes",
+            default="",
+            help="Comma separated member counts per group; overrides --groups/--members.",
+        )
+        parser.add_argument("--broadcasts", type=int, default=10, help="Events sent to each group.")
+        parser.add_argument("--interval-ms", type=int, default=0, help="Pause between broadcast rounds.")
+        parser.add_argument("--connect-batch", type=int, default=200, help="Concurrent handshakes per batch.")
+        parser.add_argument("--timeout", type=float, default=5.0, help="Seconds to wait for a missing frame.")
+        parser.add_argument("--channel-layer", choices=("memory", "redis"), default="memory")
+        parser.add_argument("--redis-url", default="redis://localhost:6379/3")
+        parser.add_argument("--capacity", type=int, default=100, help="Channel-layer capacity per channel.")
+        parser.add_argument("--msgpack", action="store_true", help="Negotiate the sankofa.msgpack subprotocol.")
+        parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc accounting.")
+        parser.add_argument("--keep-data", action="store_true", help="Keep the generated users and groups.")
+        parser.add_argument(
+            "--allow-live-database",
+            action="store_true",
+            help="Allow fixtures to be written to a database that is not a test database.",
+        )
+        parser.add_argument(
+            "--purge", action="store_true", help="Only delete fixtures left behind by interrupted runs."
+        )
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        if options["purge"]:
+            removed = purge_fixtures()
+            self.stdout.write(self.style.SUCCESS(f"Removed {removed} load-test member(s) and their groups."))
+            return
+
+        if options["group_sizes"]:
+            try:
+                group_sizes = [int(value) for value in options["group_sizes"].split(",") if value.strip()]
+            except ValueError as exc:
+                raise CommandError("--group-sizes must be a comma separated list of integers.") from exc
+        else:
+            group_sizes = [options["members"]] * options["groups"]
+
+        if not group_sizes or min(group_sizes) < 1:
+            raise CommandError("Every simulated group needs at least one member.")
+
+        config = FanoutConfig(
+            group_sizes=group_sizes,
+            broadcasts=options["broadcasts"],
+            interval_ms=options["interval_ms"],
+            connect_batch=options["connect_batch"],
+            receive_timeout=options["timeout"],
+            channel_layer=options["channel_layer"],
+            redis_url=options["redis_url"],
+            capacity=options["capacity"],
+            measure_memory=not options["no_memory"],
+            keep_data=options["keep_data"],
+            msgpack=options["msgpack"],
+            allow_live_database=options["allow_live_database"],
+        )
+        try:
+            report = run_loadtest(config)
+        except RuntimeError as exc:
+            raise CommandError(f"{exc} Pass --allow-live-database to run anyway.") from exc
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report.as_dict()))
+            return
+
+        self.stdout.write(f"Groups:              {report.groups}")
+        self.stdout.write(f"Connections:         {report.connections} ({report.connect_seconds}s to connect)")
+        self.stdout.write(f"Messages delivered:  {report.delivered_messages}/{report.expected_messages}")
+        self.stdout.write(f"Messages dropped:    {report.dropped_messages}")
+        latency = report.latency_ms
+        self.stdout.write(
+            f"Latency (ms):        p50={latency['p50']} p90={latency['p90']} p99={latency['p99']} max={latency['max']}"
+        )
+        if report.memory_per_connection_kib is not None:
+            self.stdout.write(f"Memory/connection:   {report.memory_per_connection_kib} KiB")
+
+        style = self.style.WARNING if report.dropped_messages else self.style.SUCCESS
+        self.stdout.write(style("Fan-out run complete."))
@@ -0,0 +1,19 @@
+"""Regenerate per-cycle contribution leaderboards from the ledger."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...leaderboard import rebuild_leaderboards
+
+
+class Command(BaseCommand):
+    help = "Rebuild group contribution leaderboards from successful cycle contributions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("group_ids", nargs="*", help="Limit the rebuild to these group ids.")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Transactions fetched per round trip.")
+
+    def handle(self, *args, **options):
+        group_ids = options["group_ids"] or None
+        rebuilt = rebuild_leaderboards(group_ids=group_ids, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt leaderboards for {rebuilt} cycle(s)."))
@@ -0,0 +1,18 @@
+"""Rebuild denormalized group member and invite counters."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...services import repair_group_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute Group.member_count and Group.pending_invite_count from memberships and invites."
+
+    def add_arguments(self, parser):
+        parser.add_argument("group_ids", nargs="*", help="Limit the repair to these group ids.")
+
+    def handle(self, *args, **options):
+        group_ids = options["group_ids"] or None
+        repaired = repair_group_counters(group_ids)
+        self.stdout.write(self.style.SUCCESS(f"Repaired counters for {repaired} group(s)."))
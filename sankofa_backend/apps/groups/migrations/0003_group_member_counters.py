@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_group_counters(apps, schema_editor):
+    Group = apps.get_model("groups", "Group")
+    GroupMembership = apps.get_model("groups", "GroupMembership")
+    GroupInvite = apps.get_model("groups", "GroupInvite")
+
+    def count_of(model, **filters):
+        counts = (
+            model.objects.filter(group=OuterRef("pk"), **filters)
+            .order_by()
+            .values("group")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    Group.objects.update(
+        member_count=count_of(GroupMembership),
+        pending_invite_count=count_of(GroupInvite, status="pending"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0002_group_owner"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="group",
+            name="pending_invite_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_group_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0003_group_member_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['id'], name='groups_public_ids_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='groupmembership',
+            index=models.Index(fields=['user', 'group'], name='groups_membership_user_idx'),
+        ),
+    ]
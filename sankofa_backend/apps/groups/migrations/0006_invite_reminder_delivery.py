@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:32
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_reminders_sent(apps, schema_editor):
+    # Reminders recorded before the dispatcher existed were already counted on the invite.
+    GroupInviteReminder = apps.get_model("groups", "GroupInviteReminder")
+    GroupInviteReminder.objects.update(status="sent", sent_at=F("reminded_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0005_group_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupinvitereminder',
+            name='channel',
+            field=models.CharField(choices=[('sms', 'SMS'), ('email', 'Email')], default='sms', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='groupinvitereminder',
+            name='error',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='groupinvitereminder',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='groupinvitereminder',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('sent', 'Sent'), ('failed', 'Failed'), ('rate_limited', 'Rate limited')], default='queued', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='groupinvitereminder',
+            index=models.Index(fields=['status', 'reminded_at'], name='groups_reminder_queue_idx'),
+        ),
+        migrations.RunPython(mark_existing_reminders_sent, migrations.RunPython.noop),
+    ]
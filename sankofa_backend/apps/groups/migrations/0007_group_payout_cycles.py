@@ -0,0 +1,54 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:35
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0006_invite_reminder_delivery'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupCycle',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('number', models.PositiveIntegerField()),
+                ('due_date', models.DateTimeField()),
+                ('status', models.CharField(choices=[('open', 'Open'), ('collected', 'Collected'), ('paid_out', 'Paid out')], default='open', max_length=16)),
+                ('opened_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['group', 'number'],
+            },
+        ),
+        migrations.AddField(
+            model_name='group',
+            name='payouts_completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(condition=models.Q(('payouts_completed_at__isnull', True)), fields=['next_payout_date'], name='groups_payout_due_idx'),
+        ),
+        migrations.AddField(
+            model_name='groupcycle',
+            name='group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cycles', to='groups.group'),
+        ),
+        migrations.AddField(
+            model_name='groupcycle',
+            name='recipient',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='group_payout_cycles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='groupcycle',
+            constraint=models.UniqueConstraint(fields=('group', 'number'), name='groups_cycle_unique_number'),
+        ),
+    ]
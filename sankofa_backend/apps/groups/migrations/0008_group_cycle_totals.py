@@ -0,0 +1,67 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:38
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, ExpressionWrapper, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_cycle_totals(apps, schema_editor):
+    Group = apps.get_model("groups", "Group")
+    GroupCycle = apps.get_model("groups", "GroupCycle")
+    GroupMembership = apps.get_model("groups", "GroupMembership")
+    Transaction = apps.get_model("transactions", "Transaction")
+
+    def total_of(transaction_type):
+        totals = (
+            Transaction.objects.filter(group_cycle=OuterRef("pk"), transaction_type=transaction_type, status="success")
+            .order_by()
+            .values("group_cycle")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        )
+        return Coalesce(Subquery(totals, output_field=DecimalField()), Value(Decimal("0.00")))
+
+    members = (
+        GroupMembership.objects.filter(group=OuterRef("group"))
+        .order_by()
+        .values("group")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    contribution = Group.objects.filter(pk=OuterRef("group")).values("contribution_amount")[:1]
+    GroupCycle.objects.update(
+        expected_total=ExpressionWrapper(
+            Subquery(contribution) * Coalesce(Subquery(members, output_field=IntegerField()), Value(0)),
+            output_field=DecimalField(),
+        ),
+        collected_total=total_of("contribution"),
+        paid_out_total=total_of("payout"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0007_group_payout_cycles'),
+        ('transactions', '0003_transaction_group_cycle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupcycle',
+            name='collected_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='groupcycle',
+            name='expected_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='groupcycle',
+            name='paid_out_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14),
+        ),
+        migrations.RunPython(backfill_cycle_totals, migrations.RunPython.noop),
+    ]
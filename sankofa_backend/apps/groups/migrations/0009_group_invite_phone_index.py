@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0008_group_cycle_totals'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='groupinvite',
+            index=models.Index(fields=['group', 'phone_number'], name='groups_invite_phone_idx'),
+        ),
+    ]
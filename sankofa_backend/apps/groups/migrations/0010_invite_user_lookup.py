@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0009_group_invite_phone_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupinvite',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='group_invites', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='groupinvite',
+            index=models.Index(fields=['phone_number', 'status'], name='groups_invite_lookup_idx'),
+        ),
+    ]
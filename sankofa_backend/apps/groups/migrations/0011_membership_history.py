@@ -0,0 +1,78 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:48
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_membership_history(apps, schema_editor):
+    GroupMembership = apps.get_model("groups", "GroupMembership")
+    GroupMembershipEvent = apps.get_model("groups", "GroupMembershipEvent")
+    GroupMembershipDaily = apps.get_model("groups", "GroupMembershipDaily")
+
+    # Existing members get a "joined" event at their join time; earlier leaves are not recoverable.
+    events = []
+    joined_per_day = Counter()
+    memberships = GroupMembership.objects.values_list("group_id", "user_id", "joined_at")
+    for group_id, user_id, joined_at in memberships.iterator():
+        events.append(
+            GroupMembershipEvent(
+                group_id=group_id, user_id=user_id, event_type="joined", delta=1, occurred_at=joined_at
+            )
+        )
+        joined_per_day[(group_id, django.utils.timezone.localdate(joined_at))] += 1
+    GroupMembershipEvent.objects.bulk_create(events, batch_size=1000)
+    GroupMembershipDaily.objects.bulk_create(
+        [
+            GroupMembershipDaily(group_id=group_id, day=day, joined=count, net=count)
+            for (group_id, day), count in joined_per_day.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0010_invite_user_lookup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupMembershipDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('joined', models.PositiveIntegerField(default=0)),
+                ('left', models.PositiveIntegerField(default=0)),
+                ('net', models.IntegerField(default=0)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='membership_daily', to='groups.group')),
+            ],
+            options={
+                'ordering': ['group', 'day'],
+                'indexes': [models.Index(fields=['day'], name='groups_member_daily_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('group', 'day'), name='groups_member_daily_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='GroupMembershipEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('event_type', models.CharField(choices=[('joined', 'Joined'), ('invite_accepted', 'Invite accepted'), ('left', 'Left'), ('removed', 'Removed')], max_length=32)),
+                ('delta', models.SmallIntegerField()),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='membership_events', to='groups.group')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='group_membership_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-occurred_at'],
+                'indexes': [models.Index(fields=['group', 'occurred_at'], name='groups_member_event_idx'), models.Index(fields=['occurred_at'], name='groups_member_event_time_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_membership_history, migrations.RunPython.noop),
+    ]
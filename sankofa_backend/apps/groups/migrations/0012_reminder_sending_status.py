@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0011_membership_history'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='groupinvitereminder',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed'), ('rate_limited', 'Rate limited')], default='queued', max_length=16),
+        ),
+    ]
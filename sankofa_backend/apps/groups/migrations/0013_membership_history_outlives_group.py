@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0012_reminder_sending_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='groupmembershipdaily',
+            name='group',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='membership_daily', to='groups.group'),
+        ),
+        migrations.AlterField(
+            model_name='groupmembershipevent',
+            name='event_type',
+            field=models.CharField(choices=[('joined', 'Joined'), ('invite_accepted', 'Invite accepted'), ('left', 'Left'), ('removed', 'Removed'), ('group_deleted', 'Group deleted')], max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='groupmembershipevent',
+            name='group',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='membership_events', to='groups.group'),
+        ),
+    ]
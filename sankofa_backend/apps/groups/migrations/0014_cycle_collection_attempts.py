@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0013_membership_history_outlives_group'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupcycle',
+            name='collection_attempted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='groupcycle',
+            index=models.Index(fields=['status', 'collection_attempted_at', 'due_date'], name='groups_cycle_collect_idx'),
+        ),
+    ]
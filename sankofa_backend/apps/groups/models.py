@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from decimal import Decimal
 
 from django.conf import settings
 from django.db import models
@@ -9,16 +10,41 @@ from django.utils import timezone
 
 class GroupQuerySet(models.QuerySet):
     def for_user(self, user):
+        """Groups ``user`` may open: every public group plus the ones they belong to or own."""
+
         if user.is_anonymous:
             return self.filter(is_public=True)
-        return (
-            self.filter(
-                models.Q(is_public=True)
-                | models.Q(memberships__user=user)
-                | models.Q(owner=user)
-            )
-            .distinct()
+        return self.filter(models.Q(is_public=True) | self._mine_filter(user))
+
+    def mine(self, user):
+        """Groups ``user`` belongs to or owns.
+
+        This backs the group list, so its size follows the user's own groups
+        rather than the platform's. Public groups are browsed through the
+        cached discovery snapshot instead.
+        """
+
+        if user.is_anonymous:
+            return self.none()
+        return self.filter(self._mine_filter(user))
+
+    @staticmethod
+    def _mine_filter(user) -> models.Q:
+        # Two id sets, each served by its own index, matched on the primary key.
+        # Unlike OR-ing across the memberships join this never multiplies rows,
+        # so no DISTINCT pass is needed.
+        member_group_ids = GroupMembership.objects.filter(user=user).values("group_id")
+        return models.Q(pk__in=member_group_ids) | models.Q(owner=user)
+
+    def with_detail_relations(self):
+        """Load everything ``GroupSerializer`` renders in a fixed number of queries."""
+
+        memberships_prefetch = models.Prefetch(
+            "memberships",
+            queryset=GroupMembership.objects.select_related("user"),
+            to_attr="_prefetched_members",
         )
+        return self.select_related("owner").prefetch_related(memberships_prefetch, "invites")
 
 
 class Group(models.Model):
@@ -35,6 +61,8 @@ class Group(models.Model):
     total_cycles = models.PositiveIntegerField(default=1)
     next_payout_date = models.DateTimeField()
     payout_order = models.CharField(max_length=255, blank=True)
+    # Set by the payout scheduler once the final cycle has been opened.
+    payouts_completed_at = models.DateTimeField(blank=True, null=True)
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         related_name="owned_groups",
@@ -42,20 +70,55 @@ class Group(models.Model):
         null=True,
         blank=True,
     )
+    # Maintained with F() updates by ``groups.signals``; ``repair_group_counters`` rebuilds them.
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_invite_count = models.PositiveIntegerField(default=0, editable=False)
+    # Bumped on every change to the group, its memberships or its invites; keys
+    # cached payloads and ETags.
+    version = models.PositiveBigIntegerField(default=1, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     objects = GroupQuerySet.as_manager()
 
+    COUNTER_FIELDS = ("member_count", "pending_invite_count", "version")
+
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["id"], condition=models.Q(is_public=True), name="groups_public_ids_idx"),
+            models.Index(
+                fields=["next_payout_date"],
+                condition=models.Q(payouts_completed_at__isnull=True),
+                name="groups_payout_due_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        if self._state.adding or kwargs.get("force_insert"):
+            super().save(*args, **kwargs)
+            return
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            # A full save would write back whatever counters this instance loaded,
+            # undoing concurrent increments; counters only change through F() updates.
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        kwargs["update_fields"] = [*update_fields, "version"]
+        self.version = models.F("version") + 1
+        super().save(*args, **kwargs)
+        self.refresh_from_db(fields=["version"])
+
     @property
     def seats_remaining(self) -> int:
-        return max(self.target_member_count - self.memberships.count(), 0)
+        return max(self.target_member_count - self.member_count, 0)
 
 
 class GroupMembership(models.Model):
@@ -68,11 +131,84 @@ class GroupMembership(models.Model):
     class Meta:
         unique_together = ("group", "user")
         ordering = ["joined_at"]
+        indexes = [
+            models.Index(fields=["user", "group"], name="groups_membership_user_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.display_name} in {self.group.name}"
 
 
+class GroupMembershipEvent(models.Model):
+    """Append-only record of a membership change, kept after the membership row is gone."""
+
+    EVENT_JOINED = "joined"
+    EVENT_INVITE_ACCEPTED = "invite_accepted"
+    EVENT_LEFT = "left"
+    EVENT_REMOVED = "removed"
+    EVENT_GROUP_DELETED = "group_deleted"
+    EVENT_CHOICES = (
+        (EVENT_JOINED, "Joined"),
+        (EVENT_INVITE_ACCEPTED, "Invite accepted"),
+        (EVENT_LEFT, "Left"),
+        (EVENT_REMOVED, "Removed"),
+        (EVENT_GROUP_DELETED, "Group deleted"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # History outlives the group: without a database constraint the row keeps
+    # ``group_id`` after the group is deleted.
+    group = models.ForeignKey(
+        Group, related_name="membership_events", on_delete=models.DO_NOTHING, db_constraint=False
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="group_membership_events",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+    event_type = models.CharField(max_length=32, choices=EVENT_CHOICES)
+    # +1 for a member gained, -1 for a member lost.
+    delta = models.SmallIntegerField()
+    occurred_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["-occurred_at"]
+        indexes = [
+            models.Index(fields=["group", "occurred_at"], name="groups_member_event_idx"),
+            models.Index(fields=["occurred_at"], name="groups_member_event_time_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.event_type} ({self.delta:+d}) in {self.group_id}"
+
+
+class GroupMembershipDaily(models.Model):
+    """Per-group daily rollup of ``GroupMembershipEvent`` rows for members-over-time queries."""
+
+    # Kept after the group is deleted, like the events it is rolled up from.
+    group = models.ForeignKey(
+        Group, related_name="membership_daily", on_delete=models.DO_NOTHING, db_constraint=False
+    )
+    day = models.DateField()
+    joined = models.PositiveIntegerField(default=0)
+    left = models.PositiveIntegerField(default=0)
+    net = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["group", "day"]
+        constraints = [
+            models.UniqueConstraint(fields=["group", "day"], name="groups_member_daily_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="groups_member_daily_day_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.group_id} on {self.day}: {self.net:+d}"
+
+
 class GroupInvite(models.Model):
     STATUS_PENDING = "pending"
     STATUS_ACCEPTED = "accepted"
@@ -87,6 +223,14 @@ class GroupInvite(models.Model):
     group = models.ForeignKey(Group, related_name="invites", on_delete=models.CASCADE)
     name = models.CharField(max_length=255)
     phone_number = models.CharField(max_length=32)
+    # Set once an account is registered with ``phone_number``.
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="group_invites",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
     kyc_completed = models.BooleanField(default=False)
     sent_at = models.DateTimeField(default=timezone.now)
@@ -96,6 +240,17 @@ class GroupInvite(models.Model):
 
     class Meta:
         ordering = ["-sent_at"]
+        indexes = [
+            models.Index(fields=["group", "phone_number"], name="groups_invite_phone_idx"),
+            models.Index(fields=["phone_number", "status"], name="groups_invite_lookup_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so pending-invite counters can be adjusted on save.
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
 
     def mark_status(self, *, status: str, kyc_completed: bool | None = None) -> None:
         if status not in {choice[0] for choice in self.STATUS_CHOICES}:
@@ -109,12 +264,89 @@ class GroupInvite(models.Model):
 
 
 class GroupInviteReminder(models.Model):
+    STATUS_QUEUED = "queued"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_RATE_LIMITED = "rate_limited"
+    STATUS_CHOICES = (
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_SENDING, "Sending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+        (STATUS_RATE_LIMITED, "Rate limited"),
+    )
+
+    CHANNEL_SMS = "sms"
+    CHANNEL_EMAIL = "email"
+    CHANNEL_CHOICES = (
+        (CHANNEL_SMS, "SMS"),
+        (CHANNEL_EMAIL, "Email"),
+    )
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     invite = models.ForeignKey(GroupInvite, related_name="reminders", on_delete=models.CASCADE)
     reminded_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    channel = models.CharField(max_length=16, choices=CHANNEL_CHOICES, default=CHANNEL_SMS)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    error = models.CharField(max_length=255, blank=True)
 
     class Meta:
         ordering = ["-reminded_at"]
+        indexes = [
+            models.Index(fields=["status", "reminded_at"], name="groups_reminder_queue_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"Reminder for {self.invite.phone_number} at {self.reminded_at}"
+
+
+class GroupCycle(models.Model):
+    """A payout cycle opened by the scheduler when a group's payout date arrives."""
+
+    STATUS_OPEN = "open"
+    STATUS_COLLECTED = "collected"
+    STATUS_PAID_OUT = "paid_out"
+    STATUS_CHOICES = (
+        (STATUS_OPEN, "Open"),
+        (STATUS_COLLECTED, "Collected"),
+        (STATUS_PAID_OUT, "Paid out"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    group = models.ForeignKey(Group, related_name="cycles", on_delete=models.CASCADE)
+    number = models.PositiveIntegerField()
+    due_date = models.DateTimeField()
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="group_payout_cycles",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_OPEN)
+    opened_at = models.DateTimeField(default=timezone.now)
+    # Set on every collection run, so cycles stuck on shortfalls go to the back of the queue.
+    collection_attempted_at = models.DateTimeField(null=True, blank=True)
+    # Running totals of the cycle's transactions, kept current with F() updates
+    # by ``services.apply_cycle_totals`` so the ledger never aggregates on read.
+    expected_total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    collected_total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    paid_out_total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        ordering = ["group", "number"]
+        constraints = [
+            models.UniqueConstraint(fields=["group", "number"], name="groups_cycle_unique_number"),
+        ]
+        indexes = [
+            models.Index(fields=["status", "collection_attempted_at", "due_date"], name="groups_cycle_collect_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Cycle {self.number} of {self.group.name}"
+
+    @property
+    def outstanding_total(self) -> Decimal:
+        return max(self.expected_total - self.collected_total, Decimal("0.00"))
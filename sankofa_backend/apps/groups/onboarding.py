@@ -0,0 +1,142 @@
+"""Link a newly registered user to the group invites sent to their phone number.
+
+Organizers can invite people who have no account yet. Once such a person
+verifies the signup OTP, proving they own the number, all of their pending
+invites are found with one indexed lookup on ``(phone_number, status)`` and
+linked to the new account. If the user opts in, the invites are accepted in
+bulk at the same time. Each affected group then gets a single realtime event,
+whatever the number of invites involved.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .history import membership_event, record_membership_events
+from .models import Group, GroupInvite, GroupMembership, GroupMembershipEvent
+from .payloads import get_group_payload
+from .realtime import broadcast_group_event
+from .services import _count_subquery
+
+
+def link_pending_invites(user, *, accept: bool = False, now: datetime | None = None) -> list[GroupInvite]:
+    """Attach every pending invite for ``user.phone_number`` to ``user``.
+
+    With ``accept=True``, the user also joins each invited group that still has
+    a free seat. Memberships are written with ``bulk_create`` and the invites
+    and group counters with one ``UPDATE`` each. Invites to full groups stay
+    pending. Everything runs in one transaction, and the realtime events are
+    sent after it commits. Returns the invites with their new status.
+    """
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        invites = list(
+            GroupInvite.objects.select_for_update()
+            .filter(phone_number=user.phone_number, status=GroupInvite.STATUS_PENDING)
+            .order_by("group_id", "sent_at")
+        )
+        if not invites:
+            return []
+
+        GroupInvite.objects.filter(pk__in=[invite.pk for invite in invites]).update(user=user)
+        for invite in invites:
+            invite.user = user
+
+        joined: dict[Any, GroupMembership] = {}
+        if accept:
+            joined = _accept_invites(user, invites, now=now)
+
+    by_group: dict[Any, list[GroupInvite]] = defaultdict(list)
+    for invite in invites:
+        by_group[invite.group_id].append(invite)
+    transaction.on_commit(lambda: _broadcast(user, by_group, joined))
+    return invites
+
+
+def _accept_invites(user, invites: list[GroupInvite], *, now: datetime) -> dict[Any, GroupMembership]:
+    group_ids = sorted({invite.group_id for invite in invites})
+    already_member = set(
+        GroupMembership.objects.filter(user=user, group_id__in=group_ids).values_list("group_id", flat=True)
+    )
+    # Lock the groups in a fixed order so concurrent registrations cannot
+    # overbook the last seat or deadlock on each other.
+    open_groups = [
+        group_id
+        for group_id, member_count, target in Group.objects.select_for_update()
+        .filter(pk__in=group_ids)
+        .order_by("pk")
+        .values_list("pk", "member_count", "target_member_count")
+        if group_id in already_member or member_count < target
+    ]
+    if not open_groups:
+        return {}
+
+    names = {}
+    for invite in invites:
+        names.setdefault(invite.group_id, invite.name)
+    memberships = [
+        GroupMembership(group_id=group_id, user=user, display_name=names[group_id] or user.full_name)
+        for group_id in open_groups
+        if group_id not in already_member
+    ]
+    # ``bulk_create`` skips the membership and invite signals; the history is
+    # written here and the counters are recomputed below in the same statement
+    # that bumps the versions.
+    GroupMembership.objects.bulk_create(memberships)
+    record_membership_events(
+        membership_event(
+            group_id=membership.group_id,
+            user_id=user.pk,
+            event_type=GroupMembershipEvent.EVENT_INVITE_ACCEPTED,
+            occurred_at=now,
+        )
+        for membership in memberships
+    )
+
+    accepted_groups = set(open_groups)
+    accepted = [invite for invite in invites if invite.group_id in accepted_groups]
+    GroupInvite.objects.filter(pk__in=[invite.pk for invite in accepted]).update(
+        status=GroupInvite.STATUS_ACCEPTED, responded_at=now
+    )
+    for invite in accepted:
+        invite.status = GroupInvite.STATUS_ACCEPTED
+        invite.responded_at = now
+        invite._loaded_status = invite.status
+
+    Group.objects.filter(pk__in=open_groups).update(
+        member_count=_count_subquery(GroupMembership),
+        pending_invite_count=_count_subquery(GroupInvite, status=GroupInvite.STATUS_PENDING),
+        version=F("version") + 1,
+        updated_at=now,
+    )
+    return {membership.group_id: membership for membership in memberships}
+
+
+def _broadcast(user, by_group: dict[Any, list[GroupInvite]], joined: dict[Any, GroupMembership]) -> None:
+    for group_id, invites in by_group.items():
+        membership = joined.get(group_id)
+        if membership is not None:
+            broadcast_group_event(
+                group_id=group_id,
+                event="group.membership.invites_accepted",
+                payload={
+                    "group": get_group_payload(group_id),
+                    "member": {"id": str(user.pk), "name": membership.display_name},
+                    "inviteIds": [str(invite.pk) for invite in invites],
+                },
+            )
+        else:
+            broadcast_group_event(
+                group_id=group_id,
+                event="group.invite.registered",
+                payload={
+                    "userId": str(user.pk),
+                    "inviteIds": [str(invite.pk) for invite in invites],
+                },
+            )
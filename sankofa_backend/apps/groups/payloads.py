@@ -0,0 +1,70 @@
+"""Version-keyed cache of serialized group payloads."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Group
+from .serializers import GroupSerializer, parse_field_list
+
+
+PAYLOAD_CACHE_PREFIX = "groups:payload"
+
+
+def payload_cache_key(group_id: Any, version: int) -> str:
+    return f"{PAYLOAD_CACHE_PREFIX}:{group_id}:{version}"
+
+
+def _cache_ttl() -> int:
+    return int(getattr(settings, "GROUP_PAYLOAD_CACHE_TTL_SECONDS", 300))
+
+
+def build_group_payload(group: Group) -> dict[str, Any]:
+    """Serialize ``group`` without any viewer-specific fields and cache it under its version."""
+
+    payload = dict(GroupSerializer(group).data)
+    payload.pop("isMember", None)
+    ttl = _cache_ttl()
+    if ttl > 0:
+        cache.set(payload_cache_key(group.pk, group.version), payload, ttl)
+    return payload
+
+
+def get_group_payload(group_id: Any, version: int | None = None) -> dict[str, Any] | None:
+    """Return the shared payload for a group, serializing it only on a cache miss.
+
+    ``version`` should come from the same read used to authorize the request;
+    when omitted it is loaded alongside the group.
+    """
+
+    if version is not None and _cache_ttl() > 0:
+        cached = cache.get(payload_cache_key(group_id, version))
+        if cached is not None:
+            return cached
+
+    # The version is read in the same row as the payload data, so an entry can
+    # never hold data older than its key.
+    group = Group.objects.with_detail_relations().filter(pk=group_id).first()
+    if group is None:
+        return None
+    return build_group_payload(group)
+
+
+def render_for_viewer(payload: dict[str, Any], *, user=None, fields: str | None = None) -> dict[str, Any]:
+    """Overlay viewer-specific fields on a shared payload and apply ``?fields=``."""
+
+    data = dict(payload)
+    user_id = str(getattr(user, "pk", "")) if user is not None and user.is_authenticated else None
+    data["isMember"] = user_id is not None and user_id in data.get("memberIds", [])
+
+    requested = parse_field_list(fields)
+    if requested:
+        data = {key: value for key, value in data.items() if key in requested}
+    return data
+
+
+def group_etag(group_id: Any, version: int, fields: str | None = None) -> str:
+    requested = ",".join(sorted(parse_field_list(fields)))
+    return f'"{group_id}-{version}-{requested}"' if requested else f'"{group_id}-{version}"'
@@ -0,0 +1,220 @@
+"""Rotating payout scheduler.
+
+Groups store a free-text ``frequency`` and ``payout_order``. The scheduler
+parses them into a ``PayoutSchedule`` and a rotation of member ids, then opens
+a ``GroupCycle`` for every due payout date and advances ``cycle_number`` and
+``next_payout_date``. Due groups are claimed in batches with ``SKIP LOCKED`` and
+written back with one ``bulk_create`` and one ``bulk_update`` per batch, so
+several workers can run the scheduler at once.
+"""
+from __future__ import annotations
+
+import calendar
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Group, GroupCycle, GroupMembership
+
+
+UNIT_DAY = "day"
+UNIT_WEEK = "week"
+UNIT_MONTH = "month"
+
+# Words that appear in the frequencies members type in the app, mapped to (unit, interval).
+_FREQUENCY_WORDS: dict[str, tuple[str, int]] = {
+    "daily": (UNIT_DAY, 1),
+    "day": (UNIT_DAY, 1),
+    "weekly": (UNIT_WEEK, 1),
+    "week": (UNIT_WEEK, 1),
+    "biweekly": (UNIT_WEEK, 2),
+    "fortnightly": (UNIT_WEEK, 2),
+    "fortnight": (UNIT_WEEK, 2),
+    "monthly": (UNIT_MONTH, 1),
+    "month": (UNIT_MONTH, 1),
+    "bimonthly": (UNIT_MONTH, 2),
+    "quarterly": (UNIT_MONTH, 3),
+    "quarter": (UNIT_MONTH, 3),
+    "yearly": (UNIT_MONTH, 12),
+    "annually": (UNIT_MONTH, 12),
+    "annual": (UNIT_MONTH, 12),
+    "year": (UNIT_MONTH, 12),
+}
+
+_EVERY_PATTERN = re.compile(r"every\s+(\d+)\s+(day|week|month)s?")
+
+
+@dataclass(slots=True, frozen=True)
+class PayoutSchedule:
+    unit: str
+    interval: int
+
+    def advance(self, moment: datetime, steps: int = 1) -> datetime:
+        if self.unit == UNIT_DAY:
+            return moment + timedelta(days=self.interval * steps)
+        if self.unit == UNIT_WEEK:
+            return moment + timedelta(weeks=self.interval * steps)
+        return _add_months(moment, self.interval * steps)
+
+
+DEFAULT_SCHEDULE = PayoutSchedule(UNIT_WEEK, 1)
+
+
+def _add_months(moment: datetime, months: int) -> datetime:
+    month_index = moment.month - 1 + months
+    year = moment.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(moment.day, calendar.monthrange(year, month)[1])
+    return moment.replace(year=year, month=month, day=day)
+
+
+def parse_frequency(frequency: str | None) -> PayoutSchedule:
+    """Parse a frequency such as ``"Weekly"``, ``"Bi-weekly"`` or ``"every 10 days"``.
+
+    Unrecognised or blank values fall back to weekly payouts.
+    """
+
+    text = (frequency or "").strip().lower()
+    if not text:
+        return DEFAULT_SCHEDULE
+
+    match = _EVERY_PATTERN.search(text)
+    if match and int(match.group(1)) > 0:
+        return PayoutSchedule(match.group(2), int(match.group(1)))
+
+    for word in re.findall(r"[a-z]+", text.replace("-", "")):
+        if word in _FREQUENCY_WORDS:
+            unit, interval = _FREQUENCY_WORDS[word]
+            return PayoutSchedule(unit, interval)
+    return DEFAULT_SCHEDULE
+
+
+def payout_rotation(payout_order: str | None, member_ids: Sequence[Any]) -> list[Any]:
+    """Return member ids in payout order.
+
+    ``payout_order`` may hold a JSON list of member ids; those members are paid
+    first, in that order, followed by everyone else in join order. Any other
+    value (for example ``"Rotating (Weekly)"``) rotates in join order.
+    """
+
+    try:
+        explicit = json.loads(payout_order or "")
+    except ValueError:
+        explicit = None
+    if not isinstance(explicit, list) or not explicit:
+        return list(member_ids)
+
+    by_key = {str(member_id): member_id for member_id in member_ids}
+    rotation = []
+    for key in explicit:
+        member_id = by_key.pop(str(key), None)
+        if member_id is not None:
+            rotation.append(member_id)
+    return rotation + [member_id for member_id in member_ids if str(member_id) in by_key]
+
+
+def recipient_for_cycle(rotation: Sequence[Any], cycle_number: int) -> Any | None:
+    if not rotation:
+        return None
+    return rotation[(cycle_number - 1) % len(rotation)]
+
+
+def _open_due_cycles(group: Group, *, schedule: PayoutSchedule, rotation: list[Any], now: datetime) -> list[GroupCycle]:
+    cycles = []
+    # A group whose scheduler run was missed catches up on every elapsed cycle at once.
+    while group.payouts_completed_at is None and group.next_payout_date <= now:
+        cycles.append(
+            GroupCycle(
+                group_id=group.pk,
+                number=group.cycle_number,
+                due_date=group.next_payout_date,
+                recipient_id=recipient_for_cycle(rotation, group.cycle_number),
+                opened_at=now,
+                expected_total=group.contribution_amount * len(rotation),
+            )
+        )
+        if group.cycle_number >= group.total_cycles:
+            group.payouts_completed_at = now
+        else:
+            group.cycle_number += 1
+            group.next_payout_date = schedule.advance(group.next_payout_date)
+    return cycles
+
+
+def _process_batch(*, now: datetime, batch_size: int, summary: dict[str, int]) -> int:
+    with transaction.atomic():
+        groups = list(
+            Group.objects.select_for_update(skip_locked=True)
+            .filter(payouts_completed_at__isnull=True, next_payout_date__lte=now)
+            .order_by("next_payout_date", "pk")
+            .only(
+                "id",
+                "frequency",
+                "payout_order",
+                "cycle_number",
+                "total_cycles",
+                "next_payout_date",
+                "contribution_amount",
+            )[:batch_size]
+        )
+        if not groups:
+            return 0
+
+        members: dict[Any, list[Any]] = defaultdict(list)
+        rows = (
+            GroupMembership.objects.filter(group_id__in=[group.pk for group in groups])
+            .order_by("group_id", "joined_at", "pk")
+            .values_list("group_id", "user_id")
+        )
+        for group_id, user_id in rows:
+            members[group_id].append(user_id)
+
+        cycles: list[GroupCycle] = []
+        for group in groups:
+            cycles.extend(
+                _open_due_cycles(
+                    group,
+                    schedule=parse_frequency(group.frequency),
+                    rotation=payout_rotation(group.payout_order, members[group.pk]),
+                    now=now,
+                )
+            )
+            if group.payouts_completed_at is not None:
+                summary["completed"] += 1
+            group.version = F("version") + 1
+            group.updated_at = now
+
+        # The unique (group, number) constraint makes a replayed cycle a no-op.
+        GroupCycle.objects.bulk_create(cycles, ignore_conflicts=True)
+        Group.objects.bulk_update(
+            groups, ["cycle_number", "next_payout_date", "payouts_completed_at", "version", "updated_at"]
+        )
+
+    summary["groups"] += len(groups)
+    summary["cycles_opened"] += len(cycles)
+    return len(groups)
+
+
+def process_due_payouts(*, now: datetime | None = None, batch_size: int | None = None) -> dict[str, int]:
+    """Open every due payout cycle and advance the groups that own them.
+
+    Returns the number of groups advanced, cycles opened and groups whose final
+    cycle was opened during this run.
+    """
+
+    now = now or timezone.now()
+    batch_size = batch_size or int(getattr(settings, "GROUP_PAYOUT_BATCH_SIZE", 500))
+    summary = {"groups": 0, "cycles_opened": 0, "completed": 0}
+    # Each batch commits before the next is claimed; rows locked by another
+    # worker are skipped and a short batch ends the run.
+    while _process_batch(now=now, batch_size=batch_size, summary=summary) == batch_size:
+        pass
+    return summary
@@ -1,18 +1,34 @@
 """Helpers for broadcasting group activity over Channels."""
 from __future__ import annotations
 
+import json
 import logging
+import threading
 import uuid
 from typing import Any
 
+import msgpack
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import connections
+from rest_framework.utils.encoders import JSONEncoder
 
 
 logger = logging.getLogger(__name__)
 
 GROUP_CHANNEL_PREFIX = "group_activity"
 
+BATCH_EVENT = "group.activity.batch"
+
+# Opt-in websocket subprotocol: frames are sent as MessagePack binary messages
+# instead of JSON text.
+MSGPACK_SUBPROTOCOL = "sankofa.msgpack"
+
+# Bursty events that are safe to merge into a single frame. Anything else is
+# delivered immediately so one-off notifications are never delayed.
+COALESCED_EVENT_PREFIXES: tuple[str, ...] = ("group.membership.", "savings.")
+
 
 def group_channel_name(group_id: uuid.UUID | str) -> str:
     """Return the channel-layer group name for a Susu group."""
@@ -21,8 +37,32 @@ def group_channel_name(group_id: uuid.UUID | str) -> str:
 
 
 def broadcast_group_event(*, group_id: uuid.UUID | str, event: str, payload: dict[str, Any]) -> None:
-    """Broadcast a JSON event to all websocket subscribers for the group."""
+    """Broadcast a JSON event to all websocket subscribers for the group.
+
+    When ``GROUP_ACTIVITY_COALESCE_WINDOW_MS`` is positive, membership and savings
+    events are buffered per group and delivered as one ``group.activity.batch``
+    frame at the end of the window.
+    """
+
+    window = _coalesce_window_seconds()
+    if window > 0 and event.startswith(COALESCED_EVENT_PREFIXES):
+        _coalescer.enqueue(group_id=group_id, event=event, payload=payload, window=window)
+        return
+
+    _send_group_event(group_id=group_id, event=event, payload=payload)
+
+
+def flush_group_events(group_id: uuid.UUID | str) -> bool:
+    """Deliver any buffered events for ``group_id`` now. Returns ``True`` if a frame was sent."""
+
+    return _coalescer.flush(group_id)
 
+
+def _coalesce_window_seconds() -> float:
+    return max(int(getattr(settings, "GROUP_ACTIVITY_COALESCE_WINDOW_MS", 0)), 0) / 1000
+
+
+def _send_group_event(*, group_id: uuid.UUID | str, event: str, payload: dict[str, Any]) -> None:
     channel_layer = get_channel_layer()
     if channel_layer is None:  # pragma: no cover - defensive guard for misconfigured layers
         return
@@ -33,8 +73,97 @@ def broadcast_group_event(*, group_id: uuid.UUID | str, event: str, payload: dic
             {
                 "type": "group.activity",
                 "event": event,
-                "payload": payload,
+                "frames": encode_frames(event=event, payload=payload),
             },
         )
     except Exception:  # pragma: no cover - best-effort broadcast shouldn't break request flow
         logger.warning("Failed to broadcast group event", exc_info=True)
+
+
+def encode_frames(*, event: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Encode the websocket envelope once in every supported wire format.
+
+    Consumers forward the pre-encoded frame that matches their negotiated
+    subprotocol, so a broadcast costs one encode per format rather than one per
+    recipient.
+    """
+
+    envelope = {"type": event, "payload": _jsonable(payload)}
+    return {
+        "json": json.dumps(envelope, separators=(",", ":")),
+        "msgpack": msgpack.packb(envelope, use_bin_type=True),
+    }
+
+
+def _jsonable(payload: dict[str, Any]) -> dict[str, Any]:
+    """Reduce serializer output (Decimals, UUIDs, datetimes) to plain JSON types for the channel layer."""
+
+    return json.loads(json.dumps(payload, cls=JSONEncoder))
+
+
+def _build_group_snapshot(group_id: str) -> dict[str, Any] | None:
+    from .payloads import get_group_payload
+
+    return get_group_payload(group_id)
+
+
+class GroupEventCoalescer:
+    """Buffer bursty events per group and flush them as a single batched frame.
+
+    The group snapshot is serialized once per flush rather than once per event,
+    so a contribution window with dozens of members costs one serialization and
+    one channel-layer message per group.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._timers: dict[str, threading.Timer] = {}
+
+    def enqueue(self, *, group_id: uuid.UUID | str, event: str, payload: dict[str, Any], window: float) -> None:
+        key = str(group_id)
+        # The snapshot is rebuilt at flush time, so per-event copies are dropped.
+        entry = {"type": event, "payload": {k: v for k, v in payload.items() if k != "group"}}
+
+        with self._lock:
+            self._pending.setdefault(key, []).append(entry)
+            if key in self._timers:
+                return
+            timer = threading.Timer(window, self._flush_from_timer, args=(key,))
+            timer.daemon = True
+            self._timers[key] = timer
+        timer.start()
+
+    def flush(self, group_id: uuid.UUID | str) -> bool:
+        key = str(group_id)
+        with self._lock:
+            events = self._pending.pop(key, None)
+            timer = self._timers.pop(key, None)
+
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if not events:
+            return False
+
+        try:
+            snapshot = _build_group_snapshot(key)
+        except Exception:  # pragma: no cover - deliver the events even if the snapshot fails
+            logger.warning("Failed to build group snapshot for batched events", exc_info=True)
+            snapshot = None
+
+        _send_group_event(
+            group_id=key,
+            event=BATCH_EVENT,
+            payload={"groupId": key, "group": snapshot, "count": len(events), "events": events},
+        )
+        return True
+
+    def _flush_from_timer(self, key: str) -> None:
+        try:
+            self.flush(key)
+        finally:
+            # Timer threads are short-lived; release the connection they opened.
+            connections.close_all()
+
+
+_coalescer = GroupEventCoalescer()
@@ -0,0 +1,252 @@
+"""Queued invite reminders and the gateways that deliver them."""
+from __future__ import annotations
+
+import json
+import logging
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Group, GroupInvite, GroupInviteReminder
+
+
+logger = logging.getLogger(__name__)
+
+# Claims older than this are assumed to belong to a worker that died mid-send.
+SENDING_TIMEOUT = timedelta(minutes=15)
+
+
+@dataclass(slots=True)
+class ReminderMessage:
+    reminder_id: str
+    channel: str
+    recipient: str
+    name: str
+    group_name: str
+    body: str
+
+
+class BaseReminderGateway:
+    """Deliver a batch of reminder messages that share a channel.
+
+    Implementations raise to mark the whole batch as failed.
+    """
+
+    def send_batch(self, channel: str, messages: list[ReminderMessage]) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class FileReminderGateway(BaseReminderGateway):
+    """Append messages as JSON lines to ``GROUP_REMINDER_OUTBOX_PATH/<channel>.jsonl``.
+
+    Used in development in place of a real SMS or email provider, in the same
+    spirit as Django's file-based email backend.
+    """
+
+    def send_batch(self, channel: str, messages: list[ReminderMessage]) -> None:
+        outbox = Path(getattr(settings, "GROUP_REMINDER_OUTBOX_PATH", settings.BASE_DIR / "sent_reminders"))
+        outbox.mkdir(parents=True, exist_ok=True)
+        with (outbox / f"{channel}.jsonl").open("a", encoding="utf-8") as handle:
+            for message in messages:
+                handle.write(json.dumps(asdict(message)) + "\n")
+
+
+def get_gateway() -> BaseReminderGateway:
+    path = getattr(settings, "GROUP_REMINDER_GATEWAY", "sankofa_backend.apps.groups.reminders.FileReminderGateway")
+    return import_string(path)()
+
+
+def queue_reminders(invites: Iterable[GroupInvite], *, channel: str = GroupInviteReminder.CHANNEL_SMS) -> int:
+    """Queue one reminder per pending invite, skipping invites that already have one queued."""
+
+    invite_ids = [invite.pk for invite in invites if invite.status == GroupInvite.STATUS_PENDING]
+    if not invite_ids:
+        return 0
+
+    already_queued = set(
+        GroupInviteReminder.objects.filter(
+            invite_id__in=invite_ids, status=GroupInviteReminder.STATUS_QUEUED
+        ).values_list("invite_id", flat=True)
+    )
+    reminders = [
+        GroupInviteReminder(invite_id=invite_id, channel=channel)
+        for invite_id in invite_ids
+        if invite_id not in already_queued
+    ]
+    GroupInviteReminder.objects.bulk_create(reminders)
+    return len(reminders)
+
+
+def _message_body(invite: GroupInvite) -> str:
+    return (
+        f"Hi {invite.name}, you have a pending invitation to join {invite.group.name} on Sankofa. "
+        "Open the app to accept or decline."
+    )
+
+
+def _sent_counts(phone_numbers: list[str]) -> dict[str, int]:
+    window = timedelta(hours=int(getattr(settings, "GROUP_REMINDER_RATE_WINDOW_HOURS", 24)))
+    rows = (
+        GroupInviteReminder.objects.filter(
+            # Reminders another worker is still sending count against the limit too.
+            status__in=(GroupInviteReminder.STATUS_SENT, GroupInviteReminder.STATUS_SENDING),
+            sent_at__gte=timezone.now() - window,
+            invite__phone_number__in=phone_numbers,
+        )
+        .order_by()
+        .values("invite__phone_number")
+        .annotate(total=Count("pk"))
+    )
+    return {row["invite__phone_number"]: row["total"] for row in rows}
+
+
+def _email_addresses(phone_numbers: list[str]) -> dict[str, str]:
+    User = get_user_model()
+    return dict(
+        User.objects.filter(phone_number__in=phone_numbers)
+        .exclude(email="")
+        .exclude(email__isnull=True)
+        .values_list("phone_number", "email")
+    )
+
+
+def _claim_batch(
+    batch_size: int, limit: int, now: datetime
+) -> tuple[list[GroupInviteReminder], dict[str, list[tuple[GroupInviteReminder, ReminderMessage]]]]:
+    """Claim queued reminders and commit them as ``sending``; undeliverable ones are settled here."""
+
+    with transaction.atomic():
+        # A worker that died mid-send leaves its claim behind; put it back in the queue.
+        GroupInviteReminder.objects.filter(
+            status=GroupInviteReminder.STATUS_SENDING, sent_at__lt=now - SENDING_TIMEOUT
+        ).update(status=GroupInviteReminder.STATUS_QUEUED, sent_at=None)
+
+        reminders = list(
+            GroupInviteReminder.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("invite__group")
+            .filter(status=GroupInviteReminder.STATUS_QUEUED)
+            .order_by("reminded_at")[:batch_size]
+        )
+        if not reminders:
+            return [], {}
+
+        phone_numbers = sorted({reminder.invite.phone_number for reminder in reminders})
+        sent_counts = _sent_counts(phone_numbers)
+        emails = _email_addresses(phone_numbers)
+
+        by_channel: dict[str, list[tuple[GroupInviteReminder, ReminderMessage]]] = defaultdict(list)
+        for reminder in reminders:
+            invite = reminder.invite
+            if invite.status != GroupInvite.STATUS_PENDING:
+                reminder.status = GroupInviteReminder.STATUS_FAILED
+                reminder.error = "Invite is no longer pending."
+                continue
+            if sent_counts.get(invite.phone_number, 0) >= limit:
+                reminder.status = GroupInviteReminder.STATUS_RATE_LIMITED
+                continue
+
+            recipient = invite.phone_number
+            if reminder.channel == GroupInviteReminder.CHANNEL_EMAIL:
+                recipient = emails.get(invite.phone_number, "")
+                if not recipient:
+                    reminder.status = GroupInviteReminder.STATUS_FAILED
+                    reminder.error = "No email address on file."
+                    continue
+
+            sent_counts[invite.phone_number] = sent_counts.get(invite.phone_number, 0) + 1
+            # ``sent_at`` holds the claim time until the gateway answers.
+            reminder.status = GroupInviteReminder.STATUS_SENDING
+            reminder.sent_at = now
+            by_channel[reminder.channel].append(
+                (
+                    reminder,
+                    ReminderMessage(
+                        reminder_id=str(reminder.pk),
+                        channel=reminder.channel,
+                        recipient=recipient,
+                        name=invite.name,
+                        group_name=invite.group.name,
+                        body=_message_body(invite),
+                    ),
+                )
+            )
+
+        GroupInviteReminder.objects.bulk_update(reminders, ["status", "sent_at", "error"])
+    return reminders, by_channel
+
+
+def _record_outcomes(sending: list[GroupInviteReminder], now: datetime) -> None:
+    with transaction.atomic():
+        GroupInviteReminder.objects.bulk_update(sending, ["status", "sent_at", "error"])
+
+        sent_per_invite: dict[Any, int] = defaultdict(int)
+        group_ids = set()
+        for reminder in sending:
+            if reminder.status == GroupInviteReminder.STATUS_SENT:
+                sent_per_invite[reminder.invite_id] += 1
+                group_ids.add(reminder.invite.group_id)
+        invites_by_total: dict[int, list[Any]] = defaultdict(list)
+        for invite_id, total in sent_per_invite.items():
+            invites_by_total[total].append(invite_id)
+        # Increment in SQL so invite changes made while the gateway was busy are kept.
+        for total, invite_ids in invites_by_total.items():
+            GroupInvite.objects.filter(pk__in=invite_ids).update(
+                reminder_count=F("reminder_count") + total, last_reminded_at=now
+            )
+        if group_ids:
+            # ``update`` skips the invite signals, so bump the group versions here.
+            Group.objects.filter(pk__in=group_ids).update(version=F("version") + 1, updated_at=now)
+
+
+def dispatch_reminders(*, batch_size: int | None = None, gateway: BaseReminderGateway | None = None) -> dict[str, int]:
+    """Deliver one batch of queued reminders.
+
+    Reminders are claimed with ``SKIP LOCKED`` so several workers can drain the
+    queue, rate limited per phone number and committed as ``sending``. The
+    gateway is then called per channel outside any transaction, so no row
+    locks are held while a provider responds. A second short transaction
+    records the outcomes. Returns a summary of outcomes.
+    """
+
+    batch_size = batch_size or int(getattr(settings, "GROUP_REMINDER_BATCH_SIZE", 200))
+    limit = int(getattr(settings, "GROUP_REMINDER_RATE_LIMIT", 3))
+    gateway = gateway or get_gateway()
+    summary = {"sent": 0, "failed": 0, "rate_limited": 0}
+
+    reminders, by_channel = _claim_batch(batch_size, limit, timezone.now())
+    if not reminders:
+        return summary
+
+    now = timezone.now()
+    sending: list[GroupInviteReminder] = []
+    for channel, entries in by_channel.items():
+        try:
+            gateway.send_batch(channel, [message for _, message in entries])
+        except Exception as exc:
+            logger.warning("Reminder gateway failed for channel %s", channel, exc_info=True)
+            for reminder, _ in entries:
+                reminder.status = GroupInviteReminder.STATUS_FAILED
+                reminder.sent_at = None
+                reminder.error = str(exc)[:255]
+                sending.append(reminder)
+            continue
+        for reminder, _ in entries:
+            reminder.status = GroupInviteReminder.STATUS_SENT
+            reminder.sent_at = now
+            sending.append(reminder)
+
+    if sending:
+        _record_outcomes(sending, now)
+
+    for reminder in reminders:
+        summary[reminder.status] += 1
+    return summary
@@ -5,8 +5,10 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Group, GroupInvite, GroupMembership
+from .models import Group, GroupCycle, GroupInvite, GroupMembership
+from .services import create_invites
 from ..accounts.services import get_platform_user
+from ..transactions.models import Transaction
 
 UserModel = get_user_model()
 
@@ -36,7 +38,25 @@ class GroupInviteSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+def parse_field_list(value: str | None) -> set[str]:
+    if not value:
+        return set()
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
 class GroupSerializer(serializers.ModelSerializer):
+    """Full group representation with optional sparse fieldsets.
+
+    ``?fields=`` limits the response to the listed keys. When the view passes
+    ``compact=True`` in the context (the list endpoint), the heavy collections
+    are omitted unless requested through ``?expand=members,invites``.
+    """
+
+    EXPANDABLE_FIELDS = {
+        "members": ("memberIds", "memberNames"),
+        "invites": ("invites",),
+    }
+
     memberIds = serializers.SerializerMethodField()
     memberNames = serializers.SerializerMethodField()
     invites = GroupInviteSerializer(many=True, read_only=True)
@@ -53,6 +73,11 @@ class GroupSerializer(serializers.ModelSerializer):
     payoutOrder = serializers.CharField(source="payout_order")
     isPublic = serializers.BooleanField(source="is_public")
     requiresApproval = serializers.BooleanField(source="requires_approval")
+    memberCount = serializers.IntegerField(source="member_count", read_only=True)
+    pendingInviteCount = serializers.IntegerField(source="pending_invite_count", read_only=True)
+    seatsRemaining = serializers.IntegerField(source="seats_remaining", read_only=True)
+    isMember = serializers.SerializerMethodField()
+    version = serializers.IntegerField(read_only=True)
     createdAt = serializers.DateTimeField(source="created_at")
     updatedAt = serializers.DateTimeField(source="updated_at")
 
@@ -64,6 +89,11 @@ class GroupSerializer(serializers.ModelSerializer):
             "memberIds",
             "memberNames",
             "invites",
+            "memberCount",
+            "pendingInviteCount",
+            "seatsRemaining",
+            "isMember",
+            "version",
             "ownerId",
             "ownerName",
             "ownedByPlatform",
@@ -83,6 +113,37 @@ class GroupSerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        params = getattr(request, "query_params", {})
+
+        if self.context.get("compact"):
+            expanded = parse_field_list(params.get("expand"))
+            for name, field_names in self.EXPANDABLE_FIELDS.items():
+                if name not in expanded:
+                    for field_name in field_names:
+                        self.fields.pop(field_name, None)
+
+        requested = parse_field_list(params.get("fields"))
+        if requested:
+            for field_name in set(self.fields) - requested:
+                self.fields.pop(field_name)
+
+    def get_isMember(self, obj: Group) -> bool:
+        member_group_ids = self.context.get("member_group_ids")
+        if member_group_ids is not None:
+            return obj.pk in member_group_ids
+
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return False
+        memberships = getattr(obj, "_prefetched_members", None)
+        if memberships is not None:
+            return any(membership.user_id == user.pk for membership in memberships)
+        return obj.memberships.filter(user=user).exists()
+
     def get_memberIds(self, obj: Group) -> list[str]:
         memberships = getattr(obj, "_prefetched_members", None) or list(obj.memberships.select_related("user"))
         return [str(m.user_id) for m in memberships]
@@ -122,6 +183,75 @@ class GroupMembershipSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "joined_at")
 
 
+class GroupMemberSerializer(serializers.ModelSerializer):
+    id = serializers.UUIDField(source="user_id", read_only=True)
+    name = serializers.SerializerMethodField()
+    joinedAt = serializers.DateTimeField(source="joined_at")
+
+    class Meta:
+        model = GroupMembership
+        fields = ("id", "name", "joinedAt")
+        read_only_fields = fields
+
+    def get_name(self, obj: GroupMembership) -> str:
+        return obj.display_name or obj.user.full_name or obj.user.phone_number
+
+
+class GroupCycleTotalsSerializer(serializers.ModelSerializer):
+    dueDate = serializers.DateTimeField(source="due_date")
+    recipientId = serializers.UUIDField(source="recipient_id", allow_null=True)
+    expected = serializers.DecimalField(
+        source="expected_total", max_digits=14, decimal_places=2, coerce_to_string=False
+    )
+    collected = serializers.DecimalField(
+        source="collected_total", max_digits=14, decimal_places=2, coerce_to_string=False
+    )
+    paidOut = serializers.DecimalField(source="paid_out_total", max_digits=14, decimal_places=2, coerce_to_string=False)
+    outstanding = serializers.DecimalField(
+        source="outstanding_total", max_digits=14, decimal_places=2, coerce_to_string=False
+    )
+
+    class Meta:
+        model = GroupCycle
+        fields = ("number", "dueDate", "status", "recipientId", "expected", "collected", "paidOut", "outstanding")
+        read_only_fields = fields
+
+
+class GroupLedgerEntrySerializer(serializers.ModelSerializer):
+    """A group money movement as shown to fellow members; wallet balances are omitted."""
+
+    type = serializers.CharField(source="transaction_type")
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, coerce_to_string=False)
+    date = serializers.DateTimeField(source="occurred_at")
+    memberId = serializers.UUIDField(source="user_id")
+    memberName = serializers.SerializerMethodField()
+    cycleNumber = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Transaction
+        fields = ("id", "type", "status", "amount", "description", "date", "memberId", "memberName", "cycleNumber")
+        read_only_fields = fields
+
+    def get_memberName(self, obj: Transaction) -> str:
+        return obj.user.full_name or obj.user.phone_number
+
+    def get_cycleNumber(self, obj: Transaction) -> int | None:
+        return obj.group_cycle.number if obj.group_cycle_id else None
+
+
+class ContactMatchSerializer(serializers.Serializer):
+    phoneNumbers = serializers.ListField(
+        child=serializers.CharField(max_length=64, allow_blank=True, trim_whitespace=False),
+        allow_empty=False,
+    )
+
+    def validate_phoneNumbers(self, value: list[str]) -> list[str]:
+        limit = int(getattr(settings, "GROUP_CONTACT_MATCH_LIMIT", 10000))
+        if len(value) > limit:
+            raise serializers.ValidationError(f"Send at most {limit} phone numbers per request.")
+        return value
+
+
 class GroupInviteCreateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255)
     phoneNumber = serializers.CharField(max_length=32)
@@ -225,11 +355,10 @@ class GroupCreateSerializer(serializers.Serializer):
             joined_at=timezone.now(),
         )
 
-        for invite_data in invites_data:
-            GroupInvite.objects.create(
-                group=group,
-                name=invite_data["name"],
-                phone_number=invite_data["phoneNumber"],
-            )
+        create_invites(
+            group=group,
+            invites=[(invite["name"], invite["phoneNumber"]) for invite in invites_data],
+            actor=user,
+        )
 
         return group
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import re
+from decimal import Decimal
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from ..admin_api.models import AuditLog
+from .models import Group, GroupCycle, GroupInvite, GroupMembership
+
+
+# Mirrors the validator on ``User.phone_number``.
+_VALID_PHONE = re.compile(r"\+233[0-9]{9}")
+
+
+def touch_group(group_id, *, members: int = 0, pending_invites: int = 0) -> None:
+    """Bump the group's version and apply counter deltas with a single ``UPDATE``."""
+
+    updates = {"version": F("version") + 1, "updated_at": timezone.now()}
+    if members:
+        updates["member_count"] = Greatest(F("member_count") + members, 0)
+    if pending_invites:
+        updates["pending_invite_count"] = Greatest(F("pending_invite_count") + pending_invites, 0)
+    Group.objects.filter(pk=group_id).update(**updates)
+
+
+def apply_cycle_totals(
+    cycle_id,
+    *,
+    group_id=None,
+    collected: Decimal = Decimal("0"),
+    paid_out: Decimal = Decimal("0"),
+) -> None:
+    """Add transaction amounts to a cycle's cached totals with a single ``UPDATE``.
+
+    When ``group_id`` is given the group version is bumped too, so caches keyed
+    by version (such as the compliance matrix) see the money movement.
+    """
+
+    updates = {}
+    if collected:
+        updates["collected_total"] = F("collected_total") + collected
+    if paid_out:
+        updates["paid_out_total"] = F("paid_out_total") + paid_out
+    if not updates:
+        return
+    GroupCycle.objects.filter(pk=cycle_id).update(**updates)
+    if group_id is not None:
+        touch_group(group_id)
+
+
+def create_invites(
+    *,
+    group: Group,
+    invites: Iterable[tuple[str, str]],
+    actor=None,
+    audit_action: str = "group.invite.created",
+) -> list[GroupInvite]:
+    """Insert ``(name, phone_number)`` invites for ``group`` in one batch.
+
+    Phone numbers are normalized and de-duplicated in a single pass, numbers
+    that already belong to a member or a pending invite are skipped using one
+    query, and the survivors are written with ``bulk_create``. Counters and the
+    group version are bumped once, and a single audit entry is written when an
+    ``actor`` is given. Returns the created invites.
+    """
+
+    invites = list(invites)
+    normalized = get_user_model().objects.normalize_phones([phone_number for _name, phone_number in invites])
+    candidates: dict[str, str] = {}
+    for (name, _raw), phone_number in zip(invites, normalized):
+        candidates.setdefault(phone_number, name)
+    if not candidates:
+        return []
+
+    phones = list(candidates)
+    pending = (
+        GroupInvite.objects.filter(group=group, status=GroupInvite.STATUS_PENDING, phone_number__in=phones)
+        .order_by()
+        .values_list("phone_number", flat=True)
+    )
+    members = (
+        GroupMembership.objects.filter(group=group, user__phone_number__in=phones)
+        .order_by()
+        .values_list("user__phone_number", flat=True)
+    )
+    existing = set(pending.union(members))
+
+    new_invites = [
+        GroupInvite(group=group, name=name, phone_number=phone_number)
+        for phone_number, name in candidates.items()
+        if phone_number not in existing
+    ]
+    if not new_invites:
+        return []
+
+    with transaction.atomic():
+        created = GroupInvite.objects.bulk_create(new_invites)
+        touch_group(group.pk, pending_invites=len(created))
+        if actor is not None:
+            AuditLog.objects.create(
+                actor=actor,
+                action=audit_action,
+                target_type="groups.Group",
+                target_id=str(group.pk),
+                metadata={"count": len(created)},
+            )
+
+    for invite in created:
+        # ``bulk_create`` skips ``from_db``; record the stored status for the counter signals.
+        invite._loaded_status = invite.status
+    return created
+
+
+def add_member(*, group: Group, user, display_name: str) -> GroupMembership | None:
+    """Claim a seat and create the membership, or return ``None`` if the group is full.
+
+    The capacity check and the counter increment are one conditional ``UPDATE``,
+    so concurrent joins can never push ``member_count`` past the target. Call
+    inside a transaction so the seat is released if the insert fails.
+    """
+
+    reserved = Group.objects.filter(
+        pk=group.pk,
+        member_count__lt=F("target_member_count"),
+    ).update(member_count=F("member_count") + 1, version=F("version") + 1, updated_at=timezone.now())
+    if not reserved:
+        return None
+
+    membership = GroupMembership(group=group, user=user, display_name=display_name)
+    membership._counters_applied = True
+    membership.save(force_insert=True)
+    return membership
+
+
+def _count_subquery(model, **filters) -> Coalesce:
+    counts = (
+        model.objects.filter(group=OuterRef("pk"), **filters)
+        .order_by()
+        .values("group")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def repair_group_counters(group_ids: Iterable | None = None) -> int:
+    """Recompute ``member_count``/``pending_invite_count`` from source rows.
+
+    Returns the number of groups whose stored counters had drifted.
+    """
+
+    queryset = Group.objects.all()
+    if group_ids is not None:
+        queryset = queryset.filter(pk__in=list(group_ids))
+
+    drifted = list(
+        queryset.annotate(
+            actual_members=_count_subquery(GroupMembership),
+            actual_pending=_count_subquery(GroupInvite, status=GroupInvite.STATUS_PENDING),
+        )
+        .filter(~Q(member_count=F("actual_members")) | ~Q(pending_invite_count=F("actual_pending")))
+        .values_list("pk", flat=True)
+    )
+    if drifted:
+        Group.objects.filter(pk__in=drifted).update(
+            member_count=_count_subquery(GroupMembership),
+            pending_invite_count=_count_subquery(GroupInvite, status=GroupInvite.STATUS_PENDING),
+            version=F("version") + 1,
+        )
+    return len(drifted)
+
+
+CONTACT_MEMBER = "member"
+CONTACT_INVITED = "invited"
+CONTACT_UNKNOWN = "unknown"
+CONTACT_INVALID = "invalid"
+
+# Bound on the size of each ``IN (...)`` list sent to the database.
+CONTACT_MATCH_CHUNK_SIZE = 1000
+
+
+def _chunks(values: list[str], size: int) -> Iterable[list[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def match_contacts(*, group: Group, phone_numbers: list[str]) -> list[dict]:
+    """Classify raw contact-book numbers against ``group``.
+
+    Numbers are normalized in one vectorized pass and de-duplicated. They are
+    then resolved in chunked ``IN`` queries against the group's memberships
+    and its pending invites. Each number is classified as ``member``,
+    ``invited``, ``unknown`` or ``invalid``; whether a non-member has an
+    account is not revealed. Results are returned in input order. Only members
+    carry ``userId`` and ``name``.
+    """
+
+    User = get_user_model()
+    normalized = User.objects.normalize_phones(phone_numbers)
+    valid = sorted({phone for phone in normalized if _VALID_PHONE.fullmatch(phone)})
+
+    members: dict[str, tuple] = {}
+    invited: set[str] = set()
+    for chunk in _chunks(valid, CONTACT_MATCH_CHUNK_SIZE):
+        found = GroupMembership.objects.filter(group=group, user__phone_number__in=chunk).values_list(
+            "user__phone_number", "user_id", "user__full_name"
+        )
+        members.update((phone, (user_id, name)) for phone, user_id, name in found)
+        invited.update(
+            GroupInvite.objects.filter(
+                group=group, phone_number__in=chunk, status=GroupInvite.STATUS_PENDING
+            ).values_list("phone_number", flat=True)
+        )
+
+    results = []
+    for raw, phone in zip(phone_numbers, normalized):
+        entry = {"input": raw, "phoneNumber": phone}
+        member = members.get(phone)
+        if not _VALID_PHONE.fullmatch(phone):
+            entry["status"] = CONTACT_INVALID
+        elif member is not None:
+            # Only people already in the group are identified.
+            entry["status"] = CONTACT_MEMBER
+            entry["userId"] = str(member[0])
+            entry["name"] = member[1]
+        elif phone in invited:
+            entry["status"] = CONTACT_INVITED
+        else:
+            entry["status"] = CONTACT_UNKNOWN
+        results.append(entry)
+    return results
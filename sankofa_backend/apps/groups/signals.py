@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from ..transactions.models import Transaction
+from .history import membership_event, record_membership_events
+from .leaderboard import record_contributions
+from .models import Group, GroupInvite, GroupMembership, GroupMembershipEvent
+from .services import apply_cycle_totals, touch_group
+
+
+def _deleting_group(origin) -> bool:
+    # Rows removed by a cascading group delete have no counters left to maintain.
+    if isinstance(origin, QuerySet):
+        return origin.model is Group
+    return isinstance(origin, Group)
+
+
+def _deleting_user(origin) -> bool:
+    User = get_user_model()
+    if isinstance(origin, QuerySet):
+        return origin.model is User
+    return isinstance(origin, User)
+
+
+@receiver(pre_delete, sender=Group)
+def record_group_removal(sender, instance: Group, **_: object) -> None:
+    # The cascaded memberships skip their own events, so the members leave the
+    # history in one insert here, before the rows are gone.
+    now = timezone.now()
+    record_membership_events(
+        membership_event(
+            group_id=instance.pk,
+            user_id=user_id,
+            event_type=GroupMembershipEvent.EVENT_GROUP_DELETED,
+            occurred_at=now,
+        )
+        for user_id in instance.memberships.values_list("user_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=GroupMembership)
+def count_new_membership(sender, instance: GroupMembership, created: bool, **_: object) -> None:
+    if created:
+        event_type = getattr(instance, "_membership_event", GroupMembershipEvent.EVENT_JOINED)
+        membership_event(group_id=instance.group_id, user_id=instance.user_id, event_type=event_type).save()
+    if getattr(instance, "_counters_applied", False):
+        # The seat was already reserved (and the version bumped) by ``services.add_member``.
+        instance._counters_applied = False
+        return
+    touch_group(instance.group_id, members=1 if created else 0)
+
+
+@receiver(post_delete, sender=GroupMembership)
+def count_removed_membership(sender, instance: GroupMembership, origin=None, **_: object) -> None:
+    if _deleting_group(origin):
+        return
+    event_type = getattr(instance, "_membership_event", GroupMembershipEvent.EVENT_LEFT)
+    # The user row is about to go too, so the event cannot point at it.
+    user_id = None if _deleting_user(origin) else instance.user_id
+    membership_event(group_id=instance.group_id, user_id=user_id, event_type=event_type).save()
+    touch_group(instance.group_id, members=-1)
+
+
+@receiver(post_save, sender=GroupInvite)
+def count_invite_status(sender, instance: GroupInvite, created: bool, **_: object) -> None:
+    previous = None if created else getattr(instance, "_loaded_status", None)
+    instance._loaded_status = instance.status
+
+    delta = int(instance.status == GroupInvite.STATUS_PENDING) - int(previous == GroupInvite.STATUS_PENDING)
+    touch_group(instance.group_id, pending_invites=delta)
+
+
+@receiver(post_delete, sender=GroupInvite)
+def count_removed_invite(sender, instance: GroupInvite, origin=None, **_: object) -> None:
+    if _deleting_group(origin):
+        return
+    was_pending = getattr(instance, "_loaded_status", instance.status) == GroupInvite.STATUS_PENDING
+    touch_group(instance.group_id, pending_invites=-1 if was_pending else 0)
+
+
+def _cycle_deltas(instance: Transaction, sign: int) -> dict:
+    if instance.group_cycle_id is None or instance.status != Transaction.STATUS_SUCCESS:
+        return {}
+    if instance.transaction_type == Transaction.TYPE_CONTRIBUTION:
+        return {"collected": instance.amount * sign}
+    if instance.transaction_type == Transaction.TYPE_PAYOUT:
+        return {"paid_out": instance.amount * sign}
+    return {}
+
+
+@receiver(post_save, sender=Transaction)
+def add_to_cycle_totals(sender, instance: Transaction, created: bool, **_: object) -> None:
+    # Ledger entries are written once; ``collection`` applies its bulk inserts itself.
+    deltas = _cycle_deltas(instance, 1) if created else {}
+    if deltas:
+        apply_cycle_totals(instance.group_cycle_id, group_id=instance.group_id, **deltas)
+    if "collected" in deltas and instance.group_id is not None:
+        record_contributions(instance.group_id, instance.group_cycle_id, [(instance.user_id, instance.amount)])
+
+
+@receiver(post_delete, sender=Transaction)
+def remove_from_cycle_totals(sender, instance: Transaction, **_: object) -> None:
+    deltas = _cycle_deltas(instance, -1)
+    if deltas:
+        apply_cycle_totals(instance.group_cycle_id, group_id=instance.group_id, **deltas)
+    if "collected" in deltas and instance.group_id is not None:
+        record_contributions(instance.group_id, instance.group_cycle_id, [(instance.user_id, -instance.amount)])
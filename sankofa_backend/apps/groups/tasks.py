@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from .collection import collect_open_cycles
+from .discovery import refresh_snapshot
+from .history import rollup_membership_events
+from .payouts import process_due_payouts
+from .reminders import dispatch_reminders
+
+
+@shared_task(name="groups.dispatch_invite_reminders")
+def dispatch_invite_reminders(batch_size: int | None = None) -> dict[str, int]:
+    """Drain one batch of queued invite reminders; scheduled by Celery beat."""
+
+    return dispatch_reminders(batch_size=batch_size)
+
+
+@shared_task(name="groups.process_due_payouts")
+def process_group_payouts(batch_size: int | None = None) -> dict[str, int]:
+    """Open due payout cycles and advance their groups; scheduled by Celery beat."""
+
+    return process_due_payouts(batch_size=batch_size)
+
+
+@shared_task(name="groups.collect_cycle_contributions")
+def collect_cycle_contributions(limit: int | None = None) -> dict[str, int]:
+    """Debit members for open payout cycles; scheduled by Celery beat."""
+
+    return collect_open_cycles(limit=limit)
+
+
+@shared_task(name="groups.refresh_discovery_snapshot")
+def refresh_discovery_snapshot() -> int:
+    """Rebuild the public-group discovery snapshot ahead of expiry; scheduled by Celery beat."""
+
+    return len(refresh_snapshot()["groups"])
+
+
+@shared_task(name="groups.rollup_membership_events")
+def rollup_membership_history() -> int:
+    """Fold recent membership events into the daily rollup; scheduled by Celery beat."""
+
+    return rollup_membership_events()
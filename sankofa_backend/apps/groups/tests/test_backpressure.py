@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from django.test import SimpleTestCase, override_settings
+
+from sankofa_backend.apps.groups.backpressure import (
+    POLICY_DISCONNECT,
+    POLICY_DROP_OLDEST,
+    POLICY_RESYNC,
+    BackpressureConfig,
+    RealtimeMetrics,
+    SendQueue,
+)
+
+
+class SendQueueTests(SimpleTestCase):
+    def _fill(self, queue: SendQueue, count: int) -> list[bool]:
+        return [queue.push(index) for index in range(count)]
+
+    def test_drop_oldest_keeps_most_recent_frames(self):
+        queue = SendQueue(BackpressureConfig(max_pending=3, policy=POLICY_DROP_OLDEST))
+        self._fill(queue, 5)
+
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual([queue.pop() for _ in range(len(queue))], [2, 3, 4])
+
+    def test_resync_collapses_backlog_into_marker(self):
+        queue = SendQueue(BackpressureConfig(max_pending=3, policy=POLICY_RESYNC), resync_frame="resync")
+        self._fill(queue, 5)
+
+        self.assertTrue(queue.resync_pending)
+        self.assertEqual(queue.dropped, 5)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.pop(), "resync")
+        self.assertFalse(queue.resync_pending)
+
+        self.assertTrue(queue.push("fresh"))
+        self.assertEqual(queue.pop(), "fresh")
+
+    def test_disconnect_policy_rejects_overflow(self):
+        queue = SendQueue(BackpressureConfig(max_pending=2, policy=POLICY_DISCONNECT))
+
+        self.assertEqual(self._fill(queue, 3), [True, True, False])
+        self.assertEqual(len(queue), 2)
+
+    @override_settings(GROUP_ACTIVITY_SLOW_CONSUMER_POLICY="bogus", GROUP_ACTIVITY_MAX_PENDING_FRAMES=0)
+    def test_config_falls_back_to_safe_defaults(self):
+        config = BackpressureConfig.from_settings()
+
+        self.assertEqual(config.policy, POLICY_RESYNC)
+        self.assertEqual(config.max_pending, 1)
+
+
+class RealtimeMetricsTests(SimpleTestCase):
+    def test_snapshot_reports_depth_and_drops(self):
+        registry = RealtimeMetrics()
+        registry.connection_opened("a")
+        registry.connection_opened("b")
+        registry.record_depth("a", 4)
+        registry.record_depth("b", 1)
+        registry.record_dropped(3, resync=True)
+        registry.record_slow_disconnect()
+        registry.connection_closed("b")
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["connections"], 1)
+        self.assertEqual(snapshot["queued_frames"], 4)
+        self.assertEqual(snapshot["max_queue_depth"], 4)
+        self.assertEqual(snapshot["frames_dropped"], 3)
+        self.assertEqual(snapshot["resyncs"], 1)
+        self.assertEqual(snapshot["slow_consumer_disconnects"], 1)
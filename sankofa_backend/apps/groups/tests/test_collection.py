@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from sankofa_backend.apps.groups.collection import collect_cycle, collect_open_cycles
+from sankofa_backend.apps.groups.models import Group, GroupCycle, GroupMembership
+from sankofa_backend.apps.transactions.models import Transaction, Wallet
+
+User = get_user_model()
+
+
+class CycleCollectionTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.group = Group.objects.create(
+            name="Collection Circle",
+            frequency="Weekly",
+            contribution_amount="50.00",
+            target_member_count=4,
+            total_cycles=4,
+            next_payout_date=self.now + timedelta(days=7),
+        )
+        self.platform = Wallet.objects.ensure_platform()
+        self.platform.balance = Decimal("1000.00")
+        self.platform.save(update_fields=["balance"])
+        self.members = []
+        for index, balance in enumerate(["80.00", "50.00", "20.00", None]):
+            user = User.objects.create_user(phone_number=f"02410000{index:02d}", full_name=f"Member {index}")
+            GroupMembership.objects.create(group=self.group, user=user, display_name=user.full_name)
+            # Users get a wallet on creation; the last member is left without one.
+            if balance is None:
+                Wallet.objects.filter(user=user).delete()
+            else:
+                Wallet.objects.filter(user=user).update(balance=Decimal(balance))
+            self.members.append(user)
+        self.cycle = GroupCycle.objects.create(
+            group=self.group, number=1, due_date=self.now, recipient=self.members[0]
+        )
+
+    def test_debits_funded_members_and_reports_shortfalls(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = collect_cycle(self.cycle.pk, now=self.now)
+        query_count = len(queries)
+
+        self.assertEqual(result.collected_count, 2)
+        self.assertEqual(result.collected_total, Decimal("100.00"))
+        self.assertEqual(
+            {(shortfall.user_id, shortfall.missing) for shortfall in result.shortfalls},
+            {(self.members[2].pk, Decimal("30.00")), (self.members[3].pk, Decimal("50.00"))},
+        )
+        self.assertFalse(result.is_complete)
+
+        balances = dict(Wallet.objects.filter(user__in=self.members).values_list("user_id", "balance"))
+        self.assertEqual(balances[self.members[0].pk], Decimal("30.00"))
+        self.assertEqual(balances[self.members[1].pk], Decimal("0.00"))
+        self.assertEqual(balances[self.members[2].pk], Decimal("20.00"))
+        self.platform.refresh_from_db()
+        self.assertEqual(self.platform.balance, Decimal("1100.00"))
+
+        contributions = Transaction.objects.filter(group_cycle=self.cycle)
+        self.assertEqual(contributions.count(), 2)
+        self.assertTrue(all(tx.transaction_type == Transaction.TYPE_CONTRIBUTION for tx in contributions))
+        self.assertTrue(all(tx.group_id == self.group.pk for tx in contributions))
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.status, GroupCycle.STATUS_OPEN)
+        self.assertEqual(self.cycle.collected_total, Decimal("100.00"))
+
+        # Adding members must not add per-member queries.
+        for index in range(4, 10):
+            user = User.objects.create_user(phone_number=f"02410000{index:02d}", full_name=f"Member {index}")
+            GroupMembership.objects.create(group=self.group, user=user, display_name=user.full_name)
+            Wallet.objects.filter(user=user).update(balance=Decimal("60.00"))
+        with CaptureQueriesContext(connection) as queries:
+            collect_cycle(self.cycle.pk, now=self.now)
+        self.assertEqual(len(queries), query_count)
+
+    def test_retry_only_charges_shortfalls_and_closes_cycle(self):
+        collect_cycle(self.cycle.pk, now=self.now)
+        Wallet.objects.filter(user=self.members[2]).update(balance=Decimal("75.00"))
+        Wallet.objects.create(user=self.members[3], balance=Decimal("50.00"))
+
+        summary = collect_open_cycles(now=self.now)
+
+        self.assertEqual(summary, {"cycles": 1, "completed": 1, "collected": 2, "shortfalls": 0})
+        self.assertEqual(Transaction.objects.filter(group_cycle=self.cycle).count(), 4)
+        self.assertEqual(Wallet.objects.get(user=self.members[0]).balance, Decimal("30.00"))
+        self.cycle.refresh_from_db()
+        self.assertEqual(self.cycle.status, GroupCycle.STATUS_COLLECTED)
+        self.assertIsNone(collect_cycle(self.cycle.pk, now=self.now))
+
+    def test_cycles_stuck_on_shortfalls_do_not_starve_newer_cycles(self):
+        GroupCycle.objects.filter(pk=self.cycle.pk).update(due_date=self.now - timedelta(days=1))
+        stuck = [self.cycle] + [
+            GroupCycle.objects.create(group=self.group, number=number, due_date=self.now - timedelta(days=number))
+            for number in (2, 3)
+        ]
+        funded_group = Group.objects.create(
+            name="Funded Circle",
+            frequency="Weekly",
+            contribution_amount="10.00",
+            next_payout_date=self.now + timedelta(days=7),
+        )
+        GroupMembership.objects.create(group=funded_group, user=self.members[0], display_name="Member 0")
+        newest = GroupCycle.objects.create(group=funded_group, number=1, due_date=self.now)
+
+        # The stuck cycles fill the first batch and stay open.
+        self.assertEqual(collect_open_cycles(limit=3, now=self.now)["completed"], 0)
+        self.assertEqual(GroupCycle.objects.filter(pk__in=[cycle.pk for cycle in stuck], status=GroupCycle.STATUS_OPEN).count(), 3)
+
+        later = self.now + timedelta(hours=1)
+        self.assertEqual(collect_open_cycles(limit=3, now=later)["completed"], 1)
+        newest.refresh_from_db()
+        self.assertEqual((newest.status, newest.collection_attempted_at), (GroupCycle.STATUS_COLLECTED, later))
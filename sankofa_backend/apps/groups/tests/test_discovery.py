@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sankofa_backend.apps.groups import discovery
+from sankofa_backend.apps.groups.models import Group, GroupMembership
+
+User = get_user_model()
+
+
+class GroupDiscoveryTests(APITestCase):
+    def setUp(self) -> None:
+        cache.delete_many([discovery.SNAPSHOT_CACHE_KEY, discovery.REBUILD_LOCK_KEY])
+        self.addCleanup(cache.delete_many, [discovery.SNAPSHOT_CACHE_KEY, discovery.REBUILD_LOCK_KEY])
+        self.user = User.objects.create_user(phone_number="0240000000", full_name="Test User")
+        self.client.force_authenticate(self.user)
+        self.url = reverse("groups:group-discover")
+
+    def _create_group(self, name: str, **overrides) -> Group:
+        defaults = {
+            "name": name,
+            "frequency": "Weekly",
+            "location": "Accra",
+            "is_public": True,
+            "target_member_count": 5,
+            "contribution_amount": "100.00",
+            "next_payout_date": timezone.now() + timedelta(days=7),
+        }
+        defaults.update(overrides)
+        return Group.objects.create(**defaults)
+
+    def test_filters_snapshot_by_location_frequency_and_band(self):
+        weekly = self._create_group("Accra Weekly", frequency="Weekly contributions")
+        self._create_group("Kumasi Monthly", frequency="Monthly", location="Kumasi", contribution_amount="400.00")
+        self._create_group("Accra Premium", contribution_amount="900.00")
+        self._create_group("Private Circle", is_public=False)
+        GroupMembership.objects.create(group=weekly, user=self.user, display_name="Self")
+
+        everything = self.client.get(self.url).json()
+        self.assertEqual(everything["count"], 3)
+
+        response = self.client.get(
+            self.url, {"location": "accra", "frequency": "weekly", "max_contribution": "500"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual([group["name"] for group in results], ["Accra Weekly"])
+        self.assertTrue(results[0]["isMember"])
+        self.assertEqual(results[0]["seatsRemaining"], 4)
+        self.assertNotIn("_scheduleKey", results[0])
+
+        band = self.client.get(self.url, {"min_contribution": "300", "max_contribution": "500"}).json()
+        self.assertEqual([group["name"] for group in band["results"]], ["Kumasi Monthly"])
+
+        invalid = self.client.get(self.url, {"min_contribution": "lots"})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requests_are_served_from_snapshot_until_refresh(self):
+        self._create_group("Early Circle")
+        self.client.get(self.url)
+        self._create_group("Late Circle")
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(self.url).json()
+        self.assertEqual([group["name"] for group in cached["results"]], ["Early Circle"])
+        self.assertFalse(any('"groups_group"' in query["sql"] for query in queries.captured_queries))
+
+        discovery.refresh_snapshot()
+        refreshed = self.client.get(self.url).json()
+        self.assertEqual(refreshed["count"], 2)
+
+    def test_stale_snapshot_is_rebuilt_by_lock_holder_only(self):
+        self._create_group("Early Circle")
+        stale = discovery.refresh_snapshot()
+        stale["builtAt"] = time.time() - 3600
+        cache.set(discovery.SNAPSHOT_CACHE_KEY, stale, 60)
+        self._create_group("Late Circle")
+
+        # Another worker is rebuilding: keep serving the stale copy without querying.
+        cache.add(discovery.REBUILD_LOCK_KEY, True, 30)
+        with CaptureQueriesContext(connection) as queries:
+            snapshot = discovery.get_snapshot()
+        self.assertEqual(len(snapshot["groups"]), 1)
+        self.assertFalse(any('"groups_group"' in query["sql"] for query in queries.captured_queries))
+
+        cache.delete(discovery.REBUILD_LOCK_KEY)
+        self.assertEqual(len(discovery.get_snapshot()["groups"]), 2)
+        self.assertIsNone(cache.get(discovery.REBUILD_LOCK_KEY))
+
+    def test_missing_snapshot_waits_for_concurrent_rebuild(self):
+        self._create_group("Only Circle")
+        cache.add(discovery.REBUILD_LOCK_KEY, True, 30)
+
+        with patch.object(discovery, "REBUILD_WAIT_SECONDS", 0.01):
+            snapshot = discovery.get_snapshot()
+
+        self.assertEqual(len(snapshot["groups"]), 1)
+        # The fallback build is not cached, so the lock holder's result wins.
+        self.assertIsNone(cache.get(discovery.SNAPSHOT_CACHE_KEY))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from decimal import Decimal
 
+import msgpack
 from asgiref.sync import async_to_sync, sync_to_async
 from channels.testing import WebsocketCommunicator
 from django.contrib.auth import get_user_model
@@ -10,8 +13,41 @@ from django.utils import timezone
 from rest_framework_simplejwt.tokens import AccessToken
 
 from core.asgi import application
+from sankofa_backend.apps.groups.backpressure import RESYNC_EVENT, SLOW_CONSUMER_CLOSE_CODE
+from sankofa_backend.apps.groups.consumers import GroupActivityConsumer
 from sankofa_backend.apps.groups.models import Group, GroupMembership
-from sankofa_backend.apps.groups.realtime import broadcast_group_event, group_channel_name
+from sankofa_backend.apps.groups.realtime import (
+    BATCH_EVENT,
+    MSGPACK_SUBPROTOCOL,
+    broadcast_group_event,
+    flush_group_events,
+    group_channel_name,
+)
+
+
+class SlowClientConsumer(GroupActivityConsumer):
+    """A client that stops reading: every socket write waits for ``gate``."""
+
+    gate: asyncio.Event
+    instance: "SlowClientConsumer | None" = None
+    stalled = False
+
+    async def connect(self) -> None:
+        await super().connect()
+        type(self).instance = self
+
+    async def send(self, *args, **kwargs) -> None:
+        self.stalled = True
+        await self.gate.wait()
+        await super().send(*args, **kwargs)
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached before the timeout.")
+        await asyncio.sleep(0.005)
 
 
 @override_settings(
@@ -76,6 +112,123 @@ class GroupActivityConsumerTests(TransactionTestCase):
         self.assertEqual(response["type"], "group.test")
         self.assertEqual(response["payload"], payload)
 
+    def test_msgpack_subprotocol_receives_binary_frames(self):
+        token = self._build_token(self.user)
+
+        async def scenario():
+            communicator = WebsocketCommunicator(
+                application,
+                f"/ws/groups/{self.group.id}/?token={token}",
+                subprotocols=[MSGPACK_SUBPROTOCOL],
+            )
+            connected, subprotocol = await communicator.connect()
+            self.assertTrue(connected)
+            self.assertEqual(subprotocol, MSGPACK_SUBPROTOCOL)
+
+            await sync_to_async(broadcast_group_event, thread_sensitive=True)(
+                group_id=self.group.id,
+                event="group.test",
+                payload={"amount": Decimal("10.50")},
+            )
+
+            response = await communicator.receive_output()
+            await communicator.disconnect()
+            return response
+
+        response = async_to_sync(scenario)()
+        self.assertIsNone(response.get("text"))
+        frame = msgpack.unpackb(response["bytes"])
+        self.assertEqual(frame, {"type": "group.test", "payload": {"amount": 10.5}})
+
+    @override_settings(GROUP_ACTIVITY_COALESCE_WINDOW_MS=60_000)
+    def test_bursty_events_are_coalesced_into_one_frame(self):
+        token = self._build_token(self.user)
+
+        async def scenario():
+            communicator = WebsocketCommunicator(
+                application, f"/ws/groups/{self.group.id}/?token={token}"
+            )
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+
+            broadcast = sync_to_async(broadcast_group_event, thread_sensitive=True)
+            for index in range(3):
+                await broadcast(
+                    group_id=self.group.id,
+                    event="savings.contribution.recorded",
+                    payload={"group": {"stale": True}, "member": {"id": str(index)}},
+                )
+            self.assertTrue(await communicator.receive_nothing())
+
+            flushed = await sync_to_async(flush_group_events, thread_sensitive=True)(self.group.id)
+            self.assertTrue(flushed)
+
+            response = await communicator.receive_json_from()
+            self.assertTrue(await communicator.receive_nothing())
+            await communicator.disconnect()
+            return response
+
+        response = async_to_sync(scenario)()
+        self.assertEqual(response["type"], BATCH_EVENT)
+        payload = response["payload"]
+        self.assertEqual(payload["count"], 3)
+        self.assertEqual(payload["group"]["name"], "Evening Susu")
+        self.assertEqual([event["payload"]["member"]["id"] for event in payload["events"]], ["0", "1", "2"])
+        self.assertNotIn("group", payload["events"][0]["payload"])
+
+    async def _stall_slow_client(self):
+        """Connect a slow client and leave its writer stuck on the first frame."""
+
+        consumer_class = type("StalledClient", (SlowClientConsumer,), {"gate": asyncio.Event()})
+        communicator = WebsocketCommunicator(consumer_class.as_asgi(), f"/ws/groups/{self.group.id}/")
+        communicator.scope["user"] = self.user
+        communicator.scope["url_route"] = {"kwargs": {"group_id": self.group.id}}
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+
+        broadcast = sync_to_async(broadcast_group_event, thread_sensitive=True)
+        await broadcast(group_id=self.group.id, event="group.test", payload={"sequence": 0})
+        await wait_until(lambda: consumer_class.instance is not None and consumer_class.instance.stalled)
+        return communicator, consumer_class, broadcast
+
+    @override_settings(GROUP_ACTIVITY_MAX_PENDING_FRAMES=2, GROUP_ACTIVITY_SLOW_CONSUMER_POLICY="resync")
+    def test_slow_client_receives_a_resync_frame_after_overflow(self):
+        async def scenario():
+            communicator, consumer_class, broadcast = await self._stall_slow_client()
+            consumer = consumer_class.instance
+            for sequence in range(1, 5):
+                await broadcast(group_id=self.group.id, event="group.test", payload={"sequence": sequence})
+            # Frames 1-3 overflow into the resync marker; frame 4 is dropped behind it.
+            await wait_until(lambda: consumer.outbox.dropped == 4)
+            self.assertTrue(consumer.outbox.resync_pending)
+            self.assertEqual(len(consumer.outbox), 1)
+
+            consumer_class.gate.set()
+            frames = [await communicator.receive_json_from() for _ in range(2)]
+            await broadcast(group_id=self.group.id, event="group.test", payload={"sequence": 5})
+            frames.append(await communicator.receive_json_from())
+            await communicator.disconnect()
+            return frames
+
+        stuck, resync, fresh = async_to_sync(scenario)()
+        self.assertEqual(stuck["payload"], {"sequence": 0})
+        # The overflowed backlog collapses into one marker telling the client to refetch.
+        self.assertEqual(resync, {"type": RESYNC_EVENT, "payload": {"groupId": str(self.group.id)}})
+        self.assertEqual(fresh["payload"], {"sequence": 5})
+
+    @override_settings(GROUP_ACTIVITY_MAX_PENDING_FRAMES=2, GROUP_ACTIVITY_SLOW_CONSUMER_POLICY="disconnect")
+    def test_slow_client_is_closed_with_4408_when_policy_disconnects(self):
+        async def scenario():
+            communicator, _consumer_class, broadcast = await self._stall_slow_client()
+            for sequence in range(1, 4):
+                await broadcast(group_id=self.group.id, event="group.test", payload={"sequence": sequence})
+            closed = await communicator.receive_output()
+            await communicator.wait()
+            return closed
+
+        closed = async_to_sync(scenario)()
+        self.assertEqual(closed, {"type": "websocket.close", "code": SLOW_CONSUMER_CLOSE_CODE})
+
     def test_non_members_are_rejected(self):
         token = self._build_token(self.other_user)
 
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import json
 from decimal import Decimal
 from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import PropertyMock, patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from sankofa_backend.apps.groups.models import Group, GroupInvite, GroupMembership
+from sankofa_backend.apps.admin_api.models import AuditLog
+from sankofa_backend.apps.groups.collection import collect_cycle
+from sankofa_backend.apps.groups.models import Group, GroupCycle, GroupInvite, GroupInviteReminder, GroupMembership
+from sankofa_backend.apps.groups.reminders import BaseReminderGateway, dispatch_reminders
+from sankofa_backend.apps.groups.services import create_invites
+from sankofa_backend.apps.groups.views import ContactMatchThrottle
+from sankofa_backend.apps.transactions.models import Transaction, Wallet
 
 User = get_user_model()
 
@@ -40,14 +55,16 @@ class GroupAPITests(APITestCase):
         defaults.setdefault("owner", None if defaults.get("is_public") else self.user)
         return Group.objects.create(**defaults)
 
-    def test_list_returns_member_and_public_groups(self):
-        group_member = self._create_group(name="Member Circle")
+    def test_list_returns_member_and_owned_groups_only(self):
+        organizer = User.objects.create_user(phone_number="0241111113", full_name="Organizer")
+        group_member = self._create_group(name="Member Circle", owner=organizer)
         GroupMembership.objects.create(
             group=group_member,
             user=self.user,
             display_name=self.user.full_name,
         )
 
+        self._create_group(name="Owned Circle")
         group_public = self._create_group(name="Public Circle", is_public=True)
         GroupInvite.objects.create(
             group=group_public,
@@ -57,20 +74,201 @@ class GroupAPITests(APITestCase):
         )
 
         url = reverse("groups:group-list")
-        response = self.client.get(url)
+        response = self.client.get(url, {"expand": "members,invites"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         payload = response.json()
-        self.assertEqual(len(payload), 2)
+        self.assertEqual([item["name"] for item in payload], ["Member Circle", "Owned Circle"])
 
-        member_group = next(item for item in payload if item["name"] == "Member Circle")
+        member_group = payload[0]
         self.assertIn(str(self.user.id), member_group["memberIds"])
         self.assertIn(self.user.full_name, member_group["memberNames"])
-        self.assertEqual(member_group["ownerId"], str(self.user.id))
+        self.assertEqual(member_group["ownerId"], str(organizer.id))
+        self.assertEqual(payload[1]["ownerId"], str(self.user.id))
+
+        # Public groups the user has not joined are still open to them, and
+        # are browsed through discovery.
+        detail = self.client.get(reverse("groups:group-detail", kwargs={"pk": group_public.pk})).json()
+        self.assertEqual(detail["invites"][0]["name"], "Ama Darko")
+        self.assertTrue(detail["isPublic"])
+        self.assertTrue(detail["ownedByPlatform"])
+
+    def test_list_defaults_to_compact_shape(self):
+        group = self._create_group(name="Compact Circle", is_public=True)
+        GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
+        GroupInvite.objects.create(group=group, name="Ama", phone_number="+233200000002")
+
+        payload = self.client.get(reverse("groups:group-list")).json()
+
+        item = payload[0]
+        self.assertNotIn("invites", item)
+        self.assertNotIn("memberIds", item)
+        self.assertEqual(item["memberCount"], 1)
+        self.assertEqual(item["pendingInviteCount"], 1)
+        self.assertEqual(item["seatsRemaining"], 4)
+        self.assertTrue(item["isMember"])
+
+        sparse = self.client.get(reverse("groups:group-list"), {"fields": "id,name,memberCount"}).json()
+        self.assertEqual(set(sparse[0]), {"id", "name", "memberCount"})
+
+    def test_members_and_invites_sub_resources_are_paginated(self):
+        group = self._create_group(name="Paged Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name="Self")
+        for index in range(3):
+            GroupInvite.objects.create(group=group, name=f"Invitee {index}", phone_number=f"+23320000010{index}")
+
+        members = self.client.get(reverse("groups:group-members", kwargs={"pk": group.pk})).json()
+        self.assertEqual(members["count"], 1)
+        self.assertEqual(members["results"][0]["id"], str(self.user.id))
+        self.assertEqual(members["results"][0]["name"], "Self")
+
+        invites_url = reverse("groups:group-invites", kwargs={"pk": group.pk})
+        invites = self.client.get(invites_url, {"page_size": 2}).json()
+        self.assertEqual(invites["count"], 3)
+        self.assertEqual(len(invites["results"]), 2)
+        self.assertIsNotNone(invites["next"])
+
+    def test_ledger_pages_by_cursor_and_reports_cycle_totals(self):
+        group = self._create_group(name="Ledger Circle", contribution_amount="50.00")
+        GroupMembership.objects.create(group=group, user=self.user, display_name="Self")
+        other_user = User.objects.create_user(phone_number="0241111111", full_name="Kwame")
+        GroupMembership.objects.create(group=group, user=other_user, display_name="Kwame")
+        Wallet.objects.ensure_platform()
+        Wallet.objects.filter(user__in=[self.user, other_user]).update(balance=Decimal("80.00"))
+        cycle = GroupCycle.objects.create(
+            group=group, number=1, due_date=timezone.now(), recipient=self.user, expected_total=Decimal("100.00")
+        )
+        collect_cycle(cycle.pk)
+        Transaction.objects.create(
+            user=self.user,
+            transaction_type=Transaction.TYPE_PAYOUT,
+            status=Transaction.STATUS_SUCCESS,
+            amount=Decimal("60.00"),
+            description="Cycle payout",
+            occurred_at=timezone.now() + timedelta(minutes=1),
+            group=group,
+            group_cycle=cycle,
+        )
+
+        url = reverse("groups:group-ledger", kwargs={"pk": group.pk})
+        first = self.client.get(url, {"page_size": 2}).json()
+        self.assertEqual([entry["type"] for entry in first["results"]], ["payout", "contribution"])
+        self.assertNotIn("balanceAfter", first["results"][0])
+        self.assertEqual(first["results"][1]["cycleNumber"], 1)
+        self.assertEqual(
+            first["cycles"],
+            [
+                {
+                    "number": 1,
+                    "dueDate": first["cycles"][0]["dueDate"],
+                    "status": GroupCycle.STATUS_COLLECTED,
+                    "recipientId": str(self.user.id),
+                    "expected": 100.0,
+                    "collected": 100.0,
+                    "paidOut": 60.0,
+                    "outstanding": 0.0,
+                }
+            ],
+        )
 
-        public_group = next(item for item in payload if item["name"] == "Public Circle")
-        self.assertEqual(public_group["invites"][0]["name"], "Ama Darko")
-        self.assertTrue(public_group["isPublic"])
-        self.assertTrue(public_group["ownedByPlatform"])
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+        seen = {entry["id"] for entry in first["results"] + second["results"]}
+        self.assertEqual(len(seen), 3)
+
+        public_group = self._create_group(name="Open Ledger", is_public=True)
+        response = self.client.get(reverse("groups:group-ledger", kwargs={"pk": public_group.pk}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_compliance_matrix_flags_paid_late_and_missing(self):
+        now = timezone.now()
+        group = self._create_group(name="Compliance Circle", contribution_amount="50.00")
+        GroupMembership.objects.create(
+            group=group, user=self.user, display_name="Self", joined_at=now - timedelta(days=30)
+        )
+        latecomer = User.objects.create_user(phone_number="0241111111", full_name="Kwame")
+        GroupMembership.objects.create(
+            group=group, user=latecomer, display_name="Kwame", joined_at=now - timedelta(days=10)
+        )
+        first = GroupCycle.objects.create(group=group, number=1, due_date=now - timedelta(days=14))
+        second = GroupCycle.objects.create(group=group, number=2, due_date=now - timedelta(days=7))
+
+        def contribute(user, cycle, *, delay):
+            Transaction.objects.create(
+                user=user,
+                transaction_type=Transaction.TYPE_CONTRIBUTION,
+                status=Transaction.STATUS_SUCCESS,
+                amount=Decimal("50.00"),
+                description="Contribution",
+                occurred_at=cycle.due_date + delay,
+                group=group,
+                group_cycle=cycle,
+            )
+
+        contribute(self.user, first, delay=timedelta(hours=1))
+        contribute(latecomer, second, delay=timedelta(days=4))
+
+        url = reverse("groups:group-compliance", kwargs={"pk": group.pk})
+        report = self.client.get(url).json()
+
+        self.assertEqual([cycle["expectedCount"] for cycle in report["cycles"]], [1, 2])
+        self.assertEqual([cycle["collectionRate"] for cycle in report["cycles"]], [1.0, 0.5])
+        members = {member["name"]: member for member in report["members"]}
+        self.assertEqual(members["Self"]["cycles"], ["paid", "missing"])
+        self.assertEqual(members["Self"]["punctuality"], 0.5)
+        self.assertEqual(members["Kwame"]["cycles"], ["not_member", "late"])
+        self.assertEqual(members["Kwame"]["punctuality"], 0.0)
+        self.assertEqual(members["Kwame"]["lateCount"], 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).json(), report)
+        self.assertFalse(any("transactions_transaction" in query["sql"] for query in queries.captured_queries))
+
+        self.client.force_authenticate(latecomer)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_contact_matching_classifies_numbers_in_chunked_queries(self):
+        group = self._create_group(name="Contacts Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name="Self")
+        User.objects.create_user(phone_number="+233241111111", full_name="Kwame")
+        GroupInvite.objects.create(group=group, name="Ama", phone_number="+233242222222")
+        contacts = ["024 000 0000", "0241111111", "+233242222222", "0243333333", "12345"]
+        contacts += [f"05{index:08d}" for index in range(5000)]
+
+        url = reverse("groups:group-contacts-match", kwargs={"pk": group.pk})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, {"phoneNumbers": contacts}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            [entry["status"] for entry in results[:5]], ["member", "unknown", "invited", "unknown", "invalid"]
+        )
+        self.assertEqual(results[0]["phoneNumber"], "+233240000000")
+        self.assertEqual(results[0]["userId"], str(self.user.id))
+        # Non-members with an account look the same as numbers with none.
+        self.assertEqual(set(results[1]), set(results[3]))
+        self.assertEqual(response.json()["counts"]["unknown"], 5002)
+        # One membership and one invite query per chunk of numbers.
+        self.assertLess(len(queries), 20)
+
+        outsider = User.objects.create_user(phone_number="+233249999999", full_name="Outsider")
+        self.client.force_authenticate(outsider)
+        forbidden = self.client.post(url, {"phoneNumbers": ["0240000000"]}, format="json")
+        self.assertEqual(forbidden.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_contact_matching_is_rate_limited_per_user(self):
+        group = self._create_group(name="Throttled Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name="Self")
+        url = reverse("groups:group-contacts-match", kwargs={"pk": group.pk})
+        cache.clear()
+
+        with patch.object(ContactMatchThrottle, "THROTTLE_RATES", {"group_contacts_match": "1/hour"}):
+            first = self.client.post(url, {"phoneNumbers": ["0241111111"]}, format="json")
+            second = self.client.post(url, {"phoneNumbers": ["0242222222"]}, format="json")
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
 
     def test_join_public_group_adds_membership(self):
         other_user = User.objects.create_user(phone_number="0241111111", full_name="Kwame")
@@ -221,12 +419,99 @@ class GroupAPITests(APITestCase):
 
         url = reverse("groups:group-remind-invite", kwargs={"pk": group.pk, "invite_id": invite.pk})
         response = self.client.post(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(invite.reminders.get().status, GroupInviteReminder.STATUS_QUEUED)
 
+        with TemporaryDirectory() as outbox, self.settings(GROUP_REMINDER_OUTBOX_PATH=outbox):
+            summary = dispatch_reminders()
+            sent_lines = (Path(outbox) / "sms.jsonl").read_text().splitlines()
+
+        self.assertEqual(summary["sent"], 1)
+        self.assertEqual(json.loads(sent_lines[0])["recipient"], "+233200000010")
         invite.refresh_from_db()
         self.assertIsNotNone(invite.last_reminded_at)
         self.assertEqual(invite.reminder_count, 1)
 
+    @override_settings(GROUP_REMINDER_RATE_LIMIT=1)
+    def test_remind_all_queues_pending_invites_and_rate_limits_per_phone(self):
+        group = self._create_group(name="Remind All Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
+        for index in range(3):
+            GroupInvite.objects.create(group=group, name=f"Invitee {index}", phone_number=f"+23320000070{index}")
+        GroupInvite.objects.create(
+            group=group, name="Done", phone_number="+233200000709", status=GroupInvite.STATUS_ACCEPTED
+        )
+        url = reverse("groups:group-remind-all-invites", kwargs={"pk": group.pk})
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()["queued"], 3)
+        self.assertEqual(self.client.post(url).json()["queued"], 0)
+
+        with TemporaryDirectory() as outbox, self.settings(GROUP_REMINDER_OUTBOX_PATH=outbox):
+            self.assertEqual(dispatch_reminders()["sent"], 3)
+            self.client.post(url)
+            self.assertEqual(dispatch_reminders()["rate_limited"], 3)
+
+        self.assertEqual(
+            GroupInvite.objects.filter(group=group, reminder_count=1).count(),
+            3,
+        )
+
+    def test_only_organizers_can_send_reminders(self):
+        organizer = User.objects.create_user(phone_number="0241111112", full_name="Organizer")
+        private_group = self._create_group(name="Someone Else's Circle", owner=organizer)
+        GroupMembership.objects.create(group=private_group, user=self.user, display_name=self.user.full_name)
+        public_group = self._create_group(name="Open Circle", is_public=True)
+        for group in (private_group, public_group):
+            invite = GroupInvite.objects.create(group=group, name="Invitee", phone_number="+233200000720")
+            for url in (
+                reverse("groups:group-remind-all-invites", kwargs={"pk": group.pk}),
+                reverse("groups:group-remind-invite", kwargs={"pk": group.pk, "invite_id": invite.pk}),
+            ):
+                self.assertEqual(self.client.post(url).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(GroupInviteReminder.objects.exists())
+
+    def test_dispatch_commits_claims_before_calling_the_gateway(self):
+        group = self._create_group(name="Gateway Circle", is_public=False)
+        sms_invite = GroupInvite.objects.create(group=group, name="Sms", phone_number="+233200000810")
+        email_invite = GroupInvite.objects.create(group=group, name="Mail", phone_number="+233200000811")
+        User.objects.create_user(phone_number="+233200000811", full_name="Mail", email="mail@example.com")
+        GroupInviteReminder.objects.create(invite=sms_invite)
+        GroupInviteReminder.objects.create(invite=email_invite, channel=GroupInviteReminder.CHANNEL_EMAIL)
+        seen_statuses = []
+
+        class RecordingGateway(BaseReminderGateway):
+            def send_batch(self, channel, messages):
+                seen_statuses.extend(
+                    GroupInviteReminder.objects.filter(pk__in=[m.reminder_id for m in messages]).values_list(
+                        "status", flat=True
+                    )
+                )
+                if channel == GroupInviteReminder.CHANNEL_EMAIL:
+                    raise RuntimeError("provider down")
+
+        summary = dispatch_reminders(gateway=RecordingGateway())
+
+        self.assertEqual(seen_statuses, [GroupInviteReminder.STATUS_SENDING] * 2)
+        self.assertEqual((summary["sent"], summary["failed"]), (1, 1))
+        failed = email_invite.reminders.get()
+        self.assertEqual((failed.error, failed.sent_at), ("provider down", None))
+        sms_invite.refresh_from_db()
+        email_invite.refresh_from_db()
+        self.assertEqual((sms_invite.reminder_count, email_invite.reminder_count), (1, 0))
+
+        # A claim abandoned by a crashed worker goes back to the queue.
+        stale = GroupInviteReminder.objects.create(
+            invite=email_invite,
+            status=GroupInviteReminder.STATUS_SENDING,
+            sent_at=timezone.now() - timedelta(hours=1),
+        )
+        with TemporaryDirectory() as outbox, self.settings(GROUP_REMINDER_OUTBOX_PATH=outbox):
+            self.assertEqual(dispatch_reminders()["sent"], 1)
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, GroupInviteReminder.STATUS_SENT)
+
     def test_update_invite_status_changes_state(self):
         group = self._create_group(name="Status Circle", is_public=False)
         GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
@@ -262,3 +547,136 @@ class GroupAPITests(APITestCase):
         self.assertTrue(
             GroupMembership.objects.filter(group=group, user__phone_number="+233200000030").exists()
         )
+
+    def test_member_and_invite_counters_follow_changes(self):
+        group = self._create_group(name="Counter Circle", is_public=True, requires_approval=False)
+        invite = GroupInvite.objects.create(group=group, name="Esi", phone_number="+233200000040")
+        group.refresh_from_db()
+        self.assertEqual((group.member_count, group.pending_invite_count), (0, 1))
+
+        self.client.post(reverse("groups:group-join", kwargs={"pk": group.pk}))
+        self.client.post(reverse("groups:group-promote-invite", kwargs={"pk": group.pk, "invite_id": invite.pk}))
+        group.refresh_from_db()
+        self.assertEqual((group.member_count, group.pending_invite_count), (2, 0))
+        self.assertEqual(group.seats_remaining, 3)
+
+        self.client.post(reverse("groups:group-leave", kwargs={"pk": group.pk}))
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 1)
+
+    def test_join_reserves_seat_with_conditional_update(self):
+        group = self._create_group(
+            name="Last Seat Circle", is_public=True, requires_approval=False, target_member_count=1
+        )
+        url = reverse("groups:group-join", kwargs={"pk": group.pk})
+
+        # Simulate a concurrent join that claimed the last seat after the view loaded the group.
+        with patch.object(Group, "seats_remaining", new_callable=PropertyMock, return_value=1):
+            Group.objects.filter(pk=group.pk).update(member_count=1)
+            response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(group.memberships.exists())
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 1)
+
+    def test_repair_group_counters_fixes_drift(self):
+        group = self._create_group(name="Drifted Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
+        Group.objects.filter(pk=group.pk).update(member_count=7, pending_invite_count=3)
+
+        out = StringIO()
+        call_command("repair_group_counters", stdout=out)
+
+        group.refresh_from_db()
+        self.assertEqual((group.member_count, group.pending_invite_count), (1, 0))
+        self.assertIn("1 group(s)", out.getvalue())
+
+    def test_list_reads_own_groups_without_distinct(self):
+        member_group = self._create_group(name="Member Circle")
+        GroupMembership.objects.create(group=member_group, user=self.user, display_name=self.user.full_name)
+        self._create_group(name="Hidden Circle", owner=None)
+        url = reverse("groups:group-list")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual([item["name"] for item in response.json()], ["Member Circle"])
+        group_query = next(q["sql"] for q in queries.captured_queries if 'FROM "groups_group"' in q["sql"])
+        self.assertNotIn("DISTINCT", group_query)
+        self.assertNotIn("is_public", group_query.split("WHERE", 1)[1])
+
+        # Public groups elsewhere on the platform do not grow the list.
+        for index in range(5):
+            self._create_group(name=f"Public Circle {index}", is_public=True)
+        with CaptureQueriesContext(connection) as more_queries:
+            names = [item["name"] for item in self.client.get(url).json()]
+        self.assertEqual(names, ["Member Circle"])
+        self.assertEqual(len(more_queries), len(queries))
+
+    def test_retrieve_supports_etag_and_invite_changes_bump_version(self):
+        group = self._create_group(name="Etag Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
+        invite = GroupInvite.objects.create(group=group, name="Kofi", phone_number="+233200000050")
+        url = reverse("groups:group-detail", kwargs={"pk": group.pk})
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertTrue(first.json()["isMember"])
+        etag = first["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 1)
+
+        self.client.post(
+            reverse("groups:group-update-invite-status", kwargs={"pk": group.pk, "invite_id": invite.pk}),
+            {"status": GroupInvite.STATUS_DECLINED},
+            format="json",
+        )
+
+        refreshed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(refreshed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(refreshed["ETag"], etag)
+        self.assertEqual(refreshed.json()["invites"][0]["status"], GroupInvite.STATUS_DECLINED)
+        self.assertGreater(refreshed.json()["version"], first.json()["version"])
+
+    def test_create_group_bulk_inserts_invites_with_single_audit_entry(self):
+        payload = {
+            "name": "Bulk Circle",
+            "contributionAmount": "50.00",
+            "startDate": (timezone.now() + timedelta(days=7)).isoformat(),
+            "invites": [
+                {"name": f"Invitee {index}", "phoneNumber": f"02400001{index:02d}"} for index in range(30)
+            ],
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse("groups:group-list"), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        group = Group.objects.get(name="Bulk Circle")
+        self.assertEqual(group.invites.count(), 30)
+        self.assertEqual(group.pending_invite_count, 30)
+        self.assertEqual(AuditLog.objects.filter(action="group.invite.created", target_id=str(group.pk)).count(), 1)
+        invite_inserts = [q for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "groups_groupinvite"')]
+        self.assertEqual(len(invite_inserts), 1)
+
+    def test_create_invites_skips_members_and_pending_invites(self):
+        group = self._create_group(name="Dedupe Circle")
+        GroupMembership.objects.create(group=group, user=self.user, display_name=self.user.full_name)
+        GroupInvite.objects.create(group=group, name="Existing", phone_number="+233200000060")
+
+        created = create_invites(
+            group=group,
+            invites=[
+                ("Self", self.user.phone_number),
+                ("Existing again", "0200000060"),
+                ("New", "0200000061"),
+                ("New duplicate", "+233200000061"),
+            ],
+        )
+
+        self.assertEqual([invite.phone_number for invite in created], ["+233200000061"])
+        group.refresh_from_db()
+        self.assertEqual(group.pending_invite_count, 2)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from sankofa_backend.apps.groups.history import membership_timeline, rollup_membership_events
+from sankofa_backend.apps.groups.models import (
+    Group,
+    GroupMembership,
+    GroupMembershipDaily,
+    GroupMembershipEvent,
+)
+
+User = get_user_model()
+
+
+class MembershipHistoryTests(TestCase):
+    def setUp(self) -> None:
+        self.today = timezone.localdate()
+        self.groups = [
+            Group.objects.create(
+                name=f"History Circle {index}",
+                frequency="Weekly",
+                contribution_amount="100.00",
+                target_member_count=5,
+                next_payout_date=timezone.now() + timedelta(days=7),
+            )
+            for index in range(2)
+        ]
+        self.users = [
+            User.objects.create_user(phone_number=f"02430000{index:02d}", full_name=f"Member {index}")
+            for index in range(3)
+        ]
+
+    def _join(self, group: Group, user, *, days_ago: int = 0) -> GroupMembership:
+        membership = GroupMembership.objects.create(group=group, user=user, display_name=user.full_name)
+        GroupMembershipEvent.objects.filter(group=group, user=user).update(
+            occurred_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return membership
+
+    def test_leaves_and_account_deletions_are_kept_in_history(self):
+        self._join(self.groups[0], self.users[0])
+        self._join(self.groups[0], self.users[1])
+
+        GroupMembership.objects.filter(group=self.groups[0], user=self.users[0]).delete()
+        self.users[1].delete()
+
+        events = list(
+            GroupMembershipEvent.objects.filter(group=self.groups[0])
+            .order_by("occurred_at", "delta")
+            .values_list("event_type", "delta", "user_id")
+        )
+        self.assertIn((GroupMembershipEvent.EVENT_LEFT, -1, self.users[0].pk), events)
+        # The departed account's events survive with the user cleared.
+        self.assertEqual(
+            sorted(event[:2] for event in events if event[2] is None),
+            [(GroupMembershipEvent.EVENT_JOINED, 1), (GroupMembershipEvent.EVENT_LEFT, -1)],
+        )
+
+        # Deleting a group keeps its history and records its members' removal.
+        self._join(self.groups[1], self.users[2])
+        deleted_id = self.groups[1].pk
+        self.groups[1].delete()
+        self.assertEqual(
+            sorted(GroupMembershipEvent.objects.filter(group_id=deleted_id).values_list("event_type", "delta")),
+            [(GroupMembershipEvent.EVENT_GROUP_DELETED, -1), (GroupMembershipEvent.EVENT_JOINED, 1)],
+        )
+        rollup_membership_events(since=self.today)
+        self.assertEqual(GroupMembershipDaily.objects.get(group_id=deleted_id).net, 0)
+        self.assertEqual(
+            membership_timeline(start=self.today, end=self.today, group_id=deleted_id)[0]["left"], 1
+        )
+
+    def test_timeline_reads_rollup_per_group_and_platform_wide(self):
+        self._join(self.groups[0], self.users[0], days_ago=10)
+        self._join(self.groups[0], self.users[1], days_ago=2)
+        self._join(self.groups[1], self.users[2], days_ago=1)
+        GroupMembership.objects.filter(group=self.groups[0], user=self.users[0]).delete()
+
+        self.assertEqual(rollup_membership_events(since=self.today - timedelta(days=30)), 4)
+        # Re-running the rollup rewrites the same rows.
+        rollup_membership_events(since=self.today - timedelta(days=30))
+        self.assertEqual(GroupMembershipDaily.objects.count(), 4)
+
+        start = self.today - timedelta(days=2)
+        with self.assertNumQueries(2):
+            group_timeline = membership_timeline(start=start, end=self.today, group_id=self.groups[0].pk)
+        self.assertEqual([day["members"] for day in group_timeline], [2, 2, 1])
+        self.assertEqual(group_timeline[-1]["left"], 1)
+
+        platform = membership_timeline(start=start, end=self.today)
+        self.assertEqual([day["members"] for day in platform], [2, 3, 2])
+        self.assertEqual([day["joined"] for day in platform], [1, 1, 0])
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import io
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import redis
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sankofa_backend.apps.groups import leaderboard
+from sankofa_backend.apps.groups.collection import collect_cycle
+from sankofa_backend.apps.groups.models import Group, GroupCycle, GroupMembership
+from sankofa_backend.apps.transactions.models import Transaction, Wallet
+
+User = get_user_model()
+
+
+class ContributionLeaderboardTests(APITestCase):
+    def setUp(self) -> None:
+        leaderboard.reset_store()
+        self.addCleanup(leaderboard.reset_store)
+        self.now = timezone.now()
+        self.group = Group.objects.create(
+            name="Leaderboard Circle",
+            frequency="Weekly",
+            contribution_amount="40.00",
+            target_member_count=5,
+            next_payout_date=self.now + timedelta(days=7),
+        )
+        Wallet.objects.ensure_platform()
+        self.members = []
+        for index, balance in enumerate(["100.00", "100.00", "10.00"]):
+            user = User.objects.create_user(phone_number=f"02440000{index:02d}", full_name=f"Saver {index}")
+            GroupMembership.objects.create(group=self.group, user=user, display_name=user.full_name)
+            Wallet.objects.filter(user=user).update(balance=Decimal(balance))
+            self.members.append(user)
+        self.cycle = GroupCycle.objects.create(group=self.group, number=1, due_date=self.now)
+        self.url = reverse("groups:group-leaderboard", args=[self.group.pk])
+
+    def _contribute(self, user, amount: str) -> Transaction:
+        with self.captureOnCommitCallbacks(execute=True):
+            return Transaction.objects.create(
+                user=user,
+                transaction_type=Transaction.TYPE_CONTRIBUTION,
+                status=Transaction.STATUS_SUCCESS,
+                amount=Decimal(amount),
+                occurred_at=self.now,
+                group=self.group,
+                group_cycle=self.cycle,
+            )
+
+    def test_ledger_updates_board_and_pushes_to_subscribers(self):
+        with patch.object(leaderboard, "broadcast_group_event") as broadcast:
+            with self.captureOnCommitCallbacks(execute=True):
+                collect_cycle(self.cycle.pk, now=self.now)
+            self._contribute(self.members[1], "15.00")
+
+        self.assertEqual(broadcast.call_count, 2)
+        pushed = broadcast.call_args.kwargs
+        self.assertEqual(pushed["event"], leaderboard.LEADERBOARD_EVENT)
+        self.assertEqual(pushed["payload"]["leaders"][0], {"userId": str(self.members[1].pk), "amount": 55.0, "rank": 1})
+
+        self.client.force_authenticate(self.members[2])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"limit": 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body["cycle"]["number"], 1)
+        self.assertEqual(
+            [(leader["name"], leader["amount"]) for leader in body["leaders"]],
+            [("Saver 1", 55.0), ("Saver 0", 40.0)],
+        )
+        self.assertFalse(any('"transactions_transaction"' in query["sql"] for query in queries.captured_queries))
+
+        outsider = User.objects.create_user(phone_number="0244999999", full_name="Outsider")
+        self.group.is_public = True
+        self.group.save(update_fields=["is_public"])
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_store_outage_does_not_fail_committed_contributions(self):
+        store = MagicMock()
+        store.increment_many.side_effect = redis.ConnectionError("down")
+        with patch.object(leaderboard, "get_store", return_value=store), patch.object(
+            leaderboard, "broadcast_group_event"
+        ) as broadcast, self.assertLogs(leaderboard.logger, "WARNING"):
+            with self.captureOnCommitCallbacks(execute=True):
+                result = collect_cycle(self.cycle.pk, now=self.now)
+
+        self.assertEqual(result.collected_count, 2)
+        self.assertEqual(Transaction.objects.filter(group_cycle=self.cycle).count(), 2)
+        broadcast.assert_not_called()
+
+    def test_rebuild_command_regenerates_board_from_transactions(self):
+        contribution = self._contribute(self.members[0], "40.00")
+        self._contribute(self.members[2], "10.00")
+        leaderboard.reset_store()
+        self.assertEqual(leaderboard.top_contributors(self.group.pk, self.cycle.pk), [])
+
+        call_command("rebuild_group_leaderboards", "--batch-size", "1", stdout=io.StringIO())
+        self.assertEqual(
+            [leader["userId"] for leader in leaderboard.top_contributors(self.group.pk, self.cycle.pk)],
+            [str(self.members[0].pk), str(self.members[2].pk)],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            contribution.delete()
+        leaders = leaderboard.top_contributors(self.group.pk, self.cycle.pk)
+        self.assertEqual(leaders, [{"userId": str(self.members[2].pk), "amount": 10.0, "rank": 1}])
+
+    def test_rebuild_swaps_boards_in_place_and_drops_stale_ones(self):
+        self._contribute(self.members[0], "40.00")
+        store = leaderboard.get_store()
+        live = leaderboard.leaderboard_key(self.group.pk, self.cycle.pk)
+        stale = leaderboard.leaderboard_key(self.group.pk, "closed-cycle")
+        drifted = [(str(self.members[1].pk), 999)]
+        store.replace(live, dict(drifted))
+        store.replace(stale, {str(self.members[1].pk): 5})
+
+        boards_before_swap = []
+        replace = store.replace
+
+        def spy(key, scores):
+            boards_before_swap.append(store.top(key, 10))
+            replace(key, scores)
+
+        with patch.object(store, "replace", side_effect=spy):
+            self.assertEqual(leaderboard.rebuild_leaderboards(group_ids=[self.group.pk]), 1)
+
+        # Readers kept seeing the old board until the new one replaced it.
+        self.assertEqual(boards_before_swap, [drifted])
+        self.assertEqual(
+            leaderboard.top_contributors(self.group.pk, self.cycle.pk),
+            [{"userId": str(self.members[0].pk), "amount": 40.0, "rank": 1}],
+        )
+        self.assertEqual(store.keys(f"{leaderboard.LEADERBOARD_KEY_PREFIX}:{self.group.pk}:"), {live})
+
+    def test_redis_replace_renames_a_temporary_set_over_the_live_key(self):
+        store = leaderboard.RedisLeaderboardStore.__new__(leaderboard.RedisLeaderboardStore)
+        store._client = MagicMock()
+        pipeline = store._client.pipeline.return_value
+
+        store.replace("groups:leaderboard:g:c", {"member": 40})
+
+        temporary = pipeline.zadd.call_args.args[0]
+        self.assertTrue(temporary.startswith(f"{leaderboard.REBUILD_KEY_PREFIX}:"))
+        pipeline.rename.assert_called_once_with(temporary, "groups:leaderboard:g:c")
+        store._client.delete.assert_not_called()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase
+
+from sankofa_backend.apps.groups.loadtest import LOADTEST_PHONE_PREFIX, FanoutConfig, create_fixtures
+from sankofa_backend.apps.groups.models import Group, GroupMembershipEvent
+
+
+class LoadtestGroupActivityCommandTests(TransactionTestCase):
+    def test_small_run_delivers_every_frame_and_cleans_up(self):
+        out = StringIO()
+        call_command(
+            "loadtest_group_activity",
+            "--group-sizes=3,2",
+            "--broadcasts=2",
+            "--timeout=2",
+            "--json",
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["groups"], 2)
+        self.assertEqual(report["connections"], 5)
+        self.assertEqual(report["expected_messages"], 10)
+        self.assertEqual(report["delivered_messages"], 10)
+        self.assertEqual(report["dropped_messages"], 0)
+        self.assertIsNotNone(report["memory_per_connection_kib"])
+        self.assertFalse(Group.objects.exists())
+        self.assertFalse(GroupMembershipEvent.objects.exists())
+        self.assertFalse(get_user_model().objects.exists())
+
+    def test_refuses_a_live_database_and_purges_leftovers(self):
+        with patch("sankofa_backend.apps.groups.loadtest.is_test_database", return_value=False):
+            with self.assertRaisesMessage(CommandError, "--allow-live-database"):
+                call_command("loadtest_group_activity", "--group-sizes=1", stdout=StringIO())
+        self.assertFalse(get_user_model().objects.exists())
+
+        groups, members = create_fixtures(FanoutConfig(group_sizes=[2]))
+        self.assertTrue(all(user.phone_number.startswith(LOADTEST_PHONE_PREFIX) for user in members[0]))
+        real = get_user_model().objects.create_user(phone_number="0241230000", full_name="Load test fan")
+
+        call_command("loadtest_group_activity", "--purge", stdout=StringIO())
+
+        self.assertFalse(Group.objects.exists())
+        self.assertFalse(GroupMembershipEvent.objects.exists())
+        self.assertEqual(list(get_user_model().objects.all()), [real])
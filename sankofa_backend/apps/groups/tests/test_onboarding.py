@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sankofa_backend.apps.accounts.models import PhoneOTP
+from sankofa_backend.apps.groups.models import Group, GroupInvite, GroupMembership
+from sankofa_backend.apps.groups.services import create_invites
+
+User = get_user_model()
+
+
+class RegistrationInviteLinkTests(APITestCase):
+    phone_number = "+233241112222"
+
+    def setUp(self) -> None:
+        self.url = reverse("accounts:register")
+        self.groups = []
+        for index, target in enumerate([5, 5, 1]):
+            group = Group.objects.create(
+                name=f"Circle {index}",
+                frequency="Weekly",
+                contribution_amount="100.00",
+                target_member_count=target,
+                next_payout_date=timezone.now() + timedelta(days=7),
+            )
+            create_invites(group=group, invites=[(f"Ama {index}", "0241112222"), ("Other", "0249990000")])
+            self.groups.append(group)
+        # The last group is already full.
+        occupant = User.objects.create_user(phone_number="0245550000", full_name="Occupant")
+        GroupMembership.objects.create(group=self.groups[2], user=occupant, display_name="Occupant")
+
+    def _post(self, url, data):
+        with patch("sankofa_backend.apps.groups.onboarding.broadcast_group_event") as broadcast:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, data, format="json")
+        return response, broadcast
+
+    def _register(self, **extra):
+        return self._post(self.url, {"phone_number": "0241112222", "full_name": "Ama Owusu", **extra})
+
+    def _verify(self, **extra):
+        otp = PhoneOTP.objects.filter(phone_number=self.phone_number, purpose=PhoneOTP.PURPOSE_SIGNUP).first()
+        data = {"phone_number": self.phone_number, "purpose": PhoneOTP.PURPOSE_SIGNUP, "code": otp.code, **extra}
+        return self._post(reverse("accounts:otp-verify"), data)
+
+    def test_registration_alone_links_nothing(self):
+        response, broadcast = self._register()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("group_invites", response.json())
+        user = User.objects.get(phone_number=self.phone_number)
+        self.assertFalse(GroupInvite.objects.filter(user=user).exists())
+        broadcast.assert_not_called()
+
+    def test_otp_links_pending_invites_without_accepting(self):
+        self._register()
+        response, broadcast = self._verify()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        invites = response.json()["group_invites"]
+        self.assertEqual(len(invites), 3)
+        self.assertEqual({invite["status"] for invite in invites}, {GroupInvite.STATUS_PENDING})
+
+        user = User.objects.get(phone_number=self.phone_number)
+        self.assertEqual(GroupInvite.objects.filter(user=user).count(), 3)
+        self.assertFalse(GroupMembership.objects.filter(user=user).exists())
+        self.assertEqual(broadcast.call_count, 3)
+        self.assertEqual({call.kwargs["event"] for call in broadcast.call_args_list}, {"group.invite.registered"})
+
+    def test_accept_invites_after_otp_joins_groups_with_free_seats(self):
+        versions = {group.pk: group.version for group in Group.objects.all()}
+        self._register()
+
+        with CaptureQueriesContext(connection) as queries:
+            response, broadcast = self._verify(accept_invites=True)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json())
+        statuses = {invite["group_id"]: invite["status"] for invite in response.json()["group_invites"]}
+        self.assertEqual(statuses[str(self.groups[0].pk)], GroupInvite.STATUS_ACCEPTED)
+        self.assertEqual(statuses[str(self.groups[1].pk)], GroupInvite.STATUS_ACCEPTED)
+        self.assertEqual(statuses[str(self.groups[2].pk)], GroupInvite.STATUS_PENDING)
+        # Memberships are inserted in one statement, not one per group.
+        inserts = [
+            query for query in queries.captured_queries if query["sql"].startswith('INSERT INTO "groups_groupmembership"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        user = User.objects.get(phone_number=self.phone_number)
+        self.assertEqual(
+            set(GroupMembership.objects.filter(user=user).values_list("group_id", flat=True)),
+            {self.groups[0].pk, self.groups[1].pk},
+        )
+        for group in self.groups:
+            group.refresh_from_db()
+        self.assertEqual([group.member_count for group in self.groups], [1, 1, 1])
+        self.assertEqual([group.pending_invite_count for group in self.groups], [1, 1, 2])
+        self.assertGreater(self.groups[0].version, versions[self.groups[0].pk])
+
+        events = {call.kwargs["group_id"]: call.kwargs for call in broadcast.call_args_list}
+        self.assertEqual(len(broadcast.call_args_list), 3)
+        accepted = events[self.groups[0].pk]
+        self.assertEqual(accepted["event"], "group.membership.invites_accepted")
+        self.assertEqual(accepted["payload"]["member"]["name"], "Ama 0")
+        self.assertEqual(accepted["payload"]["group"]["memberCount"], 1)
+        self.assertEqual(events[self.groups[2].pk]["event"], "group.invite.registered")
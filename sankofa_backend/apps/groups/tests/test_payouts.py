@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from sankofa_backend.apps.groups.models import Group, GroupCycle, GroupMembership
+from sankofa_backend.apps.groups.payouts import (
+    UNIT_DAY,
+    UNIT_MONTH,
+    UNIT_WEEK,
+    PayoutSchedule,
+    parse_frequency,
+    payout_rotation,
+    process_due_payouts,
+)
+
+User = get_user_model()
+
+
+class PayoutScheduleTests(SimpleTestCase):
+    def test_parses_common_frequencies(self):
+        cases = {
+            "Weekly": PayoutSchedule(UNIT_WEEK, 1),
+            "Weekly contributions": PayoutSchedule(UNIT_WEEK, 1),
+            "Bi-weekly": PayoutSchedule(UNIT_WEEK, 2),
+            "Monthly": PayoutSchedule(UNIT_MONTH, 1),
+            "daily": PayoutSchedule(UNIT_DAY, 1),
+            "Every 10 days": PayoutSchedule(UNIT_DAY, 10),
+            "": PayoutSchedule(UNIT_WEEK, 1),
+            "whenever": PayoutSchedule(UNIT_WEEK, 1),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_frequency(text), expected)
+
+    def test_monthly_advance_clamps_to_month_end(self):
+        start = datetime(2025, 1, 31, 9, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(PayoutSchedule(UNIT_MONTH, 1).advance(start), datetime(2025, 2, 28, 9, tzinfo=dt_timezone.utc))
+        self.assertEqual(PayoutSchedule(UNIT_MONTH, 12).advance(start), datetime(2026, 1, 31, 9, tzinfo=dt_timezone.utc))
+
+    def test_rotation_honours_explicit_order(self):
+        self.assertEqual(payout_rotation("Rotating", ["a", "b", "c"]), ["a", "b", "c"])
+        self.assertEqual(payout_rotation(json.dumps(["c", "x", "a"]), ["a", "b", "c"]), ["c", "a", "b"])
+
+
+class ProcessDuePayoutsTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.users = [
+            User.objects.create_user(phone_number=f"02400000{index:02d}", full_name=f"Member {index}")
+            for index in range(3)
+        ]
+
+    def _create_group(self, **overrides) -> Group:
+        defaults = {
+            "name": "Payout Circle",
+            "frequency": "Weekly",
+            "contribution_amount": "50.00",
+            "target_member_count": 3,
+            "cycle_number": 1,
+            "total_cycles": 3,
+            "next_payout_date": self.now - timedelta(hours=1),
+            "payout_order": "Rotating (Weekly)",
+        }
+        defaults.update(overrides)
+        group = Group.objects.create(**defaults)
+        for offset, user in enumerate(self.users):
+            GroupMembership.objects.create(
+                group=group,
+                user=user,
+                display_name=user.full_name,
+                joined_at=self.now - timedelta(days=10 - offset),
+            )
+        return group
+
+    def test_opens_due_cycle_and_advances_group(self):
+        group = self._create_group()
+        due_date = group.next_payout_date
+        version = Group.objects.get(pk=group.pk).version
+
+        summary = process_due_payouts(now=self.now)
+
+        self.assertEqual(summary, {"groups": 1, "cycles_opened": 1, "completed": 0})
+        group.refresh_from_db()
+        self.assertEqual(group.cycle_number, 2)
+        self.assertEqual(group.next_payout_date, due_date + timedelta(weeks=1))
+        self.assertEqual(group.version, version + 1)
+        cycle = GroupCycle.objects.get(group=group)
+        self.assertEqual((cycle.number, cycle.due_date, cycle.recipient_id), (1, due_date, self.users[0].pk))
+
+        self.assertEqual(process_due_payouts(now=self.now)["groups"], 0)
+
+    def test_catches_up_missed_cycles_and_completes_rotation(self):
+        group = self._create_group(frequency="Daily", next_payout_date=self.now - timedelta(days=5))
+        upcoming = self._create_group(name="Future Circle", next_payout_date=self.now + timedelta(days=1))
+
+        summary = process_due_payouts(now=self.now, batch_size=1)
+
+        self.assertEqual(summary, {"groups": 1, "cycles_opened": 3, "completed": 1})
+        group.refresh_from_db()
+        self.assertEqual(group.cycle_number, 3)
+        self.assertEqual(group.payouts_completed_at, self.now)
+        self.assertEqual(
+            list(GroupCycle.objects.filter(group=group).values_list("number", "recipient_id")),
+            [(1, self.users[0].pk), (2, self.users[1].pk), (3, self.users[2].pk)],
+        )
+        self.assertFalse(GroupCycle.objects.filter(group=upcoming).exists())
@@ -1,21 +1,65 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import Prefetch
 from django.utils import timezone
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
 
-from .models import Group, GroupInvite, GroupInviteReminder, GroupMembership
+from .compliance import get_compliance
+from .discovery import filter_groups, get_snapshot, render_entry
+from .leaderboard import top_contributors
+from .models import Group, GroupInvite, GroupInviteReminder, GroupMembership, GroupMembershipEvent
+from .payloads import get_group_payload, group_etag, render_for_viewer
 from .realtime import broadcast_group_event
-from .serializers import GroupCreateSerializer, GroupSerializer
+from .reminders import queue_reminders
+from .serializers import (
+    ContactMatchSerializer,
+    GroupCreateSerializer,
+    GroupCycleTotalsSerializer,
+    GroupInviteSerializer,
+    GroupLedgerEntrySerializer,
+    GroupMemberSerializer,
+    GroupSerializer,
+    parse_field_list,
+)
+from .services import add_member, match_contacts
 
 User = get_user_model()
 
 
+# Upper bound on the ``limit`` query parameter of the leaderboard endpoint.
+LEADERBOARD_MAX_LIMIT = 50
+
+
+class GroupSubresourcePagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+class GroupLedgerPagination(CursorPagination):
+    """Keyset pages over ``(group, occurred_at, id)``; deep pages cost the same as the first."""
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-occurred_at", "-id")
+
+
+class ContactMatchThrottle(UserRateThrottle):
+    scope = "group_contacts_match"
+
+
 class GroupViewSet(viewsets.ModelViewSet):
     serializer_class = GroupSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -25,19 +69,73 @@ class GroupViewSet(viewsets.ModelViewSet):
             return GroupCreateSerializer
         return super().get_serializer_class()
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "list":
+            context["compact"] = True
+            if self.request.user.is_authenticated:
+                context["member_group_ids"] = set(
+                    GroupMembership.objects.filter(user=self.request.user).values_list("group_id", flat=True)
+                )
+        return context
+
     def _prefetched_queryset(self):
-        memberships_prefetch = Prefetch(
-            "memberships",
-            queryset=GroupMembership.objects.select_related("user"),
-            to_attr="_prefetched_members",
-        )
-        return Group.objects.select_related("owner").prefetch_related(memberships_prefetch, "invites")
+        return Group.objects.with_detail_relations()
 
     def get_queryset(self):
-        return self._prefetched_queryset().for_user(self.request.user).order_by("name")
+        if self.action == "list":
+            # Public groups the user has not joined are listed by ``discover``.
+            return self._list_queryset().mine(self.request.user).order_by("name")
+        if self.action in {"members", "invites", "ledger", "compliance", "contacts_match", "leaderboard"}:
+            # Sub-resources only need the visibility check on the group itself.
+            queryset = Group.objects.all()
+        else:
+            queryset = self._prefetched_queryset()
+        return queryset.for_user(self.request.user).order_by("name")
+
+    def _list_queryset(self):
+        # The compact list renders counters only; prefetch collections on request.
+        expanded = parse_field_list(self.request.query_params.get("expand"))
+        queryset = Group.objects.select_related("owner")
+        if "members" in expanded:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "memberships",
+                    queryset=GroupMembership.objects.select_related("user"),
+                    to_attr="_prefetched_members",
+                )
+            )
+        if "invites" in expanded:
+            queryset = queryset.prefetch_related("invites")
+        return queryset
 
-    def _get_group(self, group_id):
-        return self._prefetched_queryset().get(pk=group_id)
+    def _render(self, payload):
+        return render_for_viewer(payload, user=self.request.user, fields=self.request.query_params.get("fields"))
+
+    def retrieve(self, request, *args, **kwargs):
+        group_id = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        fields = request.query_params.get("fields")
+        try:
+            version = (
+                Group.objects.for_user(request.user).filter(pk=group_id).values_list("version", flat=True).first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            version = None
+        if version is None:
+            raise Http404
+
+        # Members poll this endpoint; an unchanged group costs one version read.
+        if group_etag(group_id, version, fields) in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = group_etag(group_id, version, fields)
+        else:
+            payload = get_group_payload(group_id, version)
+            if payload is None:
+                raise Http404
+            response = Response(self._render(payload))
+            response["ETag"] = group_etag(group_id, payload["version"], fields)
+        patch_vary_headers(response, ["Authorization"])
+        return response
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -47,6 +145,30 @@ class GroupViewSet(viewsets.ModelViewSet):
         headers = self.get_success_headers(response_serializer.data)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    @action(methods=["get"], detail=False, pagination_class=GroupSubresourcePagination)
+    def discover(self, request):
+        params = request.query_params
+        try:
+            groups = filter_groups(
+                get_snapshot()["groups"],
+                location=params.get("location"),
+                frequency=params.get("frequency"),
+                min_contribution=params.get("min_contribution"),
+                max_contribution=params.get("max_contribution"),
+                has_seats=params.get("has_seats", "").lower() in {"1", "true", "yes"},
+            )
+        except ValueError:
+            return Response(
+                {"detail": "Contribution bounds must be numbers."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        page = self.paginate_queryset(groups)
+        member_group_ids = {
+            str(group_id)
+            for group_id in GroupMembership.objects.filter(user=request.user).values_list("group_id", flat=True)
+        }
+        return self.get_paginated_response([render_entry(group, member_group_ids=member_group_ids) for group in page])
+
     @action(methods=["post"], detail=True)
     def join(self, request, pk: str | None = None):
         group = self.get_object()
@@ -109,24 +231,32 @@ class GroupViewSet(viewsets.ModelViewSet):
                             kyc_completed=kyc_completed,
                         )
                 else:
-                    membership, created = GroupMembership.objects.select_for_update().get_or_create(
-                        group=group,
-                        user=request.user,
-                        defaults={"display_name": request.user.full_name or request.user.phone_number},
-                    )
-                    if created:
-                        group.updated_at = timezone.now()
-                        group.save(update_fields=["updated_at"])
-
-        refreshed = self._get_group(group.pk)
-        serializer = self.get_serializer(refreshed)
+                    try:
+                        with transaction.atomic():
+                            membership = add_member(
+                                group=group,
+                                user=request.user,
+                                display_name=request.user.full_name or request.user.phone_number,
+                            )
+                    except IntegrityError:
+                        # A concurrent request added this member first; its seat stands.
+                        membership = GroupMembership.objects.get(group=group, user=request.user)
+                    else:
+                        if membership is None:
+                            return Response(
+                                {"detail": "This group is already at capacity."},
+                                status=status.HTTP_400_BAD_REQUEST,
+                            )
+                        created = True
+
+        payload = get_group_payload(group.pk)
 
         if created:
             broadcast_group_event(
                 group_id=group.pk,
                 event="group.membership.joined",
                 payload={
-                    "group": serializer.data,
+                    "group": payload,
                     "member": {
                         "id": str(request.user.id),
                         "name": membership.display_name,
@@ -135,27 +265,23 @@ class GroupViewSet(viewsets.ModelViewSet):
             )
 
         if group.requires_approval and not created and membership is None:
-            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+            return Response(self._render(payload), status=status.HTTP_202_ACCEPTED)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self._render(payload), status=status.HTTP_200_OK)
 
     @action(methods=["post"], detail=True)
     def leave(self, request, pk: str | None = None):
         group = self.get_object()
         departing_name = request.user.full_name or request.user.phone_number
         deleted, _ = group.memberships.filter(user=request.user).delete()
-        if deleted:
-            group.updated_at = timezone.now()
-            group.save(update_fields=["updated_at"])
-        refreshed = self._get_group(group.pk)
-        serializer = self.get_serializer(refreshed)
+        payload = get_group_payload(group.pk)
 
         if deleted:
             broadcast_group_event(
                 group_id=group.pk,
                 event="group.membership.left",
                 payload={
-                    "group": serializer.data,
+                    "group": payload,
                     "member": {
                         "id": str(request.user.id),
                         "name": departing_name,
@@ -163,20 +289,138 @@ class GroupViewSet(viewsets.ModelViewSet):
                 },
             )
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self._render(payload), status=status.HTTP_200_OK)
+
+    @action(methods=["get"], detail=True, pagination_class=GroupSubresourcePagination)
+    def members(self, request, pk: str | None = None):
+        group = self.get_object()
+        queryset = group.memberships.select_related("user").order_by("joined_at", "pk")
+        page = self.paginate_queryset(queryset)
+        serializer = GroupMemberSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @action(methods=["get"], detail=True, pagination_class=GroupSubresourcePagination)
+    def invites(self, request, pk: str | None = None):
+        group = self.get_object()
+        queryset = group.invites.order_by("-sent_at", "pk")
+        status_filter = request.query_params.get("status")
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        page = self.paginate_queryset(queryset)
+        serializer = GroupInviteSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @action(methods=["get"], detail=True, pagination_class=GroupLedgerPagination)
+    def ledger(self, request, pk: str | None = None):
+        group = self.get_object()
+        if not (self._manages(group) or GroupMembership.objects.filter(group=group, user=request.user).exists()):
+            return Response({"detail": "Only members can view the group ledger."}, status=status.HTTP_403_FORBIDDEN)
+
+        queryset = group.transactions.select_related("user", "group_cycle")
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(GroupLedgerEntrySerializer(page, many=True).data)
+        # Cycle totals are stored on the cycle rows and updated as money moves,
+        # so reading them costs one small indexed query.
+        response.data["cycles"] = GroupCycleTotalsSerializer(group.cycles.order_by("number"), many=True).data
+        return response
+
+    @action(methods=["get"], detail=True)
+    def leaderboard(self, request, pk: str | None = None):
+        group = self.get_object()
+        if not (self._manages(group) or GroupMembership.objects.filter(group=group, user=request.user).exists()):
+            return Response({"detail": "Only members can view the leaderboard."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            limit = min(max(int(request.query_params.get("limit", 10)), 1), LEADERBOARD_MAX_LIMIT)
+            cycle_number = request.query_params.get("cycle")
+            cycles = group.cycles.order_by("-number")
+            cycle = (cycles.filter(number=int(cycle_number)) if cycle_number else cycles).first()
+        except ValueError:
+            return Response({"detail": "cycle and limit must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+        if cycle is None:
+            return Response({"cycle": None, "leaders": []})
+
+        # Scores come from the sorted set; only the names are read from the database.
+        leaders = top_contributors(group.pk, cycle.pk, limit=limit)
+        memberships = GroupMembership.objects.filter(
+            group=group, user_id__in=[leader["userId"] for leader in leaders]
+        ).values_list("user_id", "display_name")
+        names = {str(user_id): name for user_id, name in memberships}
+        for leader in leaders:
+            leader["name"] = names.get(leader["userId"])
+        return Response({"cycle": GroupCycleTotalsSerializer(cycle).data, "leaders": leaders})
+
+    @action(
+        methods=["post"],
+        detail=True,
+        url_path="contacts/match",
+        throttle_classes=[ContactMatchThrottle],
+    )
+    def contacts_match(self, request, pk: str | None = None):
+        group = self.get_object()
+        if not (self._manages(group) or GroupMembership.objects.filter(group=group, user=request.user).exists()):
+            return Response({"detail": "Only members can match contacts."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = ContactMatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = match_contacts(group=group, phone_numbers=serializer.validated_data["phoneNumbers"])
+        counts: dict[str, int] = {}
+        for entry in results:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return Response({"results": results, "counts": counts})
+
+    @action(methods=["get"], detail=True)
+    def compliance(self, request, pk: str | None = None):
+        group = self.get_object()
+        if not self._manages(group):
+            return Response(
+                {"detail": "Only the group organizer can view compliance."}, status=status.HTTP_403_FORBIDDEN
+            )
+        return Response(get_compliance(group))
+
+    def _manages(self, group: Group) -> bool:
+        user = self.request.user
+        return user.is_staff or (group.owner_id is not None and group.owner_id == user.id)
 
     @action(methods=["post"], detail=True, url_path=r"invites/(?P<invite_id>[^/]+)/remind")
     def remind_invite(self, request, pk: str | None = None, invite_id: str | None = None):
         group = self.get_object()
+        if not self._manages(group):
+            return Response(
+                {"detail": "Only the group organizer can send reminders."}, status=status.HTTP_403_FORBIDDEN
+            )
         invite = get_object_or_404(group.invites, pk=invite_id)
 
-        GroupInviteReminder.objects.create(invite=invite)
-        invite.last_reminded_at = timezone.now()
-        invite.reminder_count += 1
-        invite.save(update_fields=["last_reminded_at", "reminder_count"])
-        refreshed = self._get_group(group.pk)
-        data = GroupSerializer(refreshed, context=self.get_serializer_context()).data
-        return Response(data, status=status.HTTP_200_OK)
+        channel = self._reminder_channel(request)
+        if channel is None:
+            return Response({"channel": "Invalid channel."}, status=status.HTTP_400_BAD_REQUEST)
+        if invite.status != GroupInvite.STATUS_PENDING:
+            return Response({"detail": "Only pending invites can be reminded."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Delivery happens in the ``dispatch_invite_reminders`` worker, which also
+        # updates the invite's reminder counters once the message is sent.
+        queue_reminders([invite], channel=channel)
+        return Response(self._render(get_group_payload(group.pk)), status=status.HTTP_202_ACCEPTED)
+
+    @action(methods=["post"], detail=True, url_path="invites/remind-all")
+    def remind_all_invites(self, request, pk: str | None = None):
+        group = self.get_object()
+        if not self._manages(group):
+            return Response(
+                {"detail": "Only the group organizer can send reminders."}, status=status.HTTP_403_FORBIDDEN
+            )
+        channel = self._reminder_channel(request)
+        if channel is None:
+            return Response({"channel": "Invalid channel."}, status=status.HTTP_400_BAD_REQUEST)
+
+        queued = queue_reminders(group.invites.filter(status=GroupInvite.STATUS_PENDING), channel=channel)
+        return Response({"queued": queued}, status=status.HTTP_202_ACCEPTED)
+
+    def _reminder_channel(self, request) -> str | None:
+        channel = request.data.get("channel") or GroupInviteReminder.CHANNEL_SMS
+        if channel not in {choice[0] for choice in GroupInviteReminder.CHANNEL_CHOICES}:
+            return None
+        return channel
 
     @action(methods=["post"], detail=True, url_path=r"invites/(?P<invite_id>[^/]+)/status")
     def update_invite_status(self, request, pk: str | None = None, invite_id: str | None = None):
@@ -193,9 +437,7 @@ class GroupViewSet(viewsets.ModelViewSet):
         except ValueError:
             return Response({"status": "Invalid status."}, status=status.HTTP_400_BAD_REQUEST)
 
-        refreshed = self._get_group(group.pk)
-        data = GroupSerializer(refreshed, context=self.get_serializer_context()).data
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(self._render(get_group_payload(group.pk)), status=status.HTTP_200_OK)
 
     @action(methods=["post"], detail=True, url_path=r"invites/(?P<invite_id>[^/]+)/promote")
     def promote_invite(self, request, pk: str | None = None, invite_id: str | None = None):
@@ -214,25 +456,22 @@ class GroupViewSet(viewsets.ModelViewSet):
                 member_user.full_name = invite.name
                 member_user.save(update_fields=["full_name"])
 
-            membership, created = GroupMembership.objects.get_or_create(
-                group=group,
-                user=member_user,
-                defaults={"display_name": invite.name or member_user.full_name},
-            )
+            membership = GroupMembership.objects.filter(group=group, user=member_user).first()
+            if membership is None:
+                membership = GroupMembership(
+                    group=group, user=member_user, display_name=invite.name or member_user.full_name
+                )
+                membership._membership_event = GroupMembershipEvent.EVENT_INVITE_ACCEPTED
+                membership.save(force_insert=True)
             invite.mark_status(status=GroupInvite.STATUS_ACCEPTED, kyc_completed=True)
 
-            if created:
-                group.updated_at = timezone.now()
-                group.save(update_fields=["updated_at"])
-
-        refreshed = self._get_group(group.pk)
-        data = GroupSerializer(refreshed, context=self.get_serializer_context()).data
+        payload = get_group_payload(group.pk)
 
         broadcast_group_event(
             group_id=group.pk,
             event="group.membership.invite_promoted",
             payload={
-                "group": data,
+                "group": payload,
                 "member": {
                     "id": str(membership.user_id),
                     "name": membership.display_name,
@@ -240,4 +479,4 @@ class GroupViewSet(viewsets.ModelViewSet):
             },
         )
 
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(self._render(payload), status=status.HTTP_200_OK)
@@ -0,0 +1,254 @@
+"""Promotional interest and active-saver bonus accrual for savings goals.
+
+Interest is paid on each goal's end-of-day balances over an accrual period
+(by default, yesterday). Goals are processed in primary-key ranges. For each
+range the engine:
+
+* locks the goals and reads their current balances;
+* reads only the contributions, redemptions and earlier accruals recorded
+  since the period started;
+* rebuilds the daily balances backwards from the current balance in NumPy,
+  working in integer pesewas so no float rounding reaches the ledger;
+* writes the interest ledger entries and the ``SavingsAccrual`` rows with
+  ``bulk_create``, then credits the goals with one ``UPDATE`` that reads the
+  amounts back from those rows.
+
+A goal with an accrual whose period ends on or after this period's start is
+skipped, so re-running a night, or a longer catch-up window that overlaps one
+already paid, never credits the same day twice. Ranges are independent, so
+``workers > 1`` spreads them across a process pool.
+"""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import repeat
+from typing import Any
+
+import numpy as np
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+from sankofa_backend.apps.transactions.models import Transaction
+
+from .models import SavingsAccrual, SavingsContribution, SavingsGoal, SavingsRedemption
+
+
+BASIS_POINTS = 10_000
+DAYS_PER_YEAR = 365
+INTEREST_CHANNEL = "Savings interest"
+
+
+@dataclass(frozen=True)
+class AccrualPeriod:
+    start: date
+    end: date
+    rate_bps: int
+    bonus_bps: int = 0
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    @property
+    def starts_at(self) -> datetime:
+        return timezone.make_aware(datetime.combine(self.start, time.min))
+
+
+def compute_accruals(
+    current_cents: np.ndarray,
+    flow_goals: np.ndarray,
+    flow_days: np.ndarray,
+    flow_cents: np.ndarray,
+    active: np.ndarray,
+    *,
+    days: int,
+    rate_bps: int,
+    bonus_bps: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(interest_cents, balance_sums)`` per goal, where ``balance_sums`` adds up the end-of-day balances.
+
+    Each signed flow is placed by goal index and by its day index within the
+    period. Flows after the period use index ``days``. The balance at the end
+    of day ``i`` is the current balance minus every flow after day ``i``.
+    Interest rounds down to the pesewa.
+    """
+
+    flows = np.zeros((len(current_cents), days + 1), dtype=np.int64)
+    np.add.at(flows, (flow_goals, flow_days), flow_cents)
+    # later[:, j] is the total of the flows on day j and after.
+    later = np.cumsum(flows[:, ::-1], axis=1)[:, ::-1]
+    balances = np.maximum(current_cents[:, None] - later[:, 1:], 0)
+    balance_sums = balances.sum(axis=1)
+    annual_bps = rate_bps + bonus_bps * active.astype(np.int64)
+    interest = balance_sums * annual_bps // (BASIS_POINTS * DAYS_PER_YEAR)
+    return interest, balance_sums
+
+
+def _to_cents(amount: Decimal) -> int:
+    return int(amount * 100)
+
+
+def _goal_ranges(batch_size: int) -> list[tuple[Any, Any]]:
+    """Split goal primary keys into consecutive inclusive ``(first, last)`` ranges."""
+
+    ranges: list[tuple[Any, Any]] = []
+    first = last = None
+    count = 0
+    for pk in SavingsGoal.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=batch_size):
+        if first is None:
+            first = pk
+        last, count = pk, count + 1
+        if count == batch_size:
+            ranges.append((first, last))
+            first, count = None, 0
+    if first is not None:
+        ranges.append((first, last))
+    return ranges
+
+
+def accrue_range(first: Any, last: Any, period: AccrualPeriod) -> tuple[int, int, int]:
+    """Accrue one primary-key range of goals in its own transaction.
+
+    Returns ``(goals_read, goals_credited, total_cents)``.
+    """
+
+    in_range = {"goal_id__gte": first, "goal_id__lte": last}
+    since = period.starts_at
+    with transaction.atomic():
+        goals = list(
+            SavingsGoal.objects.select_for_update()
+            .filter(pk__gte=first, pk__lte=last)
+            # Any accrual reaching into this period means those days were already paid.
+            .exclude(pk__in=SavingsAccrual.objects.filter(period_end__gte=period.start, **in_range).values("goal_id"))
+            .order_by("pk")
+            .values_list("pk", "user_id", "title", "current_amount")
+        )
+        if not goals:
+            return 0, 0, 0
+        index = {goal[0]: position for position, goal in enumerate(goals)}
+
+        flows: list[tuple[int, int, int]] = []
+        active = np.zeros(len(goals), dtype=bool)
+        # (rows, timestamp field, sign, counts towards the active-saver bonus)
+        sources = (
+            (SavingsContribution.objects.filter(recorded_at__gte=since, **in_range), "recorded_at", 1, True),
+            (SavingsRedemption.objects.filter(recorded_at__gte=since, **in_range), "recorded_at", -1, False),
+            (SavingsAccrual.objects.filter(posted_at__gte=since, **in_range), "posted_at", 1, False),
+        )
+        for queryset, moment, sign, is_contribution in sources:
+            for goal_id, occurred_at, amount in queryset.values_list("goal_id", moment, "amount"):
+                position = index.get(goal_id)
+                if position is None:
+                    continue
+                day = min((timezone.localdate(occurred_at) - period.start).days, period.days)
+                flows.append((position, day, sign * _to_cents(amount)))
+                if is_contribution and day < period.days:
+                    active[position] = True
+
+        flow_array = np.array(flows, dtype=np.int64).reshape(-1, 3)
+        interest, balance_sums = compute_accruals(
+            np.fromiter((_to_cents(goal[3]) for goal in goals), dtype=np.int64, count=len(goals)),
+            flow_array[:, 0],
+            flow_array[:, 1],
+            flow_array[:, 2],
+            active,
+            days=period.days,
+            rate_bps=period.rate_bps,
+            bonus_bps=period.bonus_bps,
+        )
+
+        now = timezone.now()
+        ledger: list[Transaction] = []
+        accruals: list[SavingsAccrual] = []
+        for position in np.flatnonzero(interest > 0).tolist():
+            goal_id, user_id, title = goals[position][:3]
+            amount = Decimal(int(interest[position])) / 100
+            record = Transaction(
+                user_id=user_id,
+                transaction_type=Transaction.TYPE_INTEREST,
+                status=Transaction.STATUS_SUCCESS,
+                amount=amount,
+                description=f"Interest on {title}",
+                occurred_at=now,
+                channel=INTEREST_CHANNEL,
+                savings_goal_id=goal_id,
+            )
+            ledger.append(record)
+            accruals.append(
+                SavingsAccrual(
+                    goal_id=goal_id,
+                    user_id=user_id,
+                    period_start=period.start,
+                    period_end=period.end,
+                    rate_bps=period.rate_bps,
+                    bonus_bps=period.bonus_bps if active[position] else 0,
+                    average_balance=(Decimal(int(balance_sums[position])) / period.days / 100).quantize(
+                        Decimal("0.01")
+                    ),
+                    amount=amount,
+                    transaction=record,
+                    posted_at=now,
+                )
+            )
+
+        Transaction.objects.bulk_create(ledger, batch_size=1000)
+        SavingsAccrual.objects.bulk_create(accruals, batch_size=1000)
+        # One set-based UPDATE credits every goal from the accrual rows just written.
+        posted = SavingsAccrual.objects.filter(period_start=period.start, posted_at=now, **in_range)
+        SavingsGoal.objects.filter(pk__in=posted.values("goal_id")).update(
+            current_amount=F("current_amount")
+            + Subquery(posted.filter(goal_id=OuterRef("pk")).values("amount")[:1]),
+            updated_at=now,
+        )
+    return len(goals), len(accruals), int(interest.sum())
+
+
+def accrue_interest(
+    *,
+    period_end: date | None = None,
+    days: int = 1,
+    rate_bps: int | None = None,
+    bonus_bps: int | None = None,
+    batch_size: int | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Accrue interest for the ``days`` ending on ``period_end`` (default: yesterday) across every goal.
+
+    Rates default to ``SAVINGS_INTEREST_RATE_BPS`` and
+    ``SAVINGS_ACTIVE_SAVER_BONUS_BPS``. With ``workers > 1`` the ranges are
+    spread across a process pool; each worker opens its own connection.
+    """
+
+    period_end = period_end or timezone.localdate() - timedelta(days=1)
+    period = AccrualPeriod(
+        start=period_end - timedelta(days=days - 1),
+        end=period_end,
+        rate_bps=int(getattr(settings, "SAVINGS_INTEREST_RATE_BPS", 0) if rate_bps is None else rate_bps),
+        bonus_bps=int(getattr(settings, "SAVINGS_ACTIVE_SAVER_BONUS_BPS", 0) if bonus_bps is None else bonus_bps),
+    )
+    batch_size = batch_size or int(getattr(settings, "SAVINGS_ACCRUAL_BATCH_SIZE", 2000))
+    workers = workers or int(getattr(settings, "SAVINGS_ACCRUAL_WORKERS", 1))
+    summary: dict[str, Any] = {"goals": 0, "credited": 0, "amount": Decimal("0.00")}
+    if not (period.rate_bps or period.bonus_bps):
+        return summary
+
+    ranges = _goal_ranges(batch_size)
+    if workers > 1 and len(ranges) > 1:
+        # Forked workers must not share the parent's database sockets.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            results = list(pool.map(accrue_range, *zip(*ranges), repeat(period)))
+    else:
+        results = [accrue_range(first, last, period) for first, last in ranges]
+
+    for goals_read, credited, cents in results:
+        summary["goals"] += goals_read
+        summary["credited"] += credited
+        summary["amount"] += Decimal(cents) / 100
+    return summary
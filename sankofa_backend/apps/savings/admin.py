@@ -2,7 +2,15 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import SavingsContribution, SavingsGoal, SavingsRedemption
+from .models import (
+    AutoSaveRule,
+    AutoSaveRun,
+    SavingsAccrual,
+    SavingsContribution,
+    SavingsGoal,
+    SavingsGoalForecast,
+    SavingsRedemption,
+)
 
 
 @admin.register(SavingsGoal)
@@ -12,6 +20,7 @@ class SavingsGoalAdmin(admin.ModelAdmin):
         "user",
         "target_amount",
         "current_amount",
+        "contribution_count",
         "deadline",
         "category",
         "created_at",
@@ -50,3 +59,68 @@ class SavingsRedemptionAdmin(admin.ModelAdmin):
     search_fields = ("goal__title", "user__phone_number")
     autocomplete_fields = ("goal", "user")
     ordering = ("-recorded_at",)
+
+
+@admin.register(AutoSaveRule)
+class AutoSaveRuleAdmin(admin.ModelAdmin):
+    list_display = (
+        "goal",
+        "user",
+        "amount",
+        "frequency",
+        "interval",
+        "next_run_at",
+        "is_active",
+        "last_run_status",
+    )
+    list_filter = ("frequency", "is_active", "last_run_status")
+    search_fields = ("goal__title", "user__phone_number")
+    autocomplete_fields = ("goal", "user")
+    ordering = ("next_run_at",)
+
+
+@admin.register(AutoSaveRun)
+class AutoSaveRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "rule",
+        "status",
+        "amount",
+        "ran_at",
+    )
+    list_filter = ("status", "ran_at")
+    search_fields = ("rule__goal__title", "rule__user__phone_number")
+    raw_id_fields = ("rule", "contribution")
+    ordering = ("-ran_at",)
+
+
+@admin.register(SavingsAccrual)
+class SavingsAccrualAdmin(admin.ModelAdmin):
+    list_display = (
+        "goal",
+        "user",
+        "period_start",
+        "period_end",
+        "average_balance",
+        "amount",
+        "posted_at",
+    )
+    list_filter = ("period_start", "posted_at")
+    search_fields = ("goal__title", "user__phone_number")
+    raw_id_fields = ("goal", "user", "transaction")
+    ordering = ("-period_start",)
+
+
+@admin.register(SavingsGoalForecast)
+class SavingsGoalForecastAdmin(admin.ModelAdmin):
+    list_display = (
+        "goal",
+        "weekly_rate",
+        "projected_completion_date",
+        "required_weekly_amount",
+        "on_track",
+        "computed_at",
+    )
+    list_filter = ("on_track", "computed_at")
+    search_fields = ("goal__title", "goal__user__phone_number")
+    raw_id_fields = ("goal",)
+    ordering = ("-computed_at",)
@@ -0,0 +1,193 @@
+"""Scheduled execution of recurring auto-save rules.
+
+Rules carry a precomputed ``next_run_at``, so the scheduler only reads the
+``(is_active, next_run_at)`` index for rules that are due. They are claimed
+in chunks with ``SELECT ... FOR UPDATE SKIP LOCKED``, so several workers can
+drain the queue without blocking each other. Each chunk is settled in one
+transaction:
+
+* goals are locked in primary-key order, then member wallets, then the
+  platform float, matching ``record_contribution`` so the paths cannot
+  deadlock;
+* rules are grouped by wallet and debited while the balance lasts; the
+  wallets move with a single ``UPDATE`` and the goals, with their
+  contribution stats, with one ``bulk_update``;
+* transactions, contributions and run outcomes (with the milestones each
+  contribution crossed) are written with ``bulk_create``, and the rules are
+  rescheduled with one ``bulk_update``.
+"""
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, When
+from django.utils import timezone
+
+from sankofa_backend.apps.groups.payouts import PayoutSchedule
+from sankofa_backend.apps.transactions.models import Transaction, Wallet
+
+from .models import AutoSaveRule, AutoSaveRun, SavingsContribution, SavingsGoal
+from .services import crossed_milestones
+
+
+AUTOSAVE_CHANNEL = "Auto-save"
+
+
+def next_run_after(rule: AutoSaveRule, now: datetime) -> datetime:
+    """Advance ``rule.next_run_at`` past ``now``; missed occurrences are skipped, not replayed."""
+
+    schedule = PayoutSchedule(rule.frequency, rule.interval)
+    moment = rule.next_run_at
+    while moment <= now:
+        moment = schedule.advance(moment)
+    return moment
+
+
+def _balance_case(deltas: dict[Any, Decimal]) -> Case:
+    return Case(
+        *[When(pk=pk, then=F("balance") + delta) for pk, delta in deltas.items()],
+        default=F("balance"),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+def _run_batch(*, now: datetime, batch_size: int, summary: dict[str, Any]) -> int:
+    with transaction.atomic():
+        rules = list(
+            AutoSaveRule.objects.select_for_update(skip_locked=True)
+            .filter(is_active=True, next_run_at__lte=now)
+            .order_by("next_run_at", "pk")[:batch_size]
+        )
+        if not rules:
+            return 0
+
+        goals = {
+            goal.pk: goal
+            for goal in SavingsGoal.objects.select_for_update()
+            .filter(pk__in={rule.goal_id for rule in rules})
+            .order_by("pk")
+        }
+        wallets = {
+            wallet.user_id: wallet
+            for wallet in Wallet.objects.select_for_update()
+            .filter(user_id__in={rule.user_id for rule in rules})
+            .order_by("pk")
+            .only("id", "user_id", "balance")
+        }
+        platform_wallet = Wallet.objects.select_for_update().get(pk=Wallet.objects.ensure_platform().pk)
+
+        rules_by_user: dict[Any, list[AutoSaveRule]] = defaultdict(list)
+        for rule in rules:
+            rules_by_user[rule.user_id].append(rule)
+
+        wallet_deltas: dict[Any, Decimal] = defaultdict(Decimal)
+        touched_goals: dict[Any, SavingsGoal] = {}
+        platform_balance = platform_wallet.balance
+        ledger: list[Transaction] = []
+        contributions: list[SavingsContribution] = []
+        runs: list[AutoSaveRun] = []
+
+        for user_id, user_rules in rules_by_user.items():
+            wallet = wallets.get(user_id)
+            balance = wallet.balance if wallet is not None else Decimal("0.00")
+            for rule in user_rules:
+                goal = goals[rule.goal_id]
+                run = AutoSaveRun(rule=rule, amount=rule.amount, ran_at=now)
+                if goal.current_amount >= goal.target_amount:
+                    run.status = AutoSaveRun.STATUS_GOAL_REACHED
+                    rule.is_active = False
+                elif wallet is None or balance < rule.amount:
+                    run.status = AutoSaveRun.STATUS_INSUFFICIENT_FUNDS
+                else:
+                    previous_progress = goal.progress
+                    balance -= rule.amount
+                    platform_balance += rule.amount
+                    goal.current_amount += rule.amount
+                    goal.note_contribution(now)
+                    goal.updated_at = now
+                    wallet_deltas[wallet.pk] -= rule.amount
+                    touched_goals[goal.pk] = goal
+
+                    ledger.append(
+                        Transaction(
+                            user_id=user_id,
+                            transaction_type=Transaction.TYPE_SAVINGS,
+                            status=Transaction.STATUS_SUCCESS,
+                            amount=rule.amount,
+                            description=f"Auto-save to {goal.title}",
+                            occurred_at=now,
+                            channel=AUTOSAVE_CHANNEL,
+                            balance_after=balance,
+                            platform_balance_after=platform_balance,
+                            savings_goal_id=goal.pk,
+                        )
+                    )
+                    contribution = SavingsContribution(
+                        id=uuid.uuid4(),
+                        goal_id=goal.pk,
+                        user_id=user_id,
+                        amount=rule.amount,
+                        channel=AUTOSAVE_CHANNEL,
+                        recorded_at=now,
+                    )
+                    contributions.append(contribution)
+                    run.status = AutoSaveRun.STATUS_SUCCESS
+                    run.contribution = contribution
+                    run.milestones = crossed_milestones(previous_progress, goal.progress)
+                    summary["saved"] += rule.amount
+                runs.append(run)
+                summary[run.status] += 1
+
+                rule.last_run_at = rule.updated_at = now
+                rule.last_run_status = run.status
+                rule.next_run_at = next_run_after(rule, now)
+
+        if wallet_deltas:
+            # The rows are locked, so the deltas computed above are exactly what
+            # lands; the member wallets and the float move in one statement.
+            wallet_deltas[platform_wallet.pk] = platform_balance - platform_wallet.balance
+            Wallet.objects.filter(pk__in=list(wallet_deltas)).update(
+                balance=_balance_case(wallet_deltas), updated_at=now
+            )
+            SavingsGoal.objects.bulk_update(
+                touched_goals.values(),
+                ["current_amount", "contribution_count", "last_contribution_at", "contribution_streak", "updated_at"],
+                batch_size=1000,
+            )
+            Transaction.objects.bulk_create(ledger, batch_size=1000)
+            SavingsContribution.objects.bulk_create(contributions, batch_size=1000)
+
+        AutoSaveRun.objects.bulk_create(runs, batch_size=1000)
+        AutoSaveRule.objects.bulk_update(
+            rules, ["next_run_at", "last_run_at", "last_run_status", "is_active", "updated_at"], batch_size=1000
+        )
+    return len(rules)
+
+
+def run_due_rules(*, now: datetime | None = None, batch_size: int | None = None) -> dict[str, Any]:
+    """Execute every due auto-save rule, one chunk of ``batch_size`` rules per transaction.
+
+    Returns counts per outcome and the total amount saved.
+    """
+
+    now = now or timezone.now()
+    batch_size = batch_size or int(getattr(settings, "SAVINGS_AUTOSAVE_BATCH_SIZE", 200))
+    summary: dict[str, Any] = {
+        "rules": 0,
+        AutoSaveRun.STATUS_SUCCESS: 0,
+        AutoSaveRun.STATUS_INSUFFICIENT_FUNDS: 0,
+        AutoSaveRun.STATUS_GOAL_REACHED: 0,
+        "saved": Decimal("0.00"),
+    }
+    while True:
+        claimed = _run_batch(now=now, batch_size=batch_size, summary=summary)
+        summary["rules"] += claimed
+        if claimed < batch_size:
+            break
+    return summary
@@ -0,0 +1,189 @@
+"""Goal completion forecasts computed in batch and stored per goal.
+
+Every goal's contributions over the lookback window are bucketed into weekly
+totals. A least-squares line through those totals gives the current weekly
+rate and its trend. The projected completion date is where the cumulative
+projected contributions first cover the remaining amount. The fit and the
+projection run as NumPy array operations over a whole batch of goals at once.
+
+Results are upserted into ``SavingsGoalForecast``, so API reads only join the
+stored row. The refresh is incremental. It recomputes a goal only when it has
+no forecast, when the goal changed after the forecast was computed (every
+balance write bumps ``updated_at``), or when the forecast is older than
+``SAVINGS_FORECAST_MAX_AGE_HOURS``, which keeps the deadline-based
+figures current.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import SavingsContribution, SavingsGoal, SavingsGoalForecast
+
+
+WEEK_SECONDS = 7 * 24 * 3600
+# Projections further out than this are reported as "not on current pace".
+HORIZON_WEEKS = 520
+_FORECAST_FIELDS = [
+    "weekly_rate",
+    "weekly_trend",
+    "cadence_days",
+    "projected_completion_date",
+    "required_weekly_amount",
+    "on_track",
+    "computed_at",
+]
+
+
+def fit_weekly_trend(weekly: np.ndarray, first_week: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Fit ``total = rate + trend * (week - last_week)`` per row of ``weekly``.
+
+    Weeks before ``first_week`` (before the goal existed) are left out of the
+    fit. Returns the fitted rate for the latest week and the trend per week.
+    """
+
+    weeks = np.arange(weekly.shape[1])
+    mask = weeks[None, :] >= first_week[:, None]
+    count = np.maximum(mask.sum(axis=1), 1)
+    x_mean = (mask * weeks).sum(axis=1) / count
+    y_mean = (mask * weekly).sum(axis=1) / count
+    dx = np.where(mask, weeks[None, :] - x_mean[:, None], 0.0)
+    variance = (dx * dx).sum(axis=1)
+    covariance = (dx * (weekly - y_mean[:, None])).sum(axis=1)
+    trend = np.divide(covariance, variance, out=np.zeros_like(covariance), where=variance > 0)
+    rate = y_mean + trend * (weekly.shape[1] - 1 - x_mean)
+    return rate, trend
+
+
+def weeks_to_cover(remaining: np.ndarray, rate: np.ndarray, trend: np.ndarray) -> np.ndarray:
+    """Weeks until ``rate + trend * k`` summed over weeks ``1..k`` reaches ``remaining``; ``inf`` if never.
+
+    The sum is ``trend / 2 * k**2 + (rate + trend / 2) * k``, so the smallest
+    positive root of that quadratic gives the answer.
+    """
+
+    rate = np.maximum(rate, 0.0)
+    b = rate + trend / 2
+    discriminant = b * b + 2 * trend * remaining
+    flat = np.abs(trend) < 1e-9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = np.where(rate > 0, remaining / rate, np.inf)
+        quadratic = np.where(discriminant >= 0, (-b + np.sqrt(np.maximum(discriminant, 0))) / trend, np.inf)
+    weeks = np.where(flat, linear, quadratic)
+    weeks = np.where(np.isfinite(weeks) & (weeks > 0), np.ceil(weeks), np.inf)
+    weeks[remaining <= 0] = 0
+    weeks[weeks > HORIZON_WEEKS] = np.inf
+    return weeks
+
+
+def _cents(value: float) -> Decimal:
+    return Decimal(int(round(value * 100))) / 100
+
+
+def _forecast_batch(goal_ids: list[Any], *, now: datetime, lookback_weeks: int) -> list[SavingsGoalForecast]:
+    goals = list(
+        SavingsGoal.objects.filter(pk__in=goal_ids)
+        .order_by("pk")
+        .values_list("pk", "created_at", "target_amount", "current_amount", "deadline")
+    )
+    index = {goal[0]: position for position, goal in enumerate(goals)}
+    window_start = now - timedelta(weeks=lookback_weeks)
+
+    rows = list(
+        SavingsContribution.objects.filter(goal_id__in=index, recorded_at__gte=window_start)
+        .order_by()
+        .values_list("goal_id", "recorded_at", "amount")
+    )
+    positions = np.fromiter((index[row[0]] for row in rows), dtype=np.int64, count=len(rows))
+    offsets = np.fromiter(((row[1] - window_start).total_seconds() for row in rows), dtype=np.float64, count=len(rows))
+    amounts = np.fromiter((float(row[2]) for row in rows), dtype=np.float64, count=len(rows))
+
+    weekly = np.zeros((len(goals), lookback_weeks), dtype=np.float64)
+    np.add.at(weekly, (positions, np.clip(offsets // WEEK_SECONDS, 0, lookback_weeks - 1).astype(np.int64)), amounts)
+    created = np.fromiter(((goal[1] - window_start).total_seconds() for goal in goals), dtype=np.float64)
+    first_week = np.clip(created // WEEK_SECONDS, 0, lookback_weeks - 1).astype(np.int64)
+    rate, trend = fit_weekly_trend(weekly, first_week)
+
+    # Cadence: the mean gap between contributions inside the window.
+    counts = np.bincount(positions, minlength=len(goals))
+    first_seen = np.full(len(goals), np.inf)
+    last_seen = np.full(len(goals), -np.inf)
+    np.minimum.at(first_seen, positions, offsets)
+    np.maximum.at(last_seen, positions, offsets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cadence = np.where(counts > 1, (last_seen - first_seen) / 86400 / (counts - 1), np.nan)
+
+    target = np.fromiter((float(goal[2]) for goal in goals), dtype=np.float64)
+    current = np.fromiter((float(goal[3]) for goal in goals), dtype=np.float64)
+    remaining = np.maximum(target - current, 0.0)
+    weeks_needed = weeks_to_cover(remaining, rate, trend)
+    weeks_left = np.fromiter(((goal[4] - now).total_seconds() / WEEK_SECONDS for goal in goals), dtype=np.float64)
+    required = np.where(weeks_left > 1, remaining / np.maximum(weeks_left, 1), remaining)
+
+    today = timezone.localdate(now)
+    forecasts = []
+    for position, (goal_id, _created, _target, _current, deadline) in enumerate(goals):
+        projected = None
+        if np.isfinite(weeks_needed[position]):
+            projected = today + timedelta(weeks=int(weeks_needed[position]))
+        forecasts.append(
+            SavingsGoalForecast(
+                goal_id=goal_id,
+                weekly_rate=_cents(max(rate[position], 0.0)),
+                weekly_trend=_cents(trend[position]),
+                cadence_days=None if np.isnan(cadence[position]) else Decimal(f"{cadence[position]:.1f}"),
+                projected_completion_date=projected,
+                required_weekly_amount=_cents(required[position]),
+                on_track=projected is not None and projected <= timezone.localdate(deadline),
+                computed_at=now,
+            )
+        )
+    return forecasts
+
+
+def stale_goals(*, now: datetime):
+    max_age = timedelta(hours=int(getattr(settings, "SAVINGS_FORECAST_MAX_AGE_HOURS", 24)))
+    return SavingsGoal.objects.filter(
+        Q(forecast__isnull=True)
+        | Q(forecast__computed_at__lt=F("updated_at"))
+        | Q(forecast__computed_at__lt=now - max_age)
+    )
+
+
+def refresh_forecasts(
+    *, now: datetime | None = None, batch_size: int | None = None, full: bool = False
+) -> int:
+    """Recompute forecasts for stale goals (every goal with ``full``), ``batch_size`` goals per pass.
+
+    Returns the number of forecasts written.
+    """
+
+    now = now or timezone.now()
+    batch_size = batch_size or int(getattr(settings, "SAVINGS_FORECAST_BATCH_SIZE", 5000))
+    lookback_weeks = int(getattr(settings, "SAVINGS_FORECAST_LOOKBACK_WEEKS", 26))
+    goals = SavingsGoal.objects.all() if full else stale_goals(now=now)
+
+    written = 0
+    last_pk = None
+    while True:
+        batch = goals.order_by("pk")
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        goal_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not goal_ids:
+            break
+        SavingsGoalForecast.objects.bulk_create(
+            _forecast_batch(goal_ids, now=now, lookback_weeks=lookback_weeks),
+            update_conflicts=True,
+            unique_fields=["goal"],
+            update_fields=_FORECAST_FIELDS,
+        )
+        written += len(goal_ids)
+        last_pk = goal_ids[-1]
+    return written
@@ -0,0 +1,35 @@
+"""Accrue promotional interest on savings goals for a past period."""
+from __future__ import annotations
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from ...accrual import accrue_interest
+
+
+class Command(BaseCommand):
+    help = "Credit interest on savings goals for the days ending on --date (default: yesterday)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", type=date.fromisoformat, help="Last day of the period (YYYY-MM-DD).")
+        parser.add_argument("--days", type=int, default=1, help="Length of the period in days.")
+        parser.add_argument("--rate-bps", type=int, help="Annual rate in basis points; defaults to the setting.")
+        parser.add_argument("--bonus-bps", type=int, help="Active-saver bonus in basis points; defaults to the setting.")
+        parser.add_argument("--batch-size", type=int, help="Goals locked and accrued per transaction.")
+        parser.add_argument("--workers", type=int, help="Processes that accrue goal ranges in parallel.")
+
+    def handle(self, *args, **options):
+        summary = accrue_interest(
+            period_end=options["date"],
+            days=options["days"],
+            rate_bps=options["rate_bps"],
+            bonus_bps=options["bonus_bps"],
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Credited {summary['amount']} to {summary['credited']} of {summary['goals']} goal(s)."
+            )
+        )
@@ -0,0 +1,18 @@
+"""Recompute stored savings goal completion forecasts."""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...forecast import refresh_forecasts
+
+
+class Command(BaseCommand):
+    help = "Refresh completion forecasts for goals that changed since their last forecast."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Recompute every goal, not only stale ones.")
+        parser.add_argument("--batch-size", type=int, help="Goals forecast per pass.")
+
+    def handle(self, *args, **options):
+        written = refresh_forecasts(batch_size=options["batch_size"], full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {written} forecast(s)."))
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:55
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0002_savingsredemption'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AutoSaveRule',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('frequency', models.CharField(choices=[('day', 'Daily'), ('week', 'Weekly'), ('month', 'Monthly')], default='week', max_length=8)),
+                ('interval', models.PositiveSmallIntegerField(default=1)),
+                ('next_run_at', models.DateTimeField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('last_run_status', models.CharField(blank=True, max_length=24)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('goal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='auto_save_rules', to='savings.savingsgoal')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='auto_save_rules', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['next_run_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AutoSaveRun',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('success', 'Success'), ('insufficient_funds', 'Insufficient funds'), ('goal_reached', 'Goal reached')], max_length=24)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('milestones', models.JSONField(blank=True, default=list)),
+                ('ran_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('contribution', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='auto_save_run', to='savings.savingscontribution')),
+                ('rule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='runs', to='savings.autosaverule')),
+            ],
+            options={
+                'ordering': ['-ran_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='autosaverule',
+            index=models.Index(fields=['is_active', 'next_run_at'], name='savings_autosave_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='autosaverun',
+            index=models.Index(fields=['rule', 'ran_at'], name='savings_autosave_run_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_contribution_stats(apps, schema_editor):
+    SavingsGoal = apps.get_model("savings", "SavingsGoal")
+    SavingsContribution = apps.get_model("savings", "SavingsContribution")
+
+    # Replay each goal's history oldest first, as the write paths would have.
+    goals = []
+    current = None
+    rows = SavingsContribution.objects.order_by("goal_id", "recorded_at").values_list("goal_id", "recorded_at")
+    for goal_id, recorded_at in rows.iterator(chunk_size=2000):
+        if current is None or current.pk != goal_id:
+            current = SavingsGoal(pk=goal_id, contribution_count=0, contribution_streak=1)
+            goals.append(current)
+        else:
+            gap = (timezone.localdate(recorded_at) - timezone.localdate(current.last_contribution_at)).days
+            if gap == 1:
+                current.contribution_streak += 1
+            elif gap > 1:
+                current.contribution_streak = 1
+        current.contribution_count += 1
+        current.last_contribution_at = recorded_at
+    SavingsGoal.objects.bulk_update(
+        goals, ["contribution_count", "last_contribution_at", "contribution_streak"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0003_auto_save_rules'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savingsgoal',
+            name='contribution_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='savingsgoal',
+            name='contribution_streak',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='savingsgoal',
+            name='last_contribution_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='savingscontribution',
+            index=models.Index(fields=['goal', 'user', 'recorded_at'], name='savings_contrib_history_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savingsredemption',
+            index=models.Index(fields=['goal', 'user', 'recorded_at'], name='savings_redeem_history_idx'),
+        ),
+        migrations.RunPython(backfill_contribution_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:01
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0004_goal_contribution_stats'),
+        ('transactions', '0005_transaction_interest_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavingsAccrual',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('period_start', models.DateField()),
+                ('period_end', models.DateField()),
+                ('rate_bps', models.PositiveIntegerField()),
+                ('bonus_bps', models.PositiveIntegerField(default=0)),
+                ('average_balance', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('posted_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('goal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accruals', to='savings.savingsgoal')),
+                ('transaction', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='savings_accrual', to='transactions.transaction')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='savings_accruals', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-period_start'],
+                'indexes': [models.Index(fields=['goal', 'posted_at'], name='savings_accrual_posted_idx')],
+                'constraints': [models.UniqueConstraint(fields=('goal', 'period_start'), name='savings_accrual_period_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0005_savings_accruals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavingsGoalForecast',
+            fields=[
+                ('goal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='forecast', serialize=False, to='savings.savingsgoal')),
+                ('weekly_rate', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('weekly_trend', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cadence_days', models.DecimalField(blank=True, decimal_places=1, max_digits=7, null=True)),
+                ('projected_completion_date', models.DateField(blank=True, null=True)),
+                ('required_weekly_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('on_track', models.BooleanField(default=False)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['computed_at'], name='savings_forecast_computed_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savings', '0006_goal_forecasts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savingsaccrual',
+            index=models.Index(fields=['period_end', 'goal'], name='savings_accrual_end_idx'),
+        ),
+    ]
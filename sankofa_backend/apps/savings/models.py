@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.db import models
@@ -22,6 +23,11 @@ class SavingsGoal(models.Model):
     current_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     deadline = models.DateTimeField()
     category = models.CharField(max_length=128)
+    # Maintained by the contribution write paths so goal lists never read history.
+    contribution_count = models.PositiveIntegerField(default=0)
+    last_contribution_at = models.DateTimeField(blank=True, null=True)
+    # Consecutive calendar days with a contribution, ending on ``last_contribution_at``.
+    contribution_streak = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -39,6 +45,32 @@ class SavingsGoal(models.Model):
             return 0.0
         return float(self.current_amount) / float(self.target_amount)
 
+    @property
+    def current_streak(self) -> int:
+        """The stored streak, or 0 once a full day has passed without a contribution."""
+
+        if self.last_contribution_at is None:
+            return 0
+        if timezone.localdate(self.last_contribution_at) < timezone.localdate() - timedelta(days=1):
+            return 0
+        return self.contribution_streak
+
+    def note_contribution(self, recorded_at: datetime) -> None:
+        """Fold one contribution into the maintained stats; the caller writes them."""
+
+        self.contribution_count += 1
+        if self.last_contribution_at is None:
+            self.contribution_streak = 1
+            self.last_contribution_at = recorded_at
+            return
+        gap = (timezone.localdate(recorded_at) - timezone.localdate(self.last_contribution_at)).days
+        if gap == 1:
+            self.contribution_streak += 1
+        elif gap > 1:
+            self.contribution_streak = 1
+        if recorded_at > self.last_contribution_at:
+            self.last_contribution_at = recorded_at
+
 
 class SavingsContribution(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -52,6 +84,9 @@ class SavingsContribution(models.Model):
 
     class Meta:
         ordering = ["-recorded_at"]
+        indexes = [
+            models.Index(fields=["goal", "user", "recorded_at"], name="savings_contrib_history_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.amount} to {self.goal.title}"
@@ -69,6 +104,133 @@ class SavingsRedemption(models.Model):
 
     class Meta:
         ordering = ["-recorded_at"]
+        indexes = [
+            models.Index(fields=["goal", "user", "recorded_at"], name="savings_redeem_history_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.amount} withdrawal from {self.goal.title}"
+
+
+class AutoSaveRule(models.Model):
+    """A recurring contribution to a goal, executed by the auto-save scheduler."""
+
+    FREQUENCY_DAILY = "day"
+    FREQUENCY_WEEKLY = "week"
+    FREQUENCY_MONTHLY = "month"
+    FREQUENCY_CHOICES = (
+        (FREQUENCY_DAILY, "Daily"),
+        (FREQUENCY_WEEKLY, "Weekly"),
+        (FREQUENCY_MONTHLY, "Monthly"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    goal = models.ForeignKey(SavingsGoal, related_name="auto_save_rules", on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="auto_save_rules", on_delete=models.CASCADE)
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    frequency = models.CharField(max_length=8, choices=FREQUENCY_CHOICES, default=FREQUENCY_WEEKLY)
+    interval = models.PositiveSmallIntegerField(default=1)
+    # Precomputed so the scheduler only reads rules that are due.
+    next_run_at = models.DateTimeField()
+    is_active = models.BooleanField(default=True)
+    last_run_at = models.DateTimeField(blank=True, null=True)
+    last_run_status = models.CharField(max_length=24, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["next_run_at"]
+        indexes = [
+            models.Index(fields=["is_active", "next_run_at"], name="savings_autosave_due_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - debug helper
+        return f"{self.amount} every {self.interval} {self.frequency} to {self.goal.title}"
+
+
+class AutoSaveRun(models.Model):
+    """Outcome of one scheduled execution of an ``AutoSaveRule``."""
+
+    STATUS_SUCCESS = "success"
+    STATUS_INSUFFICIENT_FUNDS = "insufficient_funds"
+    STATUS_GOAL_REACHED = "goal_reached"
+    STATUS_CHOICES = (
+        (STATUS_SUCCESS, "Success"),
+        (STATUS_INSUFFICIENT_FUNDS, "Insufficient funds"),
+        (STATUS_GOAL_REACHED, "Goal reached"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    rule = models.ForeignKey(AutoSaveRule, related_name="runs", on_delete=models.CASCADE)
+    contribution = models.OneToOneField(
+        SavingsContribution, related_name="auto_save_run", on_delete=models.SET_NULL, blank=True, null=True
+    )
+    status = models.CharField(max_length=24, choices=STATUS_CHOICES)
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    # Milestone thresholds (0.25, 0.5, ...) crossed by this run's contribution.
+    milestones = models.JSONField(default=list, blank=True)
+    ran_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["-ran_at"]
+        indexes = [
+            models.Index(fields=["rule", "ran_at"], name="savings_autosave_run_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - debug helper
+        return f"{self.status} for {self.rule_id} at {self.ran_at}"
+
+
+class SavingsAccrual(models.Model):
+    """Interest (and any active-saver bonus) credited to a goal for one accrual period."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    goal = models.ForeignKey(SavingsGoal, related_name="accruals", on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="savings_accruals", on_delete=models.CASCADE)
+    period_start = models.DateField()
+    period_end = models.DateField()
+    # Annual rates in basis points; the bonus is zero for goals without a contribution in the period.
+    rate_bps = models.PositiveIntegerField()
+    bonus_bps = models.PositiveIntegerField(default=0)
+    average_balance = models.DecimalField(max_digits=12, decimal_places=2)
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    transaction = models.OneToOneField(
+        "transactions.Transaction", related_name="savings_accrual", on_delete=models.SET_NULL, blank=True, null=True
+    )
+    posted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["-period_start"]
+        constraints = [
+            models.UniqueConstraint(fields=["goal", "period_start"], name="savings_accrual_period_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["goal", "posted_at"], name="savings_accrual_posted_idx"),
+            # Serves the overlap check: only the latest nights' rows have a recent period_end.
+            models.Index(fields=["period_end", "goal"], name="savings_accrual_end_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - debug helper
+        return f"{self.amount} interest on {self.goal_id} from {self.period_start}"
+
+
+class SavingsGoalForecast(models.Model):
+    """Stored completion projection for a goal, refreshed in batch by ``forecast.refresh_forecasts``."""
+
+    goal = models.OneToOneField(SavingsGoal, primary_key=True, related_name="forecast", on_delete=models.CASCADE)
+    # Fitted from weekly contribution totals: the current weekly rate and its change per week.
+    weekly_rate = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    weekly_trend = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cadence_days = models.DecimalField(max_digits=7, decimal_places=1, blank=True, null=True)
+    projected_completion_date = models.DateField(blank=True, null=True)
+    required_weekly_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    on_track = models.BooleanField(default=False)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["computed_at"], name="savings_forecast_computed_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - debug helper
+        return f"Forecast for {self.goal_id}: {self.projected_completion_date}"
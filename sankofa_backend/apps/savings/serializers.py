@@ -1,11 +1,41 @@
 from __future__ import annotations
 
+from django.utils import timezone
 from rest_framework import serializers
 
-from .models import SavingsContribution, SavingsGoal, SavingsRedemption
+from .models import AutoSaveRule, SavingsContribution, SavingsGoal, SavingsGoalForecast, SavingsRedemption
 from sankofa_backend.apps.transactions.serializers import TransactionSerializer, WalletSerializer
 
 
+class SavingsGoalForecastSerializer(serializers.ModelSerializer):
+    weeklyRate = serializers.DecimalField(source="weekly_rate", max_digits=12, decimal_places=2, coerce_to_string=False)
+    weeklyTrend = serializers.DecimalField(
+        source="weekly_trend", max_digits=12, decimal_places=2, coerce_to_string=False
+    )
+    cadenceDays = serializers.DecimalField(
+        source="cadence_days", max_digits=7, decimal_places=1, coerce_to_string=False, allow_null=True
+    )
+    projectedCompletionDate = serializers.DateField(source="projected_completion_date", allow_null=True)
+    requiredWeeklyAmount = serializers.DecimalField(
+        source="required_weekly_amount", max_digits=12, decimal_places=2, coerce_to_string=False
+    )
+    onTrack = serializers.BooleanField(source="on_track")
+    computedAt = serializers.DateTimeField(source="computed_at")
+
+    class Meta:
+        model = SavingsGoalForecast
+        fields = (
+            "weeklyRate",
+            "weeklyTrend",
+            "cadenceDays",
+            "projectedCompletionDate",
+            "requiredWeeklyAmount",
+            "onTrack",
+            "computedAt",
+        )
+        read_only_fields = fields
+
+
 class SavingsGoalSerializer(serializers.ModelSerializer):
     userId = serializers.UUIDField(source="user_id", read_only=True)
     targetAmount = serializers.DecimalField(source="target_amount", max_digits=12, decimal_places=2, coerce_to_string=False)
@@ -13,6 +43,11 @@ class SavingsGoalSerializer(serializers.ModelSerializer):
         source="current_amount", max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True
     )
     deadline = serializers.DateTimeField()
+    contributionCount = serializers.IntegerField(source="contribution_count", read_only=True)
+    lastContributionAt = serializers.DateTimeField(source="last_contribution_at", read_only=True)
+    contributionStreak = serializers.IntegerField(source="current_streak", read_only=True)
+    # Stored by the forecast refresh job; null until the goal's first refresh.
+    forecast = SavingsGoalForecastSerializer(read_only=True, allow_null=True)
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
     updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
 
@@ -26,6 +61,10 @@ class SavingsGoalSerializer(serializers.ModelSerializer):
             "currentAmount",
             "deadline",
             "category",
+            "contributionCount",
+            "lastContributionAt",
+            "contributionStreak",
+            "forecast",
             "createdAt",
             "updatedAt",
         )
@@ -79,6 +118,48 @@ class SavingsRedemptionCreateSerializer(serializers.Serializer):
         return value
 
 
+class AutoSaveRuleSerializer(serializers.ModelSerializer):
+    goalId = serializers.PrimaryKeyRelatedField(source="goal", queryset=SavingsGoal.objects.none())
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, coerce_to_string=False)
+    interval = serializers.IntegerField(min_value=1, max_value=365, required=False, default=1)
+    nextRunAt = serializers.DateTimeField(source="next_run_at", required=False)
+    isActive = serializers.BooleanField(source="is_active", required=False, default=True)
+    lastRunAt = serializers.DateTimeField(source="last_run_at", read_only=True)
+    lastRunStatus = serializers.CharField(source="last_run_status", read_only=True)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = AutoSaveRule
+        fields = (
+            "id",
+            "goalId",
+            "amount",
+            "frequency",
+            "interval",
+            "nextRunAt",
+            "isActive",
+            "lastRunAt",
+            "lastRunStatus",
+            "createdAt",
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            fields["goalId"].queryset = SavingsGoal.objects.for_user(request.user)
+        return fields
+
+    def validate_amount(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("Auto-save amount must be greater than zero.")
+        return value
+
+    def create(self, validated_data):
+        validated_data.setdefault("next_run_at", timezone.now())
+        return AutoSaveRule.objects.create(user=self.context["request"].user, **validated_data)
+
+
 class SavingsMilestoneSerializer(serializers.Serializer):
     threshold = serializers.FloatField()
     achievedAt = serializers.DateTimeField()
@@ -7,7 +7,7 @@ from typing import List
 
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
-from django.utils import timezone
+from django.db.models import F
 
 from .models import SavingsContribution, SavingsGoal, SavingsRedemption
 from sankofa_backend.apps.transactions.models import Transaction, Wallet
@@ -24,6 +24,22 @@ class SavingsMilestone:
     message: str
 
 
+def _apply_goal_delta(goal: SavingsGoal, delta: Decimal, *, now: datetime, contributed: bool = False) -> None:
+    # The goal row is locked by the caller, so the new balance and stats are
+    # known without reading them back after the ``UPDATE``.
+    updates = {"current_amount": F("current_amount") + delta, "updated_at": now}
+    if contributed:
+        goal.note_contribution(now)
+        updates.update(
+            contribution_count=F("contribution_count") + 1,
+            last_contribution_at=goal.last_contribution_at,
+            contribution_streak=goal.contribution_streak,
+        )
+    SavingsGoal.objects.filter(pk=goal.pk).update(**updates)
+    goal.current_amount += delta
+    goal.updated_at = now
+
+
 def record_contribution(
     *,
     goal: SavingsGoal,
@@ -51,20 +67,15 @@ def record_contribution(
             description=f"Savings contribution to {locked_goal.title}",
             note=note,
         )
-
-        locked_goal.current_amount = locked_goal.current_amount + amount
-        locked_goal.updated_at = timezone.now()
-        locked_goal.save(update_fields=["current_amount", "updated_at"])
-        locked_goal.refresh_from_db()
-
         contribution = SavingsContribution.objects.create(
             goal=locked_goal,
             user=user,
             amount=amount,
             channel=channel,
             note=note,
-            recorded_at=timezone.now(),
+            recorded_at=transaction_record.occurred_at,
         )
+        _apply_goal_delta(locked_goal, amount, now=transaction_record.occurred_at, contributed=True)
 
     milestones = _calculate_milestones(
         goal=locked_goal,
@@ -96,35 +107,38 @@ def collect_savings(
             description=f"Savings payout from {locked_goal.title}",
             note=note,
         )
-
-        locked_goal.current_amount = locked_goal.current_amount - amount
-        locked_goal.updated_at = timezone.now()
-        locked_goal.save(update_fields=["current_amount", "updated_at"])
-        locked_goal.refresh_from_db()
-
         redemption = SavingsRedemption.objects.create(
             goal=locked_goal,
             user=user,
             amount=amount,
             channel=channel,
             note=note,
-            recorded_at=timezone.now(),
+            recorded_at=transaction_record.occurred_at,
         )
+        _apply_goal_delta(locked_goal, -amount, now=transaction_record.occurred_at)
 
     return locked_goal, redemption, transaction_record, user_wallet, platform_wallet
 
 
-def _calculate_milestones(*, goal: SavingsGoal, previous_progress: float, achieved_at: datetime) -> List[SavingsMilestone]:
-    current_progress = goal.progress
-    unlocked: list[SavingsMilestone] = []
+def crossed_milestones(previous_progress: float, current_progress: float) -> list[float]:
+    """Return the milestone thresholds passed when progress moves from ``previous`` to ``current``."""
+
+    return [
+        float(threshold)
+        for threshold in MILESTONE_THRESHOLDS
+        if previous_progress < float(threshold) <= current_progress
+    ]
 
-    for threshold in MILESTONE_THRESHOLDS:
-        threshold_float = float(threshold)
-        if previous_progress < threshold_float <= current_progress:
-            message = _build_milestone_message(goal, threshold_float)
-            unlocked.append(SavingsMilestone(threshold=threshold_float, achieved_at=achieved_at, message=message))
 
-    return unlocked
+def _calculate_milestones(*, goal: SavingsGoal, previous_progress: float, achieved_at: datetime) -> List[SavingsMilestone]:
+    return [
+        SavingsMilestone(
+            threshold=threshold,
+            achieved_at=achieved_at,
+            message=_build_milestone_message(goal, threshold),
+        )
+        for threshold in crossed_milestones(previous_progress, goal.progress)
+    ]
 
 
 def _build_milestone_message(goal: SavingsGoal, threshold: float) -> str:
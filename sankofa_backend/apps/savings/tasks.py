@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from .accrual import accrue_interest
+from .autosave import run_due_rules
+from .forecast import refresh_forecasts
+
+
+@shared_task(name="savings.run_auto_save_rules")
+def run_auto_save_rules(batch_size: int | None = None) -> dict[str, int | str]:
+    """Execute due auto-save rules in batches; scheduled by Celery beat."""
+
+    summary = run_due_rules(batch_size=batch_size)
+    return {**summary, "saved": str(summary["saved"])}
+
+
+@shared_task(name="savings.accrue_interest")
+def accrue_savings_interest() -> dict[str, int | str]:
+    """Credit yesterday's interest on savings goals; scheduled by Celery beat."""
+
+    summary = accrue_interest()
+    return {**summary, "amount": str(summary["amount"])}
+
+
+@shared_task(name="savings.refresh_forecasts")
+def refresh_goal_forecasts(batch_size: int | None = None) -> int:
+    """Recompute completion forecasts for goals that changed; scheduled by Celery beat."""
+
+    return refresh_forecasts(batch_size=batch_size)
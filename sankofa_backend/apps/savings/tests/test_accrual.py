@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import io
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from sankofa_backend.apps.savings.accrual import accrue_interest
+from sankofa_backend.apps.savings.models import SavingsAccrual, SavingsContribution, SavingsGoal, SavingsRedemption
+from sankofa_backend.apps.transactions.models import Transaction
+
+User = get_user_model()
+
+
+class InterestAccrualTests(TestCase):
+    def setUp(self) -> None:
+        self.today = timezone.localdate()
+        self.user = User.objects.create_user(phone_number="0246660000", full_name="Interest Saver")
+
+    def _goal(self, title: str, current: str) -> SavingsGoal:
+        return SavingsGoal.objects.create(
+            user=self.user,
+            title=title,
+            target_amount=Decimal("5000.00"),
+            current_amount=Decimal(current),
+            deadline=timezone.now() + timedelta(days=90),
+            category="General",
+        )
+
+    def test_accrues_on_daily_balances_rebuilt_from_history(self):
+        steady = self._goal("Steady", "1000.00")
+        active = self._goal("Active", "600.00")
+        empty = self._goal("Empty", "0.00")
+        two_days_ago = timezone.make_aware(datetime.combine(self.today - timedelta(days=2), time(12)))
+        SavingsContribution.objects.create(goal=active, user=self.user, amount=Decimal("300.00"), recorded_at=two_days_ago)
+        SavingsRedemption.objects.create(goal=active, user=self.user, amount=Decimal("100.00"))
+
+        # 3650 bps pays 0.1% a day. Active's balances were 400, 700 and 700,
+        # and its contribution earns the 730 bps bonus.
+        summary = accrue_interest(days=3, rate_bps=3650, bonus_bps=730, batch_size=2)
+
+        self.assertEqual((summary["goals"], summary["credited"]), (3, 2))
+        self.assertEqual(summary["amount"], Decimal("5.16"))
+        steady.refresh_from_db()
+        active.refresh_from_db()
+        empty.refresh_from_db()
+        self.assertEqual(
+            (steady.current_amount, active.current_amount, empty.current_amount),
+            (Decimal("1003.00"), Decimal("602.16"), Decimal("0.00")),
+        )
+        accrual = SavingsAccrual.objects.get(goal=active)
+        self.assertEqual((accrual.average_balance, accrual.bonus_bps), (Decimal("600.00"), 730))
+        self.assertEqual(accrual.transaction.transaction_type, Transaction.TYPE_INTEREST)
+        self.assertEqual(SavingsAccrual.objects.get(goal=steady).bonus_bps, 0)
+
+        # Re-running the same period credits nothing twice.
+        stdout = io.StringIO()
+        call_command("accrue_savings_interest", "--days", "3", "--rate-bps", "3650", stdout=stdout)
+        self.assertIn("to 0 of 1 goal(s)", stdout.getvalue())
+        self.assertEqual(Transaction.objects.filter(transaction_type=Transaction.TYPE_INTEREST).count(), 2)
+
+        # A window overlapping days already paid skips those goals too.
+        self.assertEqual(accrue_interest(days=1, rate_bps=3650)["credited"], 0)
+        self.assertEqual(accrue_interest(days=5, rate_bps=3650)["credited"], 0)
+
+    def test_earlier_interest_is_part_of_the_balance_history(self):
+        goal = self._goal("Compounding", "1000.00")
+        accrue_interest(period_end=self.today - timedelta(days=2), rate_bps=3650)
+        goal.refresh_from_db()
+        self.assertEqual(goal.current_amount, Decimal("1001.00"))
+
+        # The first credit was posted today, so yesterday's balance excludes it.
+        accrue_interest(rate_bps=3650)
+        goal.refresh_from_db()
+        self.assertEqual(goal.current_amount, Decimal("1002.00"))
+        self.assertEqual(accrue_interest(rate_bps=0)["credited"], 0)
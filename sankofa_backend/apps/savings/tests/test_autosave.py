@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from sankofa_backend.apps.savings.autosave import run_due_rules
+from sankofa_backend.apps.savings.models import AutoSaveRule, AutoSaveRun, SavingsContribution, SavingsGoal
+from sankofa_backend.apps.transactions.models import Transaction, Wallet
+
+User = get_user_model()
+
+
+class AutoSaveSchedulerTests(APITestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.platform_wallet = Wallet.objects.ensure_platform()
+        self.user = User.objects.create_user(phone_number="0245550000", full_name="Auto Saver")
+        Wallet.objects.filter(user=self.user).update(balance=Decimal("150.00"))
+
+    def _goal(self, user, *, title: str, current: str = "0.00", target: str = "400.00") -> SavingsGoal:
+        return SavingsGoal.objects.create(
+            user=user,
+            title=title,
+            target_amount=Decimal(target),
+            current_amount=Decimal(current),
+            deadline=self.now + timedelta(days=90),
+            category="General",
+        )
+
+    def _rule(self, goal: SavingsGoal, amount: str, **overrides) -> AutoSaveRule:
+        values = {"goal": goal, "user": goal.user, "amount": Decimal(amount), "next_run_at": self.now}
+        values.update(overrides)
+        return AutoSaveRule.objects.create(**values)
+
+    def test_due_rules_run_in_batches_per_wallet(self):
+        school = self._goal(self.user, title="School Fees", current="50.00")
+        rent = self._goal(self.user, title="Rent")
+        done = self._goal(self.user, title="Phone", current="100.00", target="100.00")
+        weekly = self._rule(school, "60.00", next_run_at=self.now - timedelta(days=15))
+        monthly = self._rule(rent, "100.00", frequency=AutoSaveRule.FREQUENCY_MONTHLY)
+        finished = self._rule(done, "10.00")
+        upcoming = self._rule(rent, "5.00", next_run_at=self.now + timedelta(days=1))
+
+        other = User.objects.create_user(phone_number="0245550001", full_name="Other Saver")
+        Wallet.objects.filter(user=other).update(balance=Decimal("20.00"))
+        daily = self._rule(self._goal(other, title="Travel"), "20.00", frequency=AutoSaveRule.FREQUENCY_DAILY)
+
+        summary = run_due_rules(now=self.now, batch_size=2)
+
+        self.assertEqual(summary["rules"], 4)
+        self.assertEqual(summary[AutoSaveRun.STATUS_SUCCESS], 2)
+        self.assertEqual(summary[AutoSaveRun.STATUS_INSUFFICIENT_FUNDS], 1)
+        self.assertEqual(summary[AutoSaveRun.STATUS_GOAL_REACHED], 1)
+        self.assertEqual(summary["saved"], Decimal("80.00"))
+
+        self.assertEqual(Wallet.objects.get(user=self.user).balance, Decimal("90.00"))
+        self.assertEqual(Wallet.objects.get(user=other).balance, Decimal("0.00"))
+        self.assertEqual(Wallet.objects.get(pk=self.platform_wallet.pk).balance, Decimal("80.00"))
+        school.refresh_from_db()
+        self.assertEqual(school.current_amount, Decimal("110.00"))
+        self.assertEqual((school.contribution_count, school.last_contribution_at), (1, self.now))
+        self.assertEqual(Transaction.objects.filter(transaction_type=Transaction.TYPE_SAVINGS).count(), 2)
+        self.assertEqual(SavingsContribution.objects.count(), 2)
+
+        run = AutoSaveRun.objects.get(rule=weekly)
+        self.assertEqual(run.milestones, [0.25])
+        self.assertEqual(run.contribution.goal_id, school.pk)
+        self.assertEqual(AutoSaveRun.objects.get(rule=monthly).status, AutoSaveRun.STATUS_INSUFFICIENT_FUNDS)
+
+        # Missed weeks are skipped rather than replayed.
+        weekly.refresh_from_db()
+        self.assertEqual(weekly.next_run_at, self.now + timedelta(weeks=1) - timedelta(days=1))
+        daily.refresh_from_db()
+        self.assertEqual(daily.next_run_at, self.now + timedelta(days=1))
+        finished.refresh_from_db()
+        self.assertFalse(finished.is_active)
+        self.assertFalse(AutoSaveRun.objects.filter(rule=upcoming).exists())
+
+        # Nothing is due again until the rescheduled times.
+        self.assertEqual(run_due_rules(now=self.now)["rules"], 0)
+
+    def test_members_manage_their_own_rules(self):
+        goal = self._goal(self.user, title="Market Stall")
+        foreign_goal = self._goal(User.objects.create_user(phone_number="0245550002", full_name="X"), title="Theirs")
+        self.client.force_authenticate(self.user)
+        url = reverse("savings:auto-save-rule-list")
+
+        response = self.client.post(
+            url, {"goalId": str(foreign_goal.pk), "amount": "10.00", "frequency": "week"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("goalId", response.json())
+
+        response = self.client.post(url, {"goalId": str(goal.pk), "amount": "10.00", "frequency": "day"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertEqual((body["amount"], body["interval"], body["isActive"]), (10.0, 1, True))
+        self.assertIsNotNone(body["nextRunAt"])
+
+        self.assertEqual([rule["id"] for rule in self.client.get(url).json()], [body["id"]])
+        detail = reverse("savings:auto-save-rule-detail", args=[body["id"]])
+        self.assertEqual(self.client.patch(detail, {"isActive": False}, format="json").json()["isActive"], False)
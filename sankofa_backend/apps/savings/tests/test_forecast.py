@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from sankofa_backend.apps.savings.forecast import fit_weekly_trend, refresh_forecasts, weeks_to_cover
+from sankofa_backend.apps.savings.models import SavingsContribution, SavingsGoal, SavingsGoalForecast
+from sankofa_backend.apps.savings.services import record_contribution
+from sankofa_backend.apps.transactions.models import Wallet
+
+User = get_user_model()
+
+
+class GoalForecastTests(APITestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.user = User.objects.create_user(phone_number="0247770000", full_name="Forecast Saver")
+        Wallet.objects.filter(user=self.user).update(balance=Decimal("500.00"))
+        Wallet.objects.ensure_platform()
+
+    def _goal(self, title: str, *, current: str, weeks_old: int) -> SavingsGoal:
+        goal = SavingsGoal.objects.create(
+            user=self.user,
+            title=title,
+            target_amount=Decimal("1000.00"),
+            current_amount=Decimal(current),
+            deadline=self.now + timedelta(weeks=20),
+            category="General",
+        )
+        SavingsGoal.objects.filter(pk=goal.pk).update(
+            created_at=self.now - timedelta(weeks=weeks_old), updated_at=self.now - timedelta(hours=1)
+        )
+        return goal
+
+    def test_fit_and_projection_are_vectorized_over_goals(self):
+        rate, trend = fit_weekly_trend(
+            np.array([[0.0, 0.0, 10.0, 20.0, 30.0], [5.0, 5.0, 5.0, 5.0, 5.0]]), np.array([2, 0])
+        )
+        np.testing.assert_allclose(rate, [30.0, 5.0])
+        np.testing.assert_allclose(trend, [10.0, 0.0])
+
+        weeks = weeks_to_cover(
+            np.array([450.0, 50.0, 1000.0, 0.0]), np.array([100.0, 10.0, 10.0, 0.0]), np.array([0.0, 10.0, -5.0, 0.0])
+        )
+        # Flat pace, an accelerating pace (20 + 30 + ...), a pace that dies out, and a finished goal.
+        self.assertEqual(weeks.tolist(), [5.0, 2.0, float("inf"), 0.0])
+
+    def test_refresh_stores_projection_and_only_revisits_changed_goals(self):
+        steady = self._goal("Steady", current="400.00", weeks_old=8)
+        idle = self._goal("Idle", current="100.00", weeks_old=8)
+        SavingsContribution.objects.bulk_create(
+            SavingsContribution(
+                goal=steady,
+                user=self.user,
+                amount=Decimal("50.00"),
+                recorded_at=self.now - timedelta(weeks=weeks_ago, hours=1),
+            )
+            for weeks_ago in range(8)
+        )
+
+        self.assertEqual(refresh_forecasts(now=self.now), 2)
+        forecast = SavingsGoalForecast.objects.get(goal=steady)
+        self.assertEqual((forecast.weekly_rate, forecast.weekly_trend), (Decimal("50.00"), Decimal("0.00")))
+        self.assertEqual(forecast.cadence_days, Decimal("7.0"))
+        self.assertEqual(forecast.projected_completion_date, timezone.localdate(self.now) + timedelta(weeks=12))
+        self.assertEqual(forecast.required_weekly_amount, Decimal("30.00"))
+        self.assertTrue(forecast.on_track)
+        idle_forecast = SavingsGoalForecast.objects.get(goal=idle)
+        self.assertIsNone(idle_forecast.projected_completion_date)
+        self.assertFalse(idle_forecast.on_track)
+
+        self.assertEqual(refresh_forecasts(now=self.now), 0)
+        record_contribution(goal=idle, user=self.user, amount=Decimal("25.00"), channel="Mobile Money", note="")
+        self.assertEqual(refresh_forecasts(), 1)
+        self.assertEqual(refresh_forecasts(now=self.now + timedelta(days=2)), 2)
+
+        self.client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            payload = self.client.get(reverse("savings:goal-list")).json()
+        self.assertFalse(any("savings_savingscontribution" in query["sql"] for query in queries.captured_queries))
+        by_title = {goal["title"]: goal for goal in payload}
+        forecast.refresh_from_db()
+        self.assertEqual(by_title["Steady"]["forecast"]["requiredWeeklyAmount"], float(forecast.required_weekly_amount))
+        self.assertIn("projectedCompletionDate", by_title["Idle"]["forecast"])
@@ -4,12 +4,15 @@ from datetime import timedelta
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from sankofa_backend.apps.savings.models import SavingsContribution, SavingsGoal, SavingsRedemption
+from sankofa_backend.apps.savings.services import collect_savings, record_contribution
 from sankofa_backend.apps.transactions.models import Transaction, Wallet
 
 User = get_user_model()
@@ -123,6 +126,34 @@ class SavingsGoalAPITests(APITestCase):
         goal.refresh_from_db()
         self.assertEqual(goal.current_amount, Decimal("200.00"))
 
+    def test_contribution_and_collection_use_fused_wallet_updates(self):
+        goal = self._create_goal(target_amount=Decimal("1000.00"), current_amount=Decimal("200.00"))
+
+        # Goal lock, one wallet lock, one wallet update, goal update and the two
+        # inserts, plus the savepoint pair around them.
+        with self.assertNumQueries(8):
+            updated_goal, contribution, _milestones, record, wallet, platform = record_contribution(
+                goal=goal, user=self.user, amount=Decimal("100.00"), channel="Mobile Money", note=""
+            )
+        self.assertEqual(updated_goal.current_amount, Decimal("300.00"))
+        self.assertEqual((wallet.balance, platform.balance), (Decimal("4900.00"), Decimal("25100.00")))
+        self.assertEqual(record.balance_after, Decimal("4900.00"))
+        self.assertEqual(contribution.recorded_at, record.occurred_at)
+
+        with self.assertNumQueries(8):
+            updated_goal, _redemption, record, wallet, platform = collect_savings(
+                goal=goal, user=self.user, amount=Decimal("250.00"), channel="Mobile Money", note=""
+            )
+        self.assertEqual(updated_goal.current_amount, Decimal("50.00"))
+        self.assertEqual(record.transaction_type, Transaction.TYPE_PAYOUT)
+
+        goal.refresh_from_db()
+        self.wallet.refresh_from_db()
+        self.platform_wallet.refresh_from_db()
+        self.assertEqual(goal.current_amount, Decimal("50.00"))
+        self.assertEqual(self.wallet.balance, Decimal("5150.00"))
+        self.assertEqual(self.platform_wallet.balance, Decimal("24850.00"))
+
     def test_contributions_list_returns_only_user_entries(self):
         goal = self._create_goal()
         SavingsContribution.objects.create(
@@ -143,10 +174,41 @@ class SavingsGoalAPITests(APITestCase):
         url = reverse("savings:goal-contributions", kwargs={"pk": goal.pk})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
         self.assertEqual(Decimal(str(data[0]["amount"])), Decimal("150.00"))
 
+    def test_history_is_cursor_paginated_and_list_reads_stat_columns(self):
+        goal = self._create_goal(target_amount=Decimal("5000.00"))
+        for _ in range(3):
+            record_contribution(goal=goal, user=self.user, amount=Decimal("10.00"), channel="Mobile Money", note="")
+        collect_savings(goal=goal, user=self.user, amount=Decimal("5.00"), channel="Mobile Money", note="")
+
+        url = reverse("savings:goal-contributions", kwargs={"pk": goal.pk})
+        first = self.client.get(url, {"page_size": 2}).json()
+        self.assertEqual(len(first["results"]), 2)
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+        redemptions = self.client.get(reverse("savings:goal-redemptions", kwargs={"pk": goal.pk})).json()
+        self.assertEqual([entry["amount"] for entry in redemptions["results"]], [5.0])
+
+        with CaptureQueriesContext(connection) as queries:
+            payload = self.client.get(reverse("savings:goal-list")).json()
+        self.assertFalse(any("savings_savingscontribution" in query["sql"] for query in queries.captured_queries))
+        self.assertEqual((payload[0]["contributionCount"], payload[0]["contributionStreak"]), (3, 1))
+        self.assertIsNotNone(payload[0]["lastContributionAt"])
+
+    def test_streak_counts_consecutive_contribution_days(self):
+        goal = self._create_goal()
+        today = timezone.now()
+        for days_ago in (5, 2, 1, 1):
+            goal.note_contribution(today - timedelta(days=days_ago))
+        self.assertEqual((goal.contribution_count, goal.contribution_streak), (4, 2))
+        self.assertEqual(goal.current_streak, 2)
+        goal.last_contribution_at = today - timedelta(days=2)
+        self.assertEqual(goal.current_streak, 0)
+
     def test_collect_endpoint_returns_funds_to_wallet(self):
         goal = self._create_goal(current_amount=Decimal("800.00"))
 
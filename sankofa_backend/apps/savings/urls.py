@@ -1,10 +1,11 @@
 from rest_framework.routers import DefaultRouter
 
-from .views import SavingsGoalViewSet
+from .views import AutoSaveRuleViewSet, SavingsGoalViewSet
 
 app_name = "savings"
 
 router = DefaultRouter()
 router.register(r"goals", SavingsGoalViewSet, basename="goal")
+router.register(r"auto-save-rules", AutoSaveRuleViewSet, basename="auto-save-rule")
 
 urlpatterns = router.urls
@@ -4,27 +4,41 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 
-from .models import SavingsGoal
+from .models import AutoSaveRule, SavingsGoal
 from .serializers import (
+    AutoSaveRuleSerializer,
     SavingsContributionCreateSerializer,
     SavingsContributionOutcomeSerializer,
     SavingsContributionSerializer,
     SavingsGoalSerializer,
     SavingsRedemptionCreateSerializer,
     SavingsRedemptionOutcomeSerializer,
+    SavingsRedemptionSerializer,
 )
 from .services import collect_savings, record_contribution
 from sankofa_backend.apps.groups.realtime import broadcast_group_event
 
 
+class SavingsHistoryPagination(CursorPagination):
+    """Keyset pages over ``(goal, user, recorded_at)``; deep pages cost the same as the first."""
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-recorded_at", "-id")
+
+
 class SavingsGoalViewSet(viewsets.ModelViewSet):
     serializer_class = SavingsGoalSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return SavingsGoal.objects.for_user(self.request.user).prefetch_related("contributions")
+        # Contribution stats are columns on the goal and the forecast is a stored
+        # row, so no history is loaded here.
+        return SavingsGoal.objects.for_user(self.request.user).select_related("forecast")
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -34,12 +48,11 @@ class SavingsGoalViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save()
 
-    @action(methods=["get"], detail=True)
+    @action(methods=["get"], detail=True, pagination_class=SavingsHistoryPagination)
     def contributions(self, request, pk: str | None = None):
         goal = self.get_object()
-        contributions = goal.contributions.filter(user=request.user)
-        serializer = SavingsContributionSerializer(contributions, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(goal.contributions.filter(user=request.user))
+        return self.get_paginated_response(SavingsContributionSerializer(page, many=True).data)
 
     @contributions.mapping.post
     def add_contribution(self, request, pk: str | None = None):
@@ -100,6 +113,12 @@ class SavingsGoalViewSet(viewsets.ModelViewSet):
 
         return Response(outcome_data, status=status_code)
 
+    @action(methods=["get"], detail=True, pagination_class=SavingsHistoryPagination)
+    def redemptions(self, request, pk: str | None = None):
+        goal = self.get_object()
+        page = self.paginate_queryset(goal.redemptions.filter(user=request.user))
+        return self.get_paginated_response(SavingsRedemptionSerializer(page, many=True).data)
+
     @action(methods=["post"], detail=True, url_path="collect")
     def collect(self, request, pk: str | None = None):
         goal = self.get_object()
@@ -145,3 +164,13 @@ class SavingsGoalViewSet(viewsets.ModelViewSet):
                 )
 
         return Response(outcome_data, status=status.HTTP_201_CREATED)
+
+
+class AutoSaveRuleViewSet(viewsets.ModelViewSet):
+    serializer_class = AutoSaveRuleSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        if self.request.user.is_anonymous:
+            return AutoSaveRule.objects.none()
+        return AutoSaveRule.objects.filter(user=self.request.user)
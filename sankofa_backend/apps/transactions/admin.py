@@ -19,7 +19,7 @@ class TransactionAdmin(admin.ModelAdmin):
     )
     list_filter = ("transaction_type", "status", "occurred_at")
     search_fields = ("user__phone_number", "description", "reference", "counterparty")
-    autocomplete_fields = ("user", "group", "savings_goal")
+    autocomplete_fields = ("user", "group", "group_cycle", "savings_goal")
     ordering = ("-occurred_at",)
     readonly_fields = ("balance_after", "platform_balance_after", "created_at", "updated_at")
 
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0007_group_payout_cycles'),
+        ('transactions', '0002_wallet_and_balances'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='group_cycle',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transactions', to='groups.groupcycle'),
+        ),
+    ]
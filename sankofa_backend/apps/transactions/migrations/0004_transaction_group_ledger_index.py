@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-19 04:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0008_group_cycle_totals'),
+        ('transactions', '0003_transaction_group_cycle'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['group', 'occurred_at', 'id'], name='transaction_group_i_c0f7e0_idx'),
+        ),
+    ]
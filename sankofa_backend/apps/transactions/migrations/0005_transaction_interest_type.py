@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0004_transaction_group_ledger_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.CharField(choices=[('deposit', 'Deposit'), ('withdrawal', 'Withdrawal'), ('contribution', 'Contribution'), ('payout', 'Payout'), ('savings', 'Savings'), ('interest', 'Interest')], max_length=32),
+        ),
+    ]
@@ -82,6 +82,7 @@ class Transaction(models.Model):
     TYPE_CONTRIBUTION = "contribution"
     TYPE_PAYOUT = "payout"
     TYPE_SAVINGS = "savings"
+    TYPE_INTEREST = "interest"
 
     STATUS_SUCCESS = "success"
     STATUS_PENDING = "pending"
@@ -93,6 +94,7 @@ class Transaction(models.Model):
         (TYPE_CONTRIBUTION, "Contribution"),
         (TYPE_PAYOUT, "Payout"),
         (TYPE_SAVINGS, "Savings"),
+        (TYPE_INTEREST, "Interest"),
     )
 
     STATUS_CHOICES = (
@@ -103,6 +105,7 @@ class Transaction(models.Model):
 
     INFLOW_TYPES: tuple[str, ...] = (TYPE_DEPOSIT, TYPE_PAYOUT)
     OUTFLOW_TYPES: tuple[str, ...] = (TYPE_WITHDRAWAL, TYPE_CONTRIBUTION, TYPE_SAVINGS)
+    # Interest is credited to a savings goal, so it moves neither wallet.
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
@@ -128,6 +131,13 @@ class Transaction(models.Model):
         null=True,
         blank=True,
     )
+    group_cycle = models.ForeignKey(
+        "groups.GroupCycle",
+        related_name="transactions",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
     savings_goal = models.ForeignKey(
         "savings.SavingsGoal",
         related_name="transactions",
@@ -146,6 +156,7 @@ class Transaction(models.Model):
             models.Index(fields=["user", "occurred_at"]),
             models.Index(fields=["user", "transaction_type"]),
             models.Index(fields=["user", "status"]),
+            models.Index(fields=["group", "occurred_at", "id"]),
         ]
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from django.core.exceptions import ValidationError
 from django.db import transaction as db_transaction
-from django.db.models import Count, Max, QuerySet, Sum
+from django.db.models import Case, Count, DecimalField, F, Max, Q, QuerySet, Sum, When
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
@@ -197,49 +197,76 @@ def apply_withdrawal(
     return transaction, user_wallet, platform_wallet
 
 
-@db_transaction.atomic
-def apply_savings_contribution(
+def _lock_savings_wallets(user) -> tuple[Wallet, Wallet]:
+    """Lock the member wallet, then the platform float, with one ordered ``SELECT ... FOR UPDATE``.
+
+    Member wallets are always locked before the platform float, matching the
+    group collection engine, so the two paths cannot deadlock.
+    """
+
+    wallets = Wallet.objects.select_for_update().filter(Q(user=user) | Q(is_platform=True)).order_by("is_platform")
+    locked = list(wallets)
+    if len(locked) < 2:
+        # First money movement for this member (or a fresh install): create the
+        # missing wallets, then lock both again.
+        Wallet.objects.ensure_for_user(user)
+        Wallet.objects.ensure_platform()
+        locked = list(wallets.all())
+    return locked[0], locked[1]
+
+
+def _post_savings_transfer(
     *,
     user,
     goal,
     amount,
-    channel: str = "",
-    reference: str = "",
-    description: str = "",
-    counterparty: str = "",
-    note: str = "",
+    to_savings: bool,
+    channel: str,
+    reference: str,
+    description: str,
+    counterparty: str,
+    note: str,
 ) -> tuple[Transaction, Wallet, Wallet]:
-    """Debit the member wallet for a savings contribution while crediting the platform float."""
-
     amount_dec = _normalise_amount(amount)
+    user_wallet, platform_wallet = _lock_savings_wallets(user)
 
-    user_wallet = Wallet.objects.ensure_for_user(user)
-    platform_wallet = Wallet.objects.ensure_platform()
-
-    user_wallet = Wallet.objects.select_for_update().get(pk=user_wallet.pk)
-    platform_wallet = Wallet.objects.select_for_update().get(pk=platform_wallet.pk)
-
-    if user_wallet.balance < amount_dec:
+    if to_savings and user_wallet.balance < amount_dec:
         raise ValidationError({"amount": "Insufficient wallet balance for savings contribution."})
+    if not to_savings and platform_wallet.balance < amount_dec:
+        raise ValidationError({"amount": "Insufficient platform balance to release savings."})
 
-    user_wallet.balance = user_wallet.balance - amount_dec
-    platform_wallet.balance = platform_wallet.balance + amount_dec
-
-    user_wallet.save(update_fields=["balance", "updated_at"])
-    platform_wallet.save(update_fields=["balance", "updated_at"])
+    # Both rows are locked, so the balances computed here are exactly what the
+    # single ``UPDATE`` below writes; nothing needs to be read back.
+    user_delta = -amount_dec if to_savings else amount_dec
+    platform_delta = amount_dec if to_savings else -amount_dec
+    now = timezone.now()
+    Wallet.objects.filter(pk__in=[user_wallet.pk, platform_wallet.pk]).update(
+        balance=Case(
+            When(pk=user_wallet.pk, then=F("balance") + user_delta),
+            default=F("balance") + platform_delta,
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        ),
+        updated_at=now,
+    )
+    user_wallet.balance += user_delta
+    platform_wallet.balance += platform_delta
+    user_wallet.updated_at = platform_wallet.updated_at = now
 
-    base_description = description or f"Savings contribution to {goal.title}"
+    if to_savings:
+        base_description = description or f"Savings contribution to {goal.title}"
+    else:
+        base_description = description or f"Savings payout from {goal.title}"
     if note:
         separator = " — " if base_description else ""
         base_description = f"{base_description}{separator}{note}" if base_description else note
 
     transaction = Transaction.objects.create(
         user=user,
-        transaction_type=Transaction.TYPE_SAVINGS,
+        transaction_type=Transaction.TYPE_SAVINGS if to_savings else Transaction.TYPE_PAYOUT,
         status=Transaction.STATUS_SUCCESS,
         amount=amount_dec,
-        description=base_description or "Savings contribution",
-        occurred_at=timezone.now(),
+        description=base_description or ("Savings contribution" if to_savings else "Savings payout"),
+        occurred_at=now,
         channel=channel,
         reference=reference,
         counterparty=counterparty or user.phone_number,
@@ -251,8 +278,7 @@ def apply_savings_contribution(
     return transaction, user_wallet, platform_wallet
 
 
-@db_transaction.atomic
-def apply_savings_payout(
+def apply_savings_contribution(
     *,
     user,
     goal,
@@ -263,43 +289,49 @@ def apply_savings_payout(
     counterparty: str = "",
     note: str = "",
 ) -> tuple[Transaction, Wallet, Wallet]:
-    """Release savings back to the member wallet while debiting the platform float."""
-
-    amount_dec = _normalise_amount(amount)
-
-    user_wallet = Wallet.objects.ensure_for_user(user)
-    platform_wallet = Wallet.objects.ensure_platform()
+    """Debit the member wallet for a savings contribution while crediting the platform float.
 
-    user_wallet = Wallet.objects.select_for_update().get(pk=user_wallet.pk)
-    platform_wallet = Wallet.objects.select_for_update().get(pk=platform_wallet.pk)
+    Call inside a transaction: both wallets are locked in one statement and
+    updated in one statement.
+    """
 
-    if platform_wallet.balance < amount_dec:
-        raise ValidationError({"amount": "Insufficient platform balance to release savings."})
+    return _post_savings_transfer(
+        user=user,
+        goal=goal,
+        amount=amount,
+        to_savings=True,
+        channel=channel,
+        reference=reference,
+        description=description,
+        counterparty=counterparty,
+        note=note,
+    )
 
-    user_wallet.balance = user_wallet.balance + amount_dec
-    platform_wallet.balance = platform_wallet.balance - amount_dec
 
-    user_wallet.save(update_fields=["balance", "updated_at"])
-    platform_wallet.save(update_fields=["balance", "updated_at"])
+def apply_savings_payout(
+    *,
+    user,
+    goal,
+    amount,
+    channel: str = "",
+    reference: str = "",
+    description: str = "",
+    counterparty: str = "",
+    note: str = "",
+) -> tuple[Transaction, Wallet, Wallet]:
+    """Release savings back to the member wallet while debiting the platform float.
 
-    base_description = description or f"Savings payout from {goal.title}"
-    if note:
-        separator = " — " if base_description else ""
-        base_description = f"{base_description}{separator}{note}" if base_description else note
+    Call inside a transaction, as for ``apply_savings_contribution``.
+    """
 
-    transaction = Transaction.objects.create(
+    return _post_savings_transfer(
         user=user,
-        transaction_type=Transaction.TYPE_PAYOUT,
-        status=Transaction.STATUS_SUCCESS,
-        amount=amount_dec,
-        description=base_description or "Savings payout",
-        occurred_at=timezone.now(),
+        goal=goal,
+        amount=amount,
+        to_savings=False,
         channel=channel,
         reference=reference,
-        counterparty=counterparty or user.phone_number,
-        balance_after=user_wallet.balance,
-        platform_balance_after=platform_wallet.balance,
-        savings_goal=goal,
+        description=description,
+        counterparty=counterparty,
+        note=note,
     )
-
-    return transaction, user_wallet, platform_wallet
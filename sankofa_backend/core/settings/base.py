@@ -123,6 +123,13 @@ else:
         }
     }
 
+# Merge bursty membership/savings broadcasts per group into one frame per window.
+# ``0`` delivers every event immediately.
+GROUP_ACTIVITY_COALESCE_WINDOW_MS = int(os.environ.get("GROUP_ACTIVITY_COALESCE_WINDOW_MS", 0))
+GROUP_ACTIVITY_MAX_PENDING_FRAMES = int(os.environ.get("GROUP_ACTIVITY_MAX_PENDING_FRAMES", 100))
+# One of "drop_oldest", "resync" or "disconnect".
+GROUP_ACTIVITY_SLOW_CONSUMER_POLICY = os.environ.get("GROUP_ACTIVITY_SLOW_CONSUMER_POLICY", "resync")
+
 _redis_credentials = f":{REDIS_PASSWORD}@" if REDIS_PASSWORD else ""
 _default_redis_url = f"redis://{_redis_credentials}{REDIS_HOST}:{REDIS_PORT}/0"
 
@@ -132,6 +139,60 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TIMEZONE = os.environ.get("DJANGO_TIME_ZONE", "UTC")
+CELERY_BEAT_SCHEDULE = {
+    "dispatch-invite-reminders": {
+        "task": "groups.dispatch_invite_reminders",
+        "schedule": float(os.environ.get("GROUP_REMINDER_DISPATCH_INTERVAL_SECONDS", 30)),
+    },
+    "process-due-payouts": {
+        "task": "groups.process_due_payouts",
+        "schedule": float(os.environ.get("GROUP_PAYOUT_SCHEDULER_INTERVAL_SECONDS", 300)),
+    },
+    "collect-cycle-contributions": {
+        "task": "groups.collect_cycle_contributions",
+        "schedule": float(os.environ.get("GROUP_PAYOUT_SCHEDULER_INTERVAL_SECONDS", 300)),
+    },
+    "refresh-discovery-snapshot": {
+        "task": "groups.refresh_discovery_snapshot",
+        "schedule": float(os.environ.get("GROUP_DISCOVERY_REFRESH_SECONDS", 60)),
+    },
+    "rollup-membership-events": {
+        "task": "groups.rollup_membership_events",
+        "schedule": float(os.environ.get("GROUP_MEMBERSHIP_ROLLUP_INTERVAL_SECONDS", 900)),
+    },
+    "run-auto-save-rules": {
+        "task": "savings.run_auto_save_rules",
+        "schedule": float(os.environ.get("SAVINGS_AUTOSAVE_INTERVAL_SECONDS", 300)),
+    },
+    "accrue-savings-interest": {
+        "task": "savings.accrue_interest",
+        "schedule": float(os.environ.get("SAVINGS_ACCRUAL_INTERVAL_SECONDS", 86400)),
+    },
+    "refresh-savings-forecasts": {
+        "task": "savings.refresh_forecasts",
+        "schedule": float(os.environ.get("SAVINGS_FORECAST_REFRESH_SECONDS", 900)),
+    },
+}
+
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE_BACKEND", "memory").lower()
+
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get(
+                "DJANGO_CACHE_URL",
+                f"redis://{_redis_credentials}{REDIS_HOST}:{REDIS_PORT}/2",
+            ),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "sankofa-default",
+        }
+    }
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -164,11 +225,16 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "sankofa_backend.apps.accounts.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_THROTTLE_RATES": {
+        # Contact matching reveals which numbers have accounts, so each user
+        # gets a small number of uploads (DRF rate syntax, e.g. "10/hour").
+        "group_contacts_match": os.environ.get("GROUP_CONTACT_MATCH_RATE", "10/hour"),
+    },
 }
 
 CORS_ALLOWED_ORIGINS = _csv_env("DJANGO_CORS_ALLOWED_ORIGINS")
@@ -193,6 +259,62 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": False,
 }
 
+# Authenticated users are resolved from a cached snapshot keyed by the token's
+# user id. Entries are invalidated on save, so this only bounds staleness for
+# writes that bypass model signals (e.g. ``QuerySet.update``).
+AUTH_USER_CACHE_TTL_SECONDS = int(os.environ.get("AUTH_USER_CACHE_TTL_SECONDS", 60))
+
+# Invite reminders are queued by the API and delivered in batches by Celery.
+GROUP_REMINDER_GATEWAY = os.environ.get(
+    "GROUP_REMINDER_GATEWAY", "sankofa_backend.apps.groups.reminders.FileReminderGateway"
+)
+GROUP_REMINDER_OUTBOX_PATH = os.environ.get("GROUP_REMINDER_OUTBOX_PATH", str(BASE_DIR / "sent_reminders"))
+GROUP_REMINDER_BATCH_SIZE = int(os.environ.get("GROUP_REMINDER_BATCH_SIZE", 200))
+GROUP_REMINDER_RATE_LIMIT = int(os.environ.get("GROUP_REMINDER_RATE_LIMIT", 3))
+GROUP_REMINDER_RATE_WINDOW_HOURS = int(os.environ.get("GROUP_REMINDER_RATE_WINDOW_HOURS", 24))
+
+# Groups claimed per transaction by the payout scheduler.
+GROUP_PAYOUT_BATCH_SIZE = int(os.environ.get("GROUP_PAYOUT_BATCH_SIZE", 500))
+# Open cycles collected per run; each cycle is collected in its own transaction.
+GROUP_COLLECTION_BATCH_SIZE = int(os.environ.get("GROUP_COLLECTION_BATCH_SIZE", 100))
+# Contributions settling later than this after a cycle's due date count as late.
+GROUP_CONTRIBUTION_GRACE_HOURS = int(os.environ.get("GROUP_CONTRIBUTION_GRACE_HOURS", 48))
+
+# Serialized group payloads are keyed by ``Group.version``, so entries never go
+# stale; the TTL only bounds cache memory.
+GROUP_PAYLOAD_CACHE_TTL_SECONDS = int(os.environ.get("GROUP_PAYLOAD_CACHE_TTL_SECONDS", 300))
+# Compliance matrices are keyed by ``Group.version`` in the same way.
+GROUP_COMPLIANCE_CACHE_TTL_SECONDS = int(os.environ.get("GROUP_COMPLIANCE_CACHE_TTL_SECONDS", 300))
+# Age after which the public-group discovery snapshot is rebuilt on read. Beat
+# refreshes it every GROUP_DISCOVERY_REFRESH_SECONDS, so reads rarely see it stale.
+GROUP_DISCOVERY_CACHE_TTL_SECONDS = int(os.environ.get("GROUP_DISCOVERY_CACHE_TTL_SECONDS", 300))
+
+# Largest contact book accepted by the contact matching endpoint in one request.
+GROUP_CONTACT_MATCH_LIMIT = int(os.environ.get("GROUP_CONTACT_MATCH_LIMIT", 10000))
+
+# Where per-cycle contribution leaderboards live: "redis" sorted sets, or
+# "memory" for a single process (tests and local development).
+GROUP_LEADERBOARD_BACKEND = os.environ.get("GROUP_LEADERBOARD_BACKEND", "memory").lower()
+GROUP_LEADERBOARD_URL = os.environ.get(
+    "GROUP_LEADERBOARD_URL",
+    f"redis://{_redis_credentials}{REDIS_HOST}:{REDIS_PORT}/4",
+)
+
+# Auto-save rules claimed per transaction by the savings scheduler.
+SAVINGS_AUTOSAVE_BATCH_SIZE = int(os.environ.get("SAVINGS_AUTOSAVE_BATCH_SIZE", 200))
+# Promotional annual interest on savings goals, in basis points; 0 disables accrual.
+# Goals with a contribution during the period earn the bonus on top.
+SAVINGS_INTEREST_RATE_BPS = int(os.environ.get("SAVINGS_INTEREST_RATE_BPS", 0))
+SAVINGS_ACTIVE_SAVER_BONUS_BPS = int(os.environ.get("SAVINGS_ACTIVE_SAVER_BONUS_BPS", 0))
+# Goals locked and accrued per transaction, and processes accruing ranges in parallel.
+SAVINGS_ACCRUAL_BATCH_SIZE = int(os.environ.get("SAVINGS_ACCRUAL_BATCH_SIZE", 2000))
+SAVINGS_ACCRUAL_WORKERS = int(os.environ.get("SAVINGS_ACCRUAL_WORKERS", 1))
+# Goal forecasts fit this many weeks of contributions. A forecast is recomputed
+# when its goal changes, or once it is older than the max age.
+SAVINGS_FORECAST_LOOKBACK_WEEKS = int(os.environ.get("SAVINGS_FORECAST_LOOKBACK_WEEKS", 26))
+SAVINGS_FORECAST_MAX_AGE_HOURS = int(os.environ.get("SAVINGS_FORECAST_MAX_AGE_HOURS", 24))
+SAVINGS_FORECAST_BATCH_SIZE = int(os.environ.get("SAVINGS_FORECAST_BATCH_SIZE", 5000))
+
 AUTH_TEST_PHONE_OTPS = {
     "login": {
         "+233241234567": "112233",
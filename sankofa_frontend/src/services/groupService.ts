@@ -10,7 +10,8 @@ class GroupService {
   private cachedGroups: SusuGroup[] | null = null;
 
   /**
-   * Get all groups for the current user
+   * Get all groups for the current user.
+   * The list endpoint is compact: counters only, no member or invite rows.
    */
   async getGroups(forceRefresh: boolean = false): Promise<SusuGroup[]> {
     if (!forceRefresh && this.cachedGroups) {
@@ -34,17 +35,10 @@ class GroupService {
   }
 
   /**
-   * Get a single group by ID
+   * Get a single group by ID.
+   * Cached list entries are compact, so the detail endpoint is always asked first.
    */
   async getGroupById(id: string): Promise<SusuGroup | null> {
-    // Check cache first
-    if (this.cachedGroups) {
-      const cached = this.cachedGroups.find((g) => g.id === id);
-      if (cached) {
-        return cached;
-      }
-    }
-
     try {
       const response = await apiClient.get<SusuGroup>(`/api/groups/${id}/`);
       if (response) {
@@ -52,10 +46,10 @@ class GroupService {
         return response;
       }
     } catch {
-      // Return null on error
+      // Fall back to the cached list entry on error
     }
 
-    return null;
+    return this.cachedGroups?.find((g) => g.id === id) ?? null;
   }
 
   /**